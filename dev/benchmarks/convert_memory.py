@@ -0,0 +1,104 @@
+"""Peak memory of PDF/XLSX -> Markdown conversion as the input grows.
+
+Usage:
+    python dev/benchmarks/convert_memory.py [--scale N]
+
+Builds PDFs and workbooks of increasing size in a temp dir, then converts each
+in a fresh process, once streaming chunks to the output file (what
+convert_document does) and once joining the whole Markdown into one string
+before writing it. Reports peak RSS of each child; the streamed column should
+stay flat while the joined column grows with the input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from dogent.features import document_io
+
+_LINE = "Streaming conversion keeps memory flat regardless of the input size. "
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    import fitz
+
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (36, 36, -36, -36), f"Page {number}\n" + _LINE * 40)
+    doc.save(str(path), garbage=1, deflate=True)
+    doc.close()
+
+
+def _make_xlsx(path: Path, rows: int) -> None:
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    sheet.append(["id", "name", "note"])
+    for row in range(rows):
+        sheet.append([row, f"name-{row}", _LINE])
+    workbook.save(path)
+
+
+def _child(mode: str, source: Path, target: Path) -> None:
+    settings = document_io.DocumentSettings(pdf_workers=1)
+    if source.suffix == ".pdf":
+        chunks = document_io._iter_pdf_markdown(source, settings)
+    else:
+        chunks = document_io._iter_xlsx_markdown(source)
+    if mode == "streamed":
+        document_io._write_text_chunks(target, chunks)
+    else:
+        target.write_text("".join(chunks), encoding="utf-8")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    print(peak * 1024 if sys.platform != "darwin" else peak)
+
+
+def _peak_mb(mode: str, source: Path, target: Path) -> float:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(source), str(target)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return int(output.strip().splitlines()[-1]) / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="multiply input sizes")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "SOURCE", "TARGET"))
+    args = parser.parse_args()
+    if args.child:
+        mode, source, target = args.child
+        _child(mode, Path(source), Path(target))
+        return 0
+
+    cases = [("pdf", pages * args.scale, _make_pdf) for pages in (250, 500, 1000)]
+    cases += [("xlsx", rows * args.scale, _make_xlsx) for rows in (50_000, 100_000, 200_000)]
+    print(f"{'input':18} {'size MB':>8} {'streamed MB':>12} {'joined MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for suffix, size, make in cases:
+            source = root / f"input-{size}.{suffix}"
+            make(source, size)
+            streamed = _peak_mb("streamed", source, root / "streamed.md")
+            joined = _peak_mb("joined", source, root / "joined.md")
+            unit = "pages" if suffix == "pdf" else "rows"
+            print(
+                f"{suffix} {size:>7} {unit:7} {source.stat().st_size / 1e6:>8.1f}"
+                f" {streamed:>12.1f} {joined:>10.1f}"
+            )
+            source.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
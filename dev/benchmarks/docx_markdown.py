@@ -0,0 +1,103 @@
+"""Benchmark the native DOCX reader against pandoc.
+
+Usage:
+    python dev/benchmarks/docx_markdown.py DIR_OR_FILE [...] [--repeat N]
+
+Every .docx found is converted with both readers; the table lists the best
+time of N runs per reader and flags files the native reader hands back to
+pandoc. Pandoc timings are skipped when pandoc is not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from dogent.features.docx_markdown import DocxUnsupported, docx_to_markdown
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _pandoc_converter():
+    try:
+        import pypandoc
+
+        pypandoc.get_pandoc_version()
+    except Exception:  # noqa: BLE001
+        return None
+
+    def convert(path: Path) -> str:
+        return pypandoc.convert_file(
+            str(path), to="markdown", format="docx", extra_args=["--track-changes=all"]
+        )
+
+    return convert
+
+
+def _collect(paths: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.docx")))
+        elif path.suffix.lower() == ".docx":
+            files.append(path)
+    return [path for path in files if not path.name.startswith("~$")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = _collect(args.paths)
+    if not files:
+        print("No .docx files found.")
+        return 1
+    pandoc = _pandoc_converter()
+    if pandoc is None:
+        print("pandoc not available; reporting native timings only.")
+
+    native_total = 0.0
+    pandoc_total = 0.0
+    fallbacks = 0
+    print(f"{'file':40} {'native ms':>10} {'pandoc ms':>10} {'speedup':>8}")
+    for path in files:
+        try:
+            native = _best_of(args.repeat, lambda: docx_to_markdown(path))
+        except DocxUnsupported as exc:
+            fallbacks += 1
+            print(f"{path.name[:40]:40} {'fallback':>10}  ({exc})")
+            continue
+        pandoc_time = _best_of(args.repeat, lambda: pandoc(path)) if pandoc else None
+        native_total += native
+        speedup = ""
+        pandoc_cell = "-"
+        if pandoc_time is not None:
+            pandoc_total += pandoc_time
+            pandoc_cell = f"{pandoc_time * 1000:.1f}"
+            speedup = f"{pandoc_time / native:.1f}x" if native else ""
+        print(f"{path.name[:40]:40} {native * 1000:>10.1f} {pandoc_cell:>10} {speedup:>8}")
+
+    print()
+    print(f"files: {len(files)}, native: {len(files) - fallbacks}, fallback: {fallbacks}")
+    print(f"native total: {native_total * 1000:.1f} ms")
+    if pandoc and native_total:
+        print(
+            f"pandoc total: {pandoc_total * 1000:.1f} ms "
+            f"({pandoc_total / native_total:.1f}x slower)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Compare per-conversion latency of subprocess pandoc and the pandoc server.
+
+Usage:
+    python dev/benchmarks/pandoc_backend.py [--docs N] [--repeat N]
+
+Generates N small Markdown chapters in a temp workspace, then times
+Markdown -> DOCX export and DOCX -> Markdown reads through both backends.
+Needs pandoc 3.x on PATH; the server column is skipped when `pandoc server`
+cannot start.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from dogent.features import document_io
+from dogent.features.document_io import DocumentSettings
+from dogent.features.pandoc_backend import PandocServerError, pandoc_server
+
+_CHAPTER = """# Chapter {n}
+
+Some *emphasis*, a [link](https://example.com) and a table:
+
+| key | value |
+| --- | ----- |
+| a   | {n}   |
+
+```python
+def chapter_{n}():
+    return {n}
+```
+"""
+
+
+def _time_each(func, items, repeat: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        for item in items:
+            started = time.perf_counter()
+            func(item)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _run(backend: str, root: Path, sources: list[Path], repeat: int) -> dict[str, list[float]]:
+    settings = DocumentSettings(pandoc_backend=backend, image_dpi=0)
+    out_dir = root / backend
+    out_dir.mkdir()
+
+    def export(md_path: Path) -> None:
+        document_io._markdown_to_docx(
+            md_path,
+            output_path=out_dir / f"{md_path.stem}.docx",
+            workspace_root=root,
+            settings=settings,
+        )
+
+    def read(md_path: Path) -> None:
+        document_io._pandoc_docx_to_markdown(out_dir / f"{md_path.stem}.docx", settings)
+
+    export(sources[0])  # warm-up: starts the server in server mode
+    return {
+        "md -> docx": _time_each(export, sources, repeat),
+        "docx -> md": _time_each(read, sources, repeat),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        sources = []
+        for n in range(args.docs):
+            path = root / f"chapter-{n:02}.md"
+            path.write_text(_CHAPTER.format(n=n), encoding="utf-8")
+            sources.append(path)
+
+        results = {"subprocess": _run("subprocess", root, sources, args.repeat)}
+        server = pandoc_server()
+        try:
+            if server is not None:
+                server.convert("x", from_format="markdown", to="html")
+        except PandocServerError:
+            server = None
+        if server is not None:
+            results["server"] = _run("server", root, sources, args.repeat)
+            server.close()
+        else:
+            print("pandoc server unavailable; reporting subprocess timings only.")
+
+    print(f"{'backend':12} {'conversion':12} {'median ms':>10} {'mean ms':>10}")
+    for backend, timings in results.items():
+        for name, samples in timings.items():
+            print(
+                f"{backend:12} {name:12} {statistics.median(samples) * 1000:>10.1f}"
+                f" {statistics.mean(samples) * 1000:>10.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -32,6 +32,11 @@ from ..prompts import PromptBuilder
 from ..core.history import HistoryManager
 from ..core.todo import TodoManager
 from .wait import LLMWaitIndicator
+from ..features.conversion_jobs import (
+    ConversionProgress,
+    cancel_conversion_jobs,
+    set_conversion_progress_listener,
+)
 from ..features.document_tools import DOGENT_DOC_TOOL_DISPLAY_NAMES
 from ..features.vision_tools import DOGENT_VISION_TOOL_DISPLAY_NAMES
 from ..features.image_tools import DOGENT_IMAGE_TOOL_DISPLAY_NAMES
@@ -256,6 +261,7 @@ class AgentRunner:
             todos=self.todo_manager.export_items(),
         )
 
+        set_conversion_progress_listener(self._show_conversion_progress)
         try:
             await self._start_wait_indicator()
             async with self._lock:
@@ -315,6 +321,7 @@ class AgentRunner:
                 )
             await self._safe_disconnect()
         finally:
+            set_conversion_progress_listener(None)
             await self._stop_wait_indicator()
             self._task_temp_files.clear()
             if self._session_logger:
@@ -363,6 +370,7 @@ class AgentRunner:
             self._finalize_aborted()
 
     async def interrupt(self, reason: str) -> None:
+        cancel_conversion_jobs()
         async with self._lock:
             self._interrupted = True
             if self._dependency_installing:
@@ -773,6 +781,12 @@ class AgentRunner:
             await self._client.disconnect()
         self._client = None
 
+    def _show_conversion_progress(self, progress: ConversionProgress) -> None:
+        if self._wait_indicator is not None:
+            self._wait_indicator.set_label(None if progress.finished else progress.describe())
+        elif not progress.finished:
+            self.console.print(f"[dim]{progress.describe()}[/dim]")
+
     async def _start_wait_indicator(self) -> None:
         if self._wait_indicator is not None:
             return
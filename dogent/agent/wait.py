@@ -11,6 +11,7 @@ class LLMWaitIndicator:
     def __init__(self, console: Console, label: str = "Waiting for LLM response") -> None:
         self.console = console
         self.label = label
+        self.default_label = label
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task | None = None
         self._running = False
@@ -32,6 +33,10 @@ class LLMWaitIndicator:
         self._task = None
         self._running = False
 
+    def set_label(self, label: str | None) -> None:
+        """Show label on the next refresh; None restores the default."""
+        self.label = label or self.default_label
+
     def _format_status(self, elapsed: float) -> str:
         return f"{self.label} ({elapsed:.1f}s)"
 
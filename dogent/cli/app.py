@@ -22,9 +22,11 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
 from ..agent import AgentRunner, RunOutcome, PermissionDecision, DependencyDecision
+from ..features.browser_pool import close_chromium_pool
 from ..features.clarification import (
     ClarificationPayload,
     ClarificationQuestion,
@@ -35,6 +37,10 @@ from .claude_commands import ClaudeCommandSpec, load_claude_commands, load_plugi
 from .commands import CommandRegistry
 from ..config import ConfigManager
 from ..features.doc_templates import DocumentTemplateManager
+from ..features.document_io import ExportJob, ExportJobResult, load_document_settings
+from ..features.export_watch import ExportWatcher
+from ..features.http_client import close_http_client
+from ..features.pdf_pool import close_pdf_process_pool
 from ..core.file_refs import FileAttachment, FileReferenceResolver
 from ..core.history import HistoryManager
 from .wizard import InitWizard
@@ -117,9 +123,11 @@ from .input import (
     Window,
     button_dialog,
     get_app,
+    get_app_or_none,
     get_cwidth,
     input_dialog,
     merge_key_bindings,
+    run_in_terminal,
     style_from_pygments_cls,
     yes_no_dialog,
     DogentCompleter,
@@ -245,6 +253,8 @@ class DogentCLI:
         self._register_claude_commands()
         self.session: PromptSession | None = None
         self._shutting_down = False
+        self._export_watcher: ExportWatcher | None = None
+        self._export_watch_task: asyncio.Task[None] | None = None
         self._pending_editor_submission: EditorOutcome | None = None
         if PromptSession is not None:
             bindings = KeyBindings()
@@ -375,13 +385,18 @@ class DogentCLI:
         self._register_builtin_command(
             "/clean",
             self._cmd_clean,
-            "Clean workspace state: /clean [history|lesson|memory|all].",
+            "Clean workspace state: /clean [history|lesson|memory|cache|all].",
         )
         self._register_builtin_command(
             "/archive",
             self._cmd_archive,
             "Archive workspace records: /archive [history|lessons|all].",
         )
+        self._register_builtin_command(
+            "/watch",
+            self._cmd_watch,
+            "Re-export Markdown on save: /watch <file.md> [pdf|docx], /watch stop [file].",
+        )
         self._register_builtin_command(
             "/exit",
             self._cmd_exit,
@@ -3980,14 +3995,14 @@ class DogentCLI:
         if target == "lessons":
             target = "lesson"
 
-        valid = {"history", "lesson", "memory", "all"}
+        valid = {"history", "lesson", "memory", "cache", "all"}
         if target not in valid:
             self.console.print(
                 Panel(
                     "\n".join(
                         [
                             f"Unknown clean target: {target}",
-                            "Valid targets: history, lesson, memory, all",
+                            "Valid targets: history, lesson, memory, cache, all",
                             "Example: /clean history",
                         ]
                     ),
@@ -4015,6 +4030,12 @@ class DogentCLI:
             if not self.paths.lessons_file.exists():
                 cleared.append(str(self.paths.lessons_file.relative_to(self.root)))
 
+        if target in {"cache", "all"} and self.paths.cache_dir.exists():
+            with suppress(Exception):
+                shutil.rmtree(self.paths.cache_dir)
+            if not self.paths.cache_dir.exists():
+                cleared.append(str(self.paths.cache_dir.relative_to(self.root)))
+
         # Always reset in-session todos for a clean interaction state.
         self.todo_manager.set_items([])
 
@@ -4119,6 +4140,143 @@ class DogentCLI:
                 return True
         return False
 
+    async def _cmd_watch(self, command: str) -> bool:
+        args = command.split()[1:]
+        if not args:
+            self._show_watch_status()
+            return True
+        if args[0].lower() == "stop":
+            target = self._resolve_watch_path(args[1]) if len(args) > 1 else None
+            stopped = self._stop_export_watch(target)
+            body = (
+                "Stopped watching:\n" + "\n".join(self._watch_label(job) for job in stopped)
+                if stopped
+                else "Nothing to stop."
+            )
+            self.console.print(
+                Panel(body, title="👀 Watch", border_style="green" if stopped else "yellow")
+            )
+            return True
+
+        md_path = self._resolve_watch_path(args[0])
+        formats = [arg.lower() for arg in args[1:]] or ["pdf"]
+        problems = []
+        if not md_path.is_file() or md_path.suffix.lower() != ".md":
+            problems.append(f"Not a Markdown file: {args[0]}")
+        problems.extend(
+            f"Unsupported format: {fmt}" for fmt in formats if fmt not in {"pdf", "docx"}
+        )
+        if problems:
+            self.console.print(
+                Panel(
+                    "\n".join(
+                        [
+                            *problems,
+                            "Usage: /watch <file.md> [pdf|docx]",
+                            "Example: /watch docs/report.md pdf docx",
+                        ]
+                    ),
+                    title="👀 Watch",
+                    border_style="red",
+                )
+            )
+            return True
+
+        watcher = self._ensure_export_watcher()
+        for fmt in dict.fromkeys(formats):
+            watcher.add(ExportJob(md_path, md_path.with_suffix(f".{fmt}"), fmt))
+        self._show_watch_status()
+        return True
+
+    def _resolve_watch_path(self, raw: str) -> Path:
+        path = Path(raw).expanduser()
+        return (path if path.is_absolute() else self.root / path).resolve()
+
+    def _ensure_export_watcher(self) -> ExportWatcher:
+        if self._export_watcher is None:
+            self._export_watcher = ExportWatcher(
+                workspace_root=self.root,
+                settings=load_document_settings(self.config_manager.load_project_config()),
+                on_results=self._show_watch_results,
+            )
+        if self._export_watch_task is None or self._export_watch_task.done():
+            self._export_watch_task = asyncio.create_task(self._export_watcher.run())
+            self._export_watch_task.add_done_callback(self._on_export_watch_done)
+        return self._export_watcher
+
+    def _stop_export_watch(self, md_path: Path | None = None) -> list[ExportJob]:
+        watcher = self._export_watcher
+        if watcher is None:
+            return []
+        paths = [md_path] if md_path else list(dict.fromkeys(j.md_path for j in watcher.jobs))
+        stopped = [job for path in paths for job in watcher.remove(path)]
+        if not watcher.jobs:
+            if self._export_watch_task is not None:
+                self._export_watch_task.cancel()
+            self._export_watcher = None
+            self._export_watch_task = None
+        return stopped
+
+    def _on_export_watch_done(self, task: asyncio.Task[None]) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            return
+        log_exception("cli", exc)
+        if task is self._export_watch_task:
+            self._export_watcher = None
+            self._export_watch_task = None
+        self._print_above_prompt(
+            [Text(f"Watch stopped after an error: {exc}", style="red")]
+        )
+
+    def _watch_label(self, job: ExportJob) -> str:
+        def rel(path: Path) -> str:
+            try:
+                return str(path.relative_to(self.root))
+            except ValueError:
+                return str(path)
+
+        return f"{rel(job.md_path)} -> {rel(job.output_path)}"
+
+    def _show_watch_status(self) -> None:
+        jobs = self._export_watcher.jobs if self._export_watcher else []
+        if not jobs:
+            body = "No active watches.\nUsage: /watch <file.md> [pdf|docx]"
+        else:
+            body = "\n".join(
+                [
+                    "Watching (re-exports on save; /watch stop to end):",
+                    *(f"- {self._watch_label(job)}" for job in jobs),
+                ]
+            )
+        self.console.print(Panel(body, title="👀 Watch", border_style="cyan"))
+
+    def _show_watch_results(self, results: list[ExportJobResult]) -> None:
+        lines: list[Text] = []
+        for result in results:
+            label = self._watch_label(result.job)
+            if result.error:
+                lines.append(Text(f"Watch export failed: {label}: {result.error}", style="red"))
+            elif not result.skipped:
+                lines.append(Text(f"Re-exported {label} ({result.seconds:.1f}s)", style="dim"))
+                lines.extend(Text(f"  {warning}", style="dim") for warning in result.warnings)
+        if lines:
+            self._print_above_prompt(lines)
+
+    def _print_above_prompt(self, lines: list[Text]) -> None:
+        def emit() -> None:
+            for line in lines:
+                self.console.print(line)
+
+        app = get_app_or_none() if get_app_or_none is not None else None
+        if app is not None and app.is_running and run_in_terminal is not None:
+            # Print above the prompt instead of through the line being edited.
+            run_in_terminal(emit)
+        else:
+            emit()
+
     async def _cmd_exit(self, _: str) -> bool:
         await self._graceful_exit()
         return False
@@ -4277,12 +4435,16 @@ class DogentCLI:
             self._auto_permission_prompt if auto else self._deny_permission_prompt
         )
         self.agent.set_permission_prompt(permission_prompt)
-        outcome = await self._run_noninteractive(
-            message,
-            attachments,
-            config_override=self._build_prompt_override(template_override),
-            auto=auto,
-        )
+        try:
+            outcome = await self._run_noninteractive(
+                message,
+                attachments,
+                config_override=self._build_prompt_override(template_override),
+                auto=auto,
+            )
+        finally:
+            with suppress(Exception):
+                await close_chromium_pool()
         code = self._exit_code_for_outcome(outcome)
         if code == 0:
             self.console.print("Completed.")
@@ -4966,6 +5128,14 @@ class DogentCLI:
             return
         with suppress(Exception):
             await self.agent.reset()
+        with suppress(Exception):
+            self._stop_export_watch()
+        with suppress(Exception):
+            await close_chromium_pool()
+        with suppress(Exception):
+            await close_http_client()
+        with suppress(Exception):
+            close_pdf_process_pool()
         with suppress(Exception):
             self.session_logger.close()
         set_active_logger(None)
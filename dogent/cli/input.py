@@ -11,7 +11,8 @@ from typing import Callable, Iterable
 try:
     from prompt_toolkit import PromptSession
     from prompt_toolkit.application import Application
-    from prompt_toolkit.application.current import get_app
+    from prompt_toolkit.application.current import get_app, get_app_or_none
+    from prompt_toolkit.application.run_in_terminal import run_in_terminal
     from prompt_toolkit.buffer import Buffer
     from prompt_toolkit.clipboard import Clipboard, ClipboardData, InMemoryClipboard
     try:
@@ -67,6 +68,8 @@ except ImportError:  # pragma: no cover - optional dependency
     PromptSession = None  # type: ignore
     Application = None  # type: ignore
     get_app = None  # type: ignore
+    get_app_or_none = None  # type: ignore
+    run_in_terminal = None  # type: ignore
     Buffer = None  # type: ignore
     Clipboard = None  # type: ignore
     ClipboardData = None  # type: ignore
@@ -386,11 +389,13 @@ class DogentCompleter(Completer):
         if command == "/learn":
             options = ["on", "off"]
         elif command == "/clean":
-            options = ["history", "lesson", "memory", "all"]
+            options = ["history", "lesson", "memory", "cache", "all"]
         elif command == "/show":
             options = ["history", "lessons"]
         elif command == "/archive":
             options = ["history", "lessons", "all"]
+        elif command == "/watch":
+            options = ["stop"]
         elif command == "/profile":
             options = ["llm", "web", "vision", "image", "show"]
         elif command == "/debug":
@@ -634,7 +634,7 @@ class ConfigManager:
             allowed_tools = [t for t in allowed_tools if t]
             allowed_tools.extend(DOGENT_DOC_ALLOWED_TOOLS)
             allowed_tools.extend(DOGENT_UI_ALLOWED_TOOLS)
-        doc_tools = create_dogent_doc_tools(self.paths.root)
+        doc_tools = create_dogent_doc_tools(self.paths.root, self)
         tools = list(doc_tools)
         tools.extend(create_dogent_ui_tools())
         if vision_enabled:
@@ -40,6 +40,26 @@ class DogentPaths:
     def archives_dir(self) -> Path:
         return self.dogent_dir / "archives"
 
+    @property
+    def cache_dir(self) -> Path:
+        return self.dogent_dir / "cache"
+
+    @property
+    def document_cache_dir(self) -> Path:
+        return self.cache_dir / "documents"
+
+    @property
+    def export_cache_dir(self) -> Path:
+        return self.cache_dir / "exports"
+
+    @property
+    def image_cache_dir(self) -> Path:
+        return self.cache_dir / "images"
+
+    @property
+    def artifact_cache_dir(self) -> Path:
+        return self.cache_dir / "artifacts"
+
     @property
     def global_dir(self) -> Path:
         return Path.home() / ".dogent"
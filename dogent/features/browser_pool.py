@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from ..core.session_log import log_exception
+
+DEFAULT_BROWSER_MAX_PAGES = 4
+DEFAULT_BROWSER_IDLE_TIMEOUT_S = 120.0
+
+T = TypeVar("T")
+
+
+class ChromiumPool:
+    """Process-lifetime Chromium shared by PDF exports.
+
+    The browser is launched on first use and idle pages are reused between
+    renders. It is closed after idle_timeout_s without work, and relaunched on
+    the next request if it crashed or disconnected. Playwright objects belong
+    to the event loop that created them, so a pool used from a new loop starts
+    over rather than touching the old browser.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_pages: int = DEFAULT_BROWSER_MAX_PAGES,
+        idle_timeout_s: float = DEFAULT_BROWSER_IDLE_TIMEOUT_S,
+    ) -> None:
+        self.max_pages = max(1, max_pages)
+        self.idle_timeout_s = idle_timeout_s
+        self.launches = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._playwright: Any | None = None
+        self._browser: Any | None = None
+        self._idle_pages: list[Any] = []
+        self._in_use = 0
+        self._idle_timer: asyncio.TimerHandle | None = None
+
+    async def run(self, render: Callable[[Any], Awaitable[T]]) -> T:
+        """Run render(page) on a pooled page, retrying once if the browser died."""
+        for attempt in range(2):
+            try:
+                async with self.page() as page:
+                    return await render(page)
+            except Exception:
+                if attempt == 0 and not self._browser_alive():
+                    continue
+                raise
+        raise AssertionError("unreachable")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        self._bind_loop()
+        assert self._slots is not None
+        async with self._slots:
+            page = await self._acquire()
+            reusable = False
+            try:
+                yield page
+                reusable = True
+            finally:
+                await self._release(page, reusable=reusable)
+
+    async def close(self) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            self._forget()
+            return
+        assert self._lock is not None
+        async with self._lock:
+            await self._shutdown()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._forget()
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_pages)
+
+    async def _acquire(self) -> Any:
+        self._cancel_idle_timer()
+        self._in_use += 1
+        try:
+            assert self._lock is not None
+            async with self._lock:
+                browser = await self._ensure_browser()
+                while self._idle_pages:
+                    page = self._idle_pages.pop()
+                    if not page.is_closed():
+                        return page
+                return await browser.new_page()
+        except BaseException:
+            self._in_use -= 1
+            self._schedule_idle_close()
+            raise
+
+    async def _release(self, page: Any, *, reusable: bool) -> None:
+        self._in_use -= 1
+        if (
+            reusable
+            and self._browser_alive()
+            and not page.is_closed()
+            and len(self._idle_pages) < self.max_pages
+        ):
+            self._idle_pages.append(page)
+        else:
+            await _close_quietly(page.context)
+        self._schedule_idle_close()
+
+    async def _ensure_browser(self) -> Any:
+        if self._browser_alive():
+            return self._browser
+        await self._shutdown()
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch()
+        except BaseException:
+            await self._shutdown()
+            raise
+        self.launches += 1
+        return self._browser
+
+    def _browser_alive(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _shutdown(self) -> None:
+        self._cancel_idle_timer()
+        pages, self._idle_pages = self._idle_pages, []
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        for page in pages:
+            await _close_quietly(page.context)
+        if browser is not None:
+            await _close_quietly(browser)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as exc:  # noqa: BLE001
+                log_exception("browser_pool", exc)
+
+    def _forget(self) -> None:
+        # Objects from a closed loop cannot be awaited; the Playwright driver
+        # exits with its loop and takes the browser with it.
+        self._cancel_idle_timer()
+        self._idle_pages = []
+        self._browser = None
+        self._playwright = None
+        self._in_use = 0
+        self._loop = None
+
+    def _schedule_idle_close(self) -> None:
+        if self._in_use or self._loop is None or self._browser is None:
+            return
+        self._cancel_idle_timer()
+        self._idle_timer = self._loop.call_later(
+            self.idle_timeout_s, lambda: asyncio.ensure_future(self._close_if_idle())
+        )
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    async def _close_if_idle(self) -> None:
+        assert self._lock is not None
+        async with self._lock:
+            if self._in_use == 0:
+                await self._shutdown()
+
+
+async def _close_quietly(target: Any) -> None:
+    try:
+        await target.close()
+    except Exception as exc:  # noqa: BLE001
+        log_exception("browser_pool", exc)
+
+
+_POOL: ChromiumPool | None = None
+
+
+def chromium_pool() -> ChromiumPool:
+    global _POOL
+    if _POOL is None:
+        _POOL = ChromiumPool()
+    return _POOL
+
+
+async def close_chromium_pool() -> None:
+    if _POOL is not None:
+        await _POOL.close()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from ..core.session_log import log_exception
+from .pdf_pool import close_pdf_process_pool
+
+DEFAULT_CONVERT_WORKERS = 2
+
+T = TypeVar("T")
+
+
+class ConversionCancelled(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ConversionProgress:
+    job: str
+    stage: str
+    step: int
+    total: int
+    finished: bool = False
+
+    def describe(self) -> str:
+        if self.finished:
+            return f"Converted {self.job}"
+        return f"Converting {self.job}: {self.stage} ({self.step}/{self.total})"
+
+
+ProgressListener = Callable[[ConversionProgress], None]
+
+
+class ConversionJob:
+    """One conversion made of blocking stages run off the event loop.
+
+    Outputs are written to staging paths from staged_output() and only moved
+    into place when every stage succeeded, so a cancelled or failed job never
+    leaves a half-written file behind.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, label: str, total: int) -> None:
+        self.label = label
+        self.total = max(1, total)
+        self.step = 0
+        self._executor = executor
+        self._loop = asyncio.get_running_loop()
+        self._current: asyncio.Future[Any] | None = None
+        self._cancelled = False
+        self._threads: list[Future[Any]] = []
+        self._staged: list[tuple[Path, Path]] = []
+
+    async def run(self, stage: str, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking stage on the conversion worker pool."""
+        self._begin(stage)
+        future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        self._threads.append(future)
+        return await self._wait(asyncio.wrap_future(future))
+
+    async def wait(self, stage: str, start: Callable[[], Awaitable[T]]) -> T:
+        """Run a stage that is already asynchronous, e.g. a browser render.
+
+        start is only called once the stage begins, so a cancelled job never
+        creates a coroutine it would leave un-awaited.
+        """
+        self._begin(stage)
+        return await self._wait(asyncio.ensure_future(start()))
+
+    def staged_output(self, path: Path) -> Path:
+        staged = path.with_name(f".{path.stem}.{uuid.uuid4().hex[:8]}.part{path.suffix}")
+        self._staged.append((staged, path))
+        return staged
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        self._loop.call_soon_threadsafe(self._cancel_current)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def _cancel_current(self) -> None:
+        if self._current is not None:
+            self._current.cancel()
+
+    def _begin(self, stage: str) -> None:
+        if self._cancelled:
+            raise ConversionCancelled(f"Conversion cancelled: {self.label}")
+        self.step += 1
+        _emit(ConversionProgress(self.label, stage, min(self.step, self.total), self.total))
+
+    async def _wait(self, future: asyncio.Future[T]) -> T:
+        self._current = future
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if self._cancelled:
+                raise ConversionCancelled(f"Conversion cancelled: {self.label}") from None
+            raise
+        finally:
+            self._current = None
+
+    def _commit(self) -> None:
+        for staged, target in self._staged:
+            if staged.exists():
+                staged.replace(target)
+
+    def _discard(self) -> None:
+        # A cancelled stage keeps running in its thread; tidy up once it stops.
+        pending = [future for future in self._threads if not future.done()]
+        if not pending:
+            self._remove_staged()
+            return
+
+        def cleanup(_: Future[Any]) -> None:
+            if all(future.done() for future in pending):
+                self._remove_staged()
+
+        for future in pending:
+            future.add_done_callback(cleanup)
+
+    def _remove_staged(self) -> None:
+        for staged, _ in self._staged:
+            try:
+                staged.unlink(missing_ok=True)
+            except OSError as exc:
+                log_exception("conversion_jobs", exc)
+
+
+class ConversionScheduler:
+    """Thread pool that bounds how many blocking conversion stages run at once."""
+
+    def __init__(self, max_workers: int = DEFAULT_CONVERT_WORKERS) -> None:
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dogent-convert"
+        )
+        self._lock = threading.Lock()
+        self._running = 0
+        self._closing = False
+
+    @asynccontextmanager
+    async def job(self, label: str, *, stages: int) -> AsyncIterator[ConversionJob]:
+        job = ConversionJob(self._executor, label, stages)
+        with self._lock:
+            self._running += 1
+        with _JOBS_LOCK:
+            _ACTIVE_JOBS.add(job)
+        try:
+            yield job
+            job._commit()
+        except BaseException:
+            job._discard()
+            raise
+        finally:
+            with _JOBS_LOCK:
+                _ACTIVE_JOBS.discard(job)
+            self._finish_job()
+            _emit(ConversionProgress(label, "", job.total, job.total, finished=True))
+
+    def shutdown(self) -> None:
+        """Close the pool once the jobs already running have finished all stages."""
+        with self._lock:
+            self._closing = True
+            idle = self._running == 0
+        if idle:
+            self._executor.shutdown(wait=False)
+
+    def _finish_job(self) -> None:
+        with self._lock:
+            self._running -= 1
+            close = self._closing and self._running == 0
+        if close:
+            self._executor.shutdown(wait=False)
+
+
+_SCHEDULER: ConversionScheduler | None = None
+_SCHEDULER_LOCK = threading.Lock()
+_ACTIVE_JOBS: set[ConversionJob] = set()
+_JOBS_LOCK = threading.Lock()
+_LISTENER: ProgressListener | None = None
+
+
+def conversion_scheduler(max_workers: int = DEFAULT_CONVERT_WORKERS) -> ConversionScheduler:
+    """Return the shared scheduler, replacing it when the worker limit changed.
+
+    A replaced scheduler keeps serving the jobs it already started; only new
+    jobs go to the new one.
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None or _SCHEDULER.max_workers != max(1, max_workers):
+            if _SCHEDULER is not None:
+                _SCHEDULER.shutdown()
+            _SCHEDULER = ConversionScheduler(max_workers)
+        return _SCHEDULER
+
+
+def set_conversion_progress_listener(listener: ProgressListener | None) -> None:
+    global _LISTENER
+    _LISTENER = listener
+
+
+def cancel_conversion_jobs() -> int:
+    """Cancel every in-flight conversion; returns how many were running.
+
+    The shared PDF worker pool is shut down too, so extraction work queued for
+    a cancelled conversion does not keep running in its worker processes.
+    """
+    with _JOBS_LOCK:
+        jobs = list(_ACTIVE_JOBS)
+    for job in jobs:
+        job.cancel()
+    close_pdf_process_pool()
+    return len(jobs)
+
+
+def _emit(progress: ConversionProgress) -> None:
+    listener = _LISTENER
+    if listener is None:
+        return
+    try:
+        listener(progress)
+    except Exception as exc:  # noqa: BLE001
+        log_exception("conversion_jobs", exc)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+
+FORMATS = ("docx", "md", "html", "pdf", "xlsx")
+
+
+@dataclass(frozen=True)
+class ConversionStep:
+    source: str
+    target: str
+    label: str
+    # Rough relative run time, used to pick the cheapest path.
+    cost: int
+
+
+CONVERSION_STEPS = (
+    ConversionStep("docx", "md", "DOCX -> Markdown", 2),
+    ConversionStep("pdf", "md", "Extracting PDF text", 2),
+    ConversionStep("xlsx", "md", "Reading XLSX", 1),
+    ConversionStep("md", "docx", "Markdown -> DOCX", 3),
+    ConversionStep("md", "html", "Markdown -> HTML", 1),
+    ConversionStep("html", "pdf", "HTML -> PDF", 4),
+)
+
+
+def plan_conversion(
+    source: str,
+    target: str,
+    steps: tuple[ConversionStep, ...] = CONVERSION_STEPS,
+) -> list[ConversionStep]:
+    """Return the cheapest chain of steps turning source format into target."""
+    if source == target:
+        raise ValueError("Input and output formats are the same.")
+    edges: dict[str, list[ConversionStep]] = {}
+    for step in steps:
+        edges.setdefault(step.source, []).append(step)
+    best = {source: 0}
+    queue: list[tuple[int, int, str, list[ConversionStep]]] = [(0, 0, source, [])]
+    counter = 0
+    while queue:
+        cost, _, fmt, path = heapq.heappop(queue)
+        if fmt == target:
+            return path
+        if cost > best.get(fmt, cost):
+            continue
+        for step in edges.get(fmt, []):
+            total = cost + step.cost
+            if total < best.get(step.target, total + 1):
+                best[step.target] = total
+                counter += 1
+                heapq.heappush(queue, (total, counter, step.target, [*path, step]))
+    raise ValueError(f"Unsupported conversion: {source} -> {target}")
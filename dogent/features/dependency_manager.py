@@ -153,9 +153,29 @@ def _required_dependencies_for_tool(tool_name: str, input_data: dict) -> list[st
         if fmt == "pdf":
             return [DEP_PLAYWRIGHT, DEP_PLAYWRIGHT_CHROMIUM]
         return []
+    if tool_name == "mcp__dogent__export_documents":
+        jobs = input_data.get("jobs")
+        if not isinstance(jobs, list):
+            return []
+        needed: list[str] = []
+        for job in jobs:
+            if isinstance(job, dict):
+                needed.extend(
+                    _required_dependencies_for_tool("mcp__dogent__export_document", job)
+                )
+        return _dedupe_ordered(needed)
     if tool_name == "mcp__dogent__read_document":
         path = str(input_data.get("path") or "")
         return _dependencies_for_path(path)
+    if tool_name == "mcp__dogent__read_documents":
+        files = input_data.get("files")
+        if not isinstance(files, list):
+            return []
+        deps: list[str] = []
+        for item in files:
+            if isinstance(item, dict):
+                deps.extend(_dependencies_for_path(str(item.get("path") or "")))
+        return _dedupe_ordered(deps)
     if tool_name == "mcp__dogent__convert_document":
         input_path = str(input_data.get("input_path") or "")
         output_path = str(input_data.get("output_path") or "")
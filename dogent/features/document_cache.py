@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+
+from ..core.session_log import log_exception
+
+DEFAULT_CACHE_MAX_MB = 256
+
+
+class DocumentCache:
+    """Size-capped LRU cache of parsed document payloads under .dogent/cache.
+
+    Entries are keyed by the resolved source path, its mtime and size, plus a
+    caller-defined kind/variant (e.g. rendered text for a given sheet and reader
+    version). A newer version of the same source replaces older entries; the
+    least recently used entries are evicted once the cap is exceeded.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+
+    def get(self, path: Path, *, kind: str, variant: str = "") -> dict[str, Any] | None:
+        entry = self._entry_path(path, kind=kind, variant=variant)
+        if entry is None or not entry.exists():
+            return None
+        try:
+            payload = json.loads(entry.read_text(encoding="utf-8"))
+        except Exception as exc:  # noqa: BLE001
+            log_exception("document_cache", exc)
+            self._unlink(entry)
+            return None
+        if not isinstance(payload, dict):
+            self._unlink(entry)
+            return None
+        try:
+            os.utime(entry)
+        except OSError as exc:
+            log_exception("document_cache", exc)
+        return payload
+
+    def put(
+        self,
+        path: Path,
+        payload: dict[str, Any],
+        *,
+        kind: str,
+        variant: str = "",
+    ) -> None:
+        if self.max_bytes <= 0:
+            return
+        entry = self._entry_path(path, kind=kind, variant=variant)
+        if entry is None:
+            return
+        try:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            log_exception("document_cache", exc)
+            return
+        if len(data) > self.max_bytes:
+            return
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            for stale in self.root.glob(f"{entry.name.rsplit('.', 2)[0]}.*.json"):
+                if stale != entry:
+                    self._unlink(stale)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, entry)
+        except Exception as exc:  # noqa: BLE001
+            log_exception("document_cache", exc)
+            return
+        self._evict()
+
+    def clear(self) -> int:
+        if not self.root.exists():
+            return 0
+        removed = 0
+        for entry in self.root.glob("*.json"):
+            if self._unlink(entry):
+                removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        if not self.root.exists():
+            return []
+        entries: list[tuple[Path, int, float]] = []
+        for entry in self.root.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda item: item[2])
+        for entry, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if self._unlink(entry):
+                total -= size
+
+    def _entry_path(self, path: Path, *, kind: str, variant: str) -> Path | None:
+        try:
+            resolved = path.resolve()
+            stat = resolved.stat()
+        except OSError as exc:
+            log_exception("document_cache", exc)
+            return None
+        source_key = _digest(str(resolved), kind, variant)
+        version_key = _digest(str(stat.st_mtime_ns), str(stat.st_size))
+        return self.root / f"{source_key}.{version_key}.json"
+
+    def _unlink(self, entry: Path) -> bool:
+        try:
+            entry.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as exc:
+            log_exception("document_cache", exc)
+            return False
+
+
+class ArtifactCache:
+    """Content-addressed, size-capped store for intermediate conversion files.
+
+    Callers key artifacts by a digest of the step that produced them and the
+    bytes of its inputs (see artifact_key), so sources with equal content share
+    artifacts whatever their path. The least recently used files are evicted
+    once the cap is exceeded.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+
+    def get(self, key: str, suffix: str) -> Path | None:
+        entry = self.root / f"{key}{suffix}"
+        if not entry.is_file():
+            return None
+        try:
+            os.utime(entry)
+        except OSError as exc:
+            log_exception("document_cache", exc)
+        return entry
+
+    def put(self, key: str, suffix: str, source: Path) -> Path | None:
+        """Copy source into the cache; returns the artifact path, or None if not stored."""
+        if self.max_bytes <= 0:
+            return None
+        try:
+            if source.stat().st_size > self.max_bytes:
+                return None
+            with source.open("rb") as reader:
+                return self._store(key, suffix, lambda handle: shutil.copyfileobj(reader, handle))
+        except OSError as exc:
+            log_exception("document_cache", exc)
+            return None
+
+    def put_bytes(self, key: str, suffix: str, data: bytes) -> Path | None:
+        """Store data in the cache; returns the artifact path, or None if not stored."""
+        if self.max_bytes <= 0 or len(data) > self.max_bytes:
+            return None
+        return self._store(key, suffix, lambda handle: handle.write(data))
+
+    def _store(self, key: str, suffix: str, write: Callable[[BinaryIO], object]) -> Path | None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            entry = self.root / f"{key}{suffix}"
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                write(handle)
+            os.replace(tmp_name, entry)
+        except OSError as exc:
+            log_exception("document_cache", exc)
+            return None
+        self._evict(keep=entry)
+        return entry
+
+    def _evict(self, *, keep: Path) -> None:
+        entries: list[tuple[Path, int, float]] = []
+        for entry in self.root.iterdir():
+            if entry.suffix == ".tmp" or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry, stat.st_size, stat.st_mtime))
+        total = sum(size for _, size, _ in entries)
+        entries.sort(key=lambda item: item[2])
+        for entry, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            try:
+                entry.unlink()
+                total -= size
+            except OSError as exc:
+                log_exception("document_cache", exc)
+
+
+def artifact_key(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:24]
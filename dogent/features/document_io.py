@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import bisect
+import codecs
+import functools
+import hashlib
 import io
+import json
 import mimetypes
 import os
 import re
@@ -10,22 +15,73 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import unquote, urlparse
 from xml.etree import ElementTree as ET
 
+from ..config.paths import DogentPaths
 from ..config.resources import read_config_text
 from ..core.session_log import log_exception
+from .browser_pool import chromium_pool
+from .conversion_jobs import (
+    DEFAULT_CONVERT_WORKERS,
+    ConversionCancelled,
+    conversion_scheduler,
+)
+from .conversion_planner import plan_conversion
+from .document_cache import DEFAULT_CACHE_MAX_MB, ArtifactCache, DocumentCache, artifact_key
+from .document_outline import close_outline, find_section, format_outline, markdown_outline
+from .docx_markdown import DocxUnsupported, docx_to_markdown
+from .export_images import DEFAULT_IMAGE_DPI, DEFAULT_IMAGE_QUALITY, prepare_export_image
+from .pdf_optimize import optimize_pdf
+from .pdf_pool import close_pdf_process_pool, pdf_process_pool
+from .pandoc_backend import (
+    PANDOC_BACKEND_SERVER,
+    PANDOC_BACKEND_SUBPROCESS,
+    PANDOC_BACKENDS,
+    PandocServerError,
+    PandocServerUnavailable,
+    mark_pandoc_server_unavailable,
+    pandoc_server,
+)
 
 DEFAULT_MAX_CHARS = 15000
 DEFAULT_XLSX_MAX_ROWS = 50
 DEFAULT_XLSX_MAX_COLS = 20
+MAX_XLSX_ROW_LIMIT = 1000
+DEFAULT_PDF_PARALLEL_MIN_PAGES = 64
+MAX_AUTO_PDF_WORKERS = 8
+DEFAULT_READ_WORKERS = 4
+DEFAULT_EXPORT_WORKERS = 4
+DEFAULT_PDF_CHUNK_CHARS = 0
 PACKAGE_MODE_ENV = "DOGENT_PACKAGE_MODE"
 PDF_STYLE_FILENAME = "pdf_style.css"
+DOCUMENTS_CONFIG_KEY = "documents"
+# Bump when rendered output changes so cached reads are invalidated.
+DOCUMENT_READER_VERSION = 2
+# Bump when exported PDF/DOCX output changes so up-to-date exports are rebuilt.
+DOCUMENT_EXPORT_VERSION = 2
+_CACHED_READ_SUFFIXES = {".pdf", ".docx", ".xlsx"}
+_PAGING_KEYS = ("offset", "returned", "total_chars", "next_offset")
+# Text files at least this large are paged from disk through a checkpoint index.
+_TEXT_WINDOW_MIN_BYTES = 4 * 1024 * 1024
+_TEXT_CHECKPOINT_BYTES = 256 * 1024
+IMAGE_MODE_INLINE = "inline"
+IMAGE_MODE_FILE = "file"
+_DATA_URI_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_HIGHLIGHT_CACHE_MAX_ENTRIES = 4096
+_HIGHLIGHT_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+_HIGHLIGHT_LOCK = threading.Lock()
+_PDF_NO_TEXT_ERROR = "Unsupported PDF: no extractable text (scanned PDF not supported)."
 
 
 @dataclass(frozen=True)
@@ -46,6 +102,109 @@ class DocumentConvertResult:
     notes: list[str]
 
 
+@dataclass(frozen=True)
+class DocumentExportResult:
+    warnings: list[str]
+    # True when the output was current with its sources and was not rebuilt.
+    skipped: bool = False
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    md_path: Path
+    output_path: Path
+    format: str
+    title: str | None = None
+
+
+@dataclass
+class ExportJobResult:
+    job: ExportJob
+    seconds: float
+    warnings: list[str]
+    error: str | None = None
+    skipped: bool = False
+
+
+@dataclass(frozen=True)
+class DocumentSettings:
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+    # 0 picks a worker count from the CPU count; 1 disables parallel extraction.
+    pdf_workers: int = 0
+    pdf_parallel_min_pages: int = DEFAULT_PDF_PARALLEL_MIN_PAGES
+    # Concurrent parses for one read_documents batch.
+    read_workers: int = DEFAULT_READ_WORKERS
+    # Concurrent pandoc (DOCX) jobs for one batch export.
+    export_workers: int = DEFAULT_EXPORT_WORKERS
+    # Blocking convert_document stages (pandoc, PyMuPDF) running at once off the event loop.
+    convert_workers: int = DEFAULT_CONVERT_WORKERS
+    # Markdown longer than this is rendered to PDF in chunks of about this many
+    # characters on parallel browser pages, then merged; 0 renders in one page.
+    pdf_chunk_chars: int = DEFAULT_PDF_CHUNK_CHARS
+    # Subset fonts, deflate and deduplicate exported PDFs with PyMuPDF.
+    pdf_optimize: bool = False
+    # Exported images are downscaled to the page width at this DPI; 0 keeps originals.
+    image_dpi: int = DEFAULT_IMAGE_DPI
+    image_quality: int = DEFAULT_IMAGE_QUALITY
+    # "server" reuses one `pandoc server` process; "subprocess" runs pandoc per call.
+    pandoc_backend: str = PANDOC_BACKEND_SUBPROCESS
+
+    def resolved_pdf_workers(self) -> int:
+        if self.pdf_workers > 0:
+            return self.pdf_workers
+        return max(1, min(os.cpu_count() or 1, MAX_AUTO_PDF_WORKERS))
+
+
+def load_document_settings(project_cfg: dict[str, Any] | None) -> DocumentSettings:
+    raw = (project_cfg or {}).get(DOCUMENTS_CONFIG_KEY)
+    if not isinstance(raw, dict):
+        return DocumentSettings()
+    defaults = DocumentSettings()
+    return DocumentSettings(
+        cache_max_mb=_config_int(raw.get("cache_max_mb"), defaults.cache_max_mb, minimum=0),
+        pdf_workers=_config_int(raw.get("pdf_workers"), defaults.pdf_workers, minimum=0),
+        pdf_parallel_min_pages=_config_int(
+            raw.get("pdf_parallel_min_pages"),
+            defaults.pdf_parallel_min_pages,
+            minimum=1,
+        ),
+        read_workers=_config_int(raw.get("read_workers"), defaults.read_workers, minimum=1),
+        export_workers=_config_int(
+            raw.get("export_workers"), defaults.export_workers, minimum=1
+        ),
+        convert_workers=_config_int(
+            raw.get("convert_workers"), defaults.convert_workers, minimum=1
+        ),
+        pdf_chunk_chars=_config_int(
+            raw.get("pdf_chunk_chars"), defaults.pdf_chunk_chars, minimum=0
+        ),
+        pdf_optimize=(
+            raw["pdf_optimize"]
+            if isinstance(raw.get("pdf_optimize"), bool)
+            else defaults.pdf_optimize
+        ),
+        image_dpi=_config_int(raw.get("image_dpi"), defaults.image_dpi, minimum=0),
+        image_quality=min(
+            _config_int(raw.get("image_quality"), defaults.image_quality, minimum=1), 100
+        ),
+        pandoc_backend=(
+            raw["pandoc_backend"]
+            if raw.get("pandoc_backend") in PANDOC_BACKENDS
+            else defaults.pandoc_backend
+        ),
+    )
+
+
+def _config_int(value: Any, default: int, *, minimum: int) -> int:
+    if isinstance(value, bool) or value is None:
+        return default
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed >= minimum else default
+
+
 def _package_mode() -> str:
     mode = os.getenv(PACKAGE_MODE_ENV, "lite").strip().lower()
     return "full" if mode == "full" else "lite"
@@ -93,12 +252,326 @@ def read_document(
     max_chars: int = DEFAULT_MAX_CHARS,
     offset: int = 0,
     length: int | None = None,
+    pages: str | None = None,
+    row_offset: int | None = None,
+    row_limit: int | None = None,
+    columns: str | None = None,
+    outline: bool = False,
+    section: str | None = None,
+    cache: DocumentCache | None = None,
+    settings: DocumentSettings | None = None,
+) -> DocumentReadResult:
+    ext = path.suffix.lower()
+    if outline or section:
+        if pages or row_offset is not None or row_limit is not None or columns:
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format=_format_from_suffix(path),
+                metadata={},
+                error="outline/section cannot be combined with pages or row windows.",
+            )
+        if outline:
+            return _read_outline(
+                path,
+                sheet=sheet,
+                max_chars=max_chars,
+                offset=offset,
+                length=length,
+                cache=cache,
+                settings=settings,
+            )
+        return _read_section(
+            path,
+            section=section or "",
+            sheet=sheet,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+            cache=cache,
+            settings=settings,
+        )
+    if row_offset is not None or row_limit is not None or columns:
+        if ext != ".xlsx":
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format=_format_from_suffix(path),
+                metadata={},
+                error="row_offset/row_limit/columns are only supported for XLSX files.",
+            )
+        return _read_xlsx_rows(
+            path,
+            sheet=sheet,
+            row_offset=row_offset or 0,
+            row_limit=row_limit,
+            columns=columns,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+        )
+    if pages:
+        if ext != ".pdf":
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format=_format_from_suffix(path),
+                metadata={},
+                error="pages is only supported for PDF files.",
+            )
+        return _read_pdf_pages(
+            path, pages=pages, max_chars=max_chars, offset=offset, length=length
+        )
+    if ext not in _CACHED_READ_SUFFIXES:
+        # Plain text is paged straight from disk; only its offset index is cached.
+        return _read_text(
+            path, max_chars=max_chars, offset=offset, length=length, cache=cache
+        )
+    if cache is None:
+        return _read_document_uncached(
+            path,
+            sheet=sheet,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+            settings=settings,
+        )
+    variant = f"{DOCUMENT_READER_VERSION}:{sheet or ''}"
+    cached = cache.get(path, kind="text", variant=variant)
+    if not _valid_cached_text(cached):
+        if ext == ".pdf" and _window_limit(max_chars, length) > 0:
+            # Windowed PDF reads extract only the pages they need.
+            return _read_pdf(
+                path, max_chars=max_chars, offset=offset, length=length, cache=cache
+            )
+        full = _read_document_uncached(
+            path,
+            sheet=sheet,
+            max_chars=0,
+            offset=0,
+            length=None,
+            settings=settings,
+        )
+        if full.error:
+            return full
+        cached = {
+            "content": full.content,
+            "format": full.format,
+            "metadata": {
+                key: value
+                for key, value in full.metadata.items()
+                if key not in _PAGING_KEYS
+            },
+        }
+        cache.put(path, cached, kind="text", variant=variant)
+    content, truncated, paging = _apply_size_limit(
+        cached["content"],
+        max_chars,
+        offset=offset,
+        length=length,
+    )
+    return DocumentReadResult(
+        content=content,
+        truncated=truncated,
+        format=cached["format"],
+        metadata={**cached["metadata"], **paging},
+    )
+
+
+def _read_outline(
+    path: Path,
+    *,
+    sheet: str | None,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    cache: DocumentCache | None,
+    settings: DocumentSettings | None,
+) -> DocumentReadResult:
+    headings, total_chars, failure = _document_outline(
+        path, sheet=sheet, cache=cache, settings=settings
+    )
+    if failure:
+        return failure
+    content, truncated, paging = _apply_size_limit(
+        format_outline(headings),
+        max_chars,
+        offset=offset,
+        length=length,
+    )
+    return DocumentReadResult(
+        content=content,
+        truncated=truncated,
+        format=_format_from_suffix(path),
+        metadata={
+            "headings": len(headings),
+            "document_chars": total_chars,
+            **paging,
+        },
+    )
+
+
+def _read_section(
+    path: Path,
+    *,
+    section: str,
+    sheet: str | None,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    cache: DocumentCache | None,
+    settings: DocumentSettings | None,
+) -> DocumentReadResult:
+    headings, _, failure = _document_outline(
+        path, sheet=sheet, cache=cache, settings=settings
+    )
+    if failure:
+        return failure
+    heading = find_section(headings, section)
+    if heading is None:
+        return DocumentReadResult(
+            content="",
+            truncated=False,
+            format=_format_from_suffix(path),
+            metadata={"headings": len(headings)},
+            error=f"Section not found: {section} (read with outline=true to list sections).",
+        )
+    span_start = heading["offset"]
+    span_chars = heading["end"] - span_start
+    rel_offset = min(max(0, int(offset)), span_chars)
+    limit = _window_limit(max_chars, length)
+    take = span_chars - rel_offset if limit <= 0 else min(limit, span_chars - rel_offset)
+    metadata: dict[str, Any] = {}
+    content = ""
+    if take > 0:
+        # Delegate to the windowed readers so sections page like the document.
+        inner = read_document(
+            path,
+            sheet=sheet,
+            max_chars=take,
+            offset=span_start + rel_offset,
+            length=take,
+            cache=cache,
+            settings=settings,
+        )
+        if inner.error:
+            return inner
+        content = inner.content
+        metadata = {
+            key: value for key, value in inner.metadata.items() if key not in _PAGING_KEYS
+        }
+    end = rel_offset + len(content)
+    truncated = end < span_chars
+    if truncated and rel_offset == 0 and length is None and max_chars > 0:
+        content = content.rstrip() + "\n...[truncated]..."
+    metadata.update(
+        {
+            "section": heading["title"],
+            "section_level": heading["level"],
+            "section_offset": span_start,
+            "offset": rel_offset,
+            "returned": end - rel_offset,
+            "total_chars": span_chars,
+            "next_offset": end if truncated else None,
+        }
+    )
+    return DocumentReadResult(
+        content=content,
+        truncated=truncated,
+        format=_format_from_suffix(path),
+        metadata=metadata,
+    )
+
+
+def _document_outline(
+    path: Path,
+    *,
+    sheet: str | None,
+    cache: DocumentCache | None,
+    settings: DocumentSettings | None,
+) -> tuple[list[dict[str, Any]], int, DocumentReadResult | None]:
+    """Return (headings, rendered length, failure), cached per file version."""
+    variant = f"{DOCUMENT_READER_VERSION}:{sheet or ''}"
+    cached = cache.get(path, kind="outline", variant=variant) if cache else None
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("headings"), list)
+        and isinstance(cached.get("total_chars"), int)
+    ):
+        return cached["headings"], cached["total_chars"], None
+    ext = path.suffix.lower()
+    try:
+        large_text = (
+            ext not in _CACHED_READ_SUFFIXES
+            and path.stat().st_size >= _TEXT_WINDOW_MIN_BYTES
+        )
+    except OSError:
+        large_text = False
+    if large_text:
+        try:
+            with path.open(encoding="utf-8", errors="replace") as handle:
+                headings, total_chars = markdown_outline(handle)
+        except Exception as exc:  # noqa: BLE001
+            log_exception("document_io", exc)
+            return [], 0, DocumentReadResult(
+                content="",
+                truncated=False,
+                format=_format_from_suffix(path),
+                metadata={},
+                error=str(exc),
+            )
+    else:
+        full = read_document(
+            path, sheet=sheet, max_chars=0, cache=cache, settings=settings
+        )
+        if full.error:
+            return [], 0, full
+        text = full.content
+        total_chars = len(text)
+        headings = _pdf_toc_outline(path, text) if ext == ".pdf" else []
+        if not headings:
+            headings, _ = markdown_outline(text.splitlines(keepends=True))
+    if cache:
+        cache.put(
+            path,
+            {"headings": headings, "total_chars": total_chars},
+            kind="outline",
+            variant=variant,
+        )
+    return headings, total_chars, None
+
+
+def _valid_cached_text(payload: dict[str, Any] | None) -> bool:
+    return (
+        isinstance(payload, dict)
+        and isinstance(payload.get("content"), str)
+        and isinstance(payload.get("format"), str)
+        and isinstance(payload.get("metadata"), dict)
+    )
+
+
+def _read_document_uncached(
+    path: Path,
+    *,
+    sheet: str | None,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    settings: DocumentSettings | None = None,
 ) -> DocumentReadResult:
     ext = path.suffix.lower()
     if ext == ".pdf":
-        return _read_pdf(path, max_chars=max_chars, offset=offset, length=length)
+        return _read_pdf(
+            path,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+            settings=settings,
+        )
     if ext == ".docx":
-        return _read_docx(path, max_chars=max_chars, offset=offset, length=length)
+        return _read_docx(
+            path, max_chars=max_chars, offset=offset, length=length, settings=settings
+        )
     if ext == ".xlsx":
         return _read_xlsx(
             path,
@@ -117,21 +590,41 @@ def export_markdown(
     format: str,
     title: str | None = None,
     workspace_root: Path | None = None,
-) -> list[str]:
+    settings: DocumentSettings | None = None,
+    force: bool = False,
+) -> DocumentExportResult:
     normalized = format.strip().lower()
+    if normalized not in {"docx", "pdf"}:
+        raise ValueError(f"Unsupported export format: {format}")
+    manifest = _ExportManifest.build(
+        md_path,
+        output_path=output_path,
+        format=normalized,
+        title=title,
+        workspace_root=workspace_root,
+        settings=settings,
+    )
+    if manifest and not force and manifest.is_current():
+        return DocumentExportResult([], skipped=True)
     if normalized == "docx":
-        _markdown_to_docx(md_path, output_path=output_path, workspace_root=workspace_root)
-        return []
-    if normalized == "pdf":
-        return _run_async(
+        _markdown_to_docx(
+            md_path, output_path=output_path, workspace_root=workspace_root, settings=settings
+        )
+        warnings: list[str] = []
+    else:
+        warnings = _run_async(
             _markdown_to_pdf(
                 md_path,
                 output_path=output_path,
                 title=title,
                 workspace_root=workspace_root,
+                settings=settings,
+                pooled=False,
             )
         )
-    raise ValueError(f"Unsupported export format: {format}")
+    if manifest:
+        manifest.record()
+    return DocumentExportResult(warnings)
 
 
 async def export_markdown_async(
@@ -141,19 +634,245 @@ async def export_markdown_async(
     format: str,
     title: str | None = None,
     workspace_root: Path | None = None,
-) -> list[str]:
+    settings: DocumentSettings | None = None,
+    force: bool = False,
+) -> DocumentExportResult:
     normalized = format.strip().lower()
+    if normalized not in {"docx", "pdf"}:
+        raise ValueError(f"Unsupported export format: {format}")
+    manifest = _ExportManifest.build(
+        md_path,
+        output_path=output_path,
+        format=normalized,
+        title=title,
+        workspace_root=workspace_root,
+        settings=settings,
+    )
+    if manifest and not force and manifest.is_current():
+        return DocumentExportResult([], skipped=True)
     if normalized == "docx":
-        _markdown_to_docx(md_path, output_path=output_path, workspace_root=workspace_root)
-        return []
-    if normalized == "pdf":
-        return await _markdown_to_pdf(
+        _markdown_to_docx(
+            md_path, output_path=output_path, workspace_root=workspace_root, settings=settings
+        )
+        warnings: list[str] = []
+    else:
+        warnings = await _markdown_to_pdf(
             md_path,
             output_path=output_path,
             title=title,
             workspace_root=workspace_root,
+            settings=settings,
+        )
+    if manifest:
+        manifest.record()
+    return DocumentExportResult(warnings)
+
+
+async def export_markdown_batch_async(
+    jobs: list[ExportJob],
+    *,
+    workspace_root: Path | None = None,
+    settings: DocumentSettings | None = None,
+    force: bool = False,
+) -> list[ExportJobResult]:
+    """Export several Markdown files at once, reporting each job separately.
+
+    PDF jobs render concurrently on pages of the shared Chromium pool. DOCX jobs
+    run in worker threads, with at most settings.export_workers pandoc processes.
+    """
+    settings = settings or DocumentSettings()
+    pandoc_slots = asyncio.Semaphore(settings.export_workers)
+
+    async def run(job: ExportJob) -> ExportJobResult:
+        started = time.perf_counter()
+        try:
+            job.output_path.parent.mkdir(parents=True, exist_ok=True)
+            options = {
+                "output_path": job.output_path,
+                "format": job.format,
+                "title": job.title,
+                "workspace_root": workspace_root,
+                "settings": settings,
+                "force": force,
+            }
+            if job.format.strip().lower() == "docx":
+                async with pandoc_slots:
+                    result = await asyncio.to_thread(export_markdown, job.md_path, **options)
+            else:
+                result = await export_markdown_async(job.md_path, **options)
+        except Exception as exc:  # noqa: BLE001
+            log_exception("document_io", exc)
+            return ExportJobResult(job, time.perf_counter() - started, [], error=str(exc))
+        return ExportJobResult(
+            job, time.perf_counter() - started, result.warnings, skipped=result.skipped
+        )
+
+    return list(await asyncio.gather(*(run(job) for job in jobs)))
+
+
+_MD_IMAGE_TARGET = re.compile(r"(!\[[^\]]*\]\(\s*)(<[^>\n]+>|[^)\s]+)")
+_MD_IMAGE_SRC = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+_MD_LINK_DEFINITION = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?([^\s>]+)", re.MULTILINE)
+_HTML_IMG_SRC = re.compile(r"<img\b[^>]*\bsrc=([\"']?)([^\"'>\s]+)\1", re.IGNORECASE)
+
+
+@dataclass
+class _ExportManifest:
+    """Record of what an exported file was built from, kept in .dogent/cache/exports.
+
+    The digest covers the normalized Markdown, the resolved PDF CSS, referenced
+    local images, the title, the format and DOCUMENT_EXPORT_VERSION. An export is
+    current when the digest matches and the output is unchanged since it was written.
+    """
+
+    path: Path
+    output_path: Path
+    digest: str
+    inputs: dict[str, Any]
+
+    @classmethod
+    def build(
+        cls,
+        md_path: Path,
+        *,
+        output_path: Path,
+        format: str,
+        title: str | None,
+        workspace_root: Path | None,
+        settings: DocumentSettings | None = None,
+    ) -> "_ExportManifest | None":
+        if workspace_root is None:
+            return None
+        settings = settings or DocumentSettings()
+        try:
+            md_text = md_path.read_text(encoding="utf-8", errors="replace")
+            md_text = md_text.replace("\r\n", "\n").replace("\r", "\n")
+            inputs: dict[str, Any] = {
+                "version": DOCUMENT_EXPORT_VERSION,
+                "format": format,
+                "title": title,
+                "image_dpi": settings.image_dpi,
+                "image_quality": settings.image_quality,
+                "markdown": {"path": str(md_path.resolve()), "sha256": _sha256_text(md_text)},
+            }
+            if format == "pdf":
+                css_text, _ = _resolve_pdf_style(workspace_root)
+                inputs["css_sha256"] = _sha256_text(css_text)
+                inputs["pdf_chunk_chars"] = settings.pdf_chunk_chars
+                inputs["pdf_optimize"] = settings.pdf_optimize
+            inputs["images"] = [
+                {"path": str(image), "sha256": _sha256_file(image)}
+                for image in _local_image_refs(
+                    md_text, md_path.parent, workspace_root, allow_root_fallback=format == "docx"
+                )
+            ]
+        except OSError as exc:
+            log_exception("document_io", exc)
+            return None
+        resolved_output = output_path.resolve()
+        key = hashlib.sha256(str(resolved_output).encode("utf-8")).hexdigest()[:32]
+        return cls(
+            path=DogentPaths(workspace_root).export_cache_dir / f"{key}.json",
+            output_path=resolved_output,
+            digest=_sha256_text(json.dumps(inputs, sort_keys=True)),
+            inputs=inputs,
+        )
+
+    def is_current(self) -> bool:
+        try:
+            recorded = json.loads(self.path.read_text(encoding="utf-8"))
+            stat = self.output_path.stat()
+        except (OSError, ValueError):
+            return False
+        return (
+            isinstance(recorded, dict)
+            and recorded.get("digest") == self.digest
+            and recorded.get("output_size") == stat.st_size
+            and recorded.get("output_mtime_ns") == stat.st_mtime_ns
+        )
+
+    def record(self) -> None:
+        try:
+            stat = self.output_path.stat()
+            payload = {
+                "output": str(self.output_path),
+                "digest": self.digest,
+                "output_size": stat.st_size,
+                "output_mtime_ns": stat.st_mtime_ns,
+                "built_at": datetime.now().isoformat(timespec="seconds"),
+                "inputs": self.inputs,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            log_exception("document_io", exc)
+
+
+def export_dependencies(
+    md_path: Path, *, format: str, workspace_root: Path | None
+) -> list[Path]:
+    """Files an export of md_path is built from: the Markdown, its local images
+    and, for PDF, both candidate pdf_style.css locations (which may not exist yet).
+    """
+    paths = [md_path.resolve()]
+    try:
+        md_text = md_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        md_text = ""
+    paths.extend(
+        _local_image_refs(
+            md_text, md_path.parent, workspace_root, allow_root_fallback=format == "docx"
         )
-    raise ValueError(f"Unsupported export format: {format}")
+    )
+    if format == "pdf":
+        if workspace_root:
+            paths.append((workspace_root / ".dogent" / PDF_STYLE_FILENAME).resolve())
+        paths.append((Path.home() / ".dogent" / PDF_STYLE_FILENAME).resolve())
+    return paths
+
+
+def _local_image_refs(
+    md_text: str,
+    base_dir: Path,
+    workspace_root: Path | None,
+    *,
+    allow_root_fallback: bool = False,
+) -> list[Path]:
+    sources = [match.group(1) for match in _MD_IMAGE_SRC.finditer(md_text)]
+    sources.extend(match.group(1) for match in _MD_LINK_DEFINITION.finditer(md_text))
+    sources.extend(match.group(2) for match in _HTML_IMG_SRC.finditer(md_text))
+    images: list[Path] = []
+    seen: set[Path] = set()
+    for src in sources:
+        parsed = urlparse(src)
+        if parsed.scheme and len(parsed.scheme) > 1:
+            continue
+        raw = Path(unquote(parsed.path))
+        candidates = [raw] if raw.is_absolute() else [base_dir / raw]
+        if allow_root_fallback and workspace_root and not raw.is_absolute():
+            candidates.append(workspace_root / raw)
+        for candidate in candidates:
+            resolved = candidate.resolve()
+            if resolved.is_file():
+                if resolved not in seen:
+                    seen.add(resolved)
+                    images.append(resolved)
+                break
+    return images
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 async def convert_document_async(
@@ -162,6 +881,7 @@ async def convert_document_async(
     output_path: Path,
     extract_media_dir: Path | None = None,
     workspace_root: Path | None = None,
+    settings: DocumentSettings | None = None,
 ) -> DocumentConvertResult:
     input_format = _detect_format(input_path)
     output_format = _detect_format(output_path)
@@ -176,59 +896,78 @@ async def convert_document_async(
     ):
         raise ValueError("extract_media_dir is only supported for DOCX to Markdown.")
 
+    plan = plan_conversion(input_format, output_format)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    settings = settings or DocumentSettings()
     notes: list[str] = []
-
-    if input_format == "docx" and output_format == "md":
-        _docx_to_markdown(
-            input_path,
-            output_path=output_path,
-            extract_media_dir=extract_media_dir,
-        )
-    elif input_format == "md" and output_format == "docx":
-        _markdown_to_docx(input_path, output_path=output_path, workspace_root=workspace_root)
-    elif input_format == "md" and output_format == "pdf":
-        style_notes = await _markdown_to_pdf(
-            input_path,
-            output_path=output_path,
-            title=output_path.stem,
-            workspace_root=workspace_root,
-        )
-        notes.extend(style_notes)
-    elif input_format == "docx" and output_format == "pdf":
+    if input_format == "docx" and output_format == "pdf":
         notes.append("Converted DOCX -> Markdown -> PDF; formatting may differ.")
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_md = Path(tmp) / "source.md"
-            _docx_to_markdown(input_path, output_path=tmp_md, extract_media_dir=None)
-            style_notes = await _markdown_to_pdf(
-                tmp_md,
-                output_path=output_path,
-                title=output_path.stem,
-                workspace_root=workspace_root,
-            )
-            notes.extend(style_notes)
-    elif input_format == "pdf" and output_format == "md":
-        notes.append("PDF text extracted; layout and images are not preserved.")
-        result = read_document(input_path, max_chars=0)
-        if result.error:
-            raise RuntimeError(result.error)
-        output_path.write_text(result.content, encoding="utf-8")
-    elif input_format == "pdf" and output_format == "docx":
+    if input_format == "pdf":
         notes.append("PDF text extracted; layout and images are not preserved.")
-        result = read_document(input_path, max_chars=0)
-        if result.error:
-            raise RuntimeError(result.error)
+    css_text = ""
+    if any(step.target == "html" for step in plan):
+        css_text, style_notes = _resolve_pdf_style(workspace_root)
+        notes.extend(style_notes)
+    cache = _artifact_cache(workspace_root, settings)
+    scheduler = conversion_scheduler(settings.convert_workers)
+
+    async with scheduler.job(f"{input_path.name} -> {output_path.name}", stages=len(plan)) as job:
         with tempfile.TemporaryDirectory() as tmp:
-            tmp_md = Path(tmp) / "source.md"
-            tmp_md.write_text(result.content, encoding="utf-8")
-            _markdown_to_docx(tmp_md, output_path=output_path, workspace_root=workspace_root)
-    elif input_format == "xlsx" and output_format == "md":
-        result = read_document(input_path, max_chars=0)
-        if result.error:
-            raise RuntimeError(result.error)
-        output_path.write_text(result.content, encoding="utf-8")
-    else:
-        raise ValueError(f"Unsupported conversion: {input_format} -> {output_format}")
+            source = input_path
+            for index, step in enumerate(plan):
+                last = index == len(plan) - 1
+                target = (
+                    job.staged_output(output_path)
+                    if last
+                    else Path(tmp) / f"step-{index}.{step.target}"
+                )
+                if step.target == "md":
+                    produced = await job.run(
+                        step.label,
+                        _source_to_markdown,
+                        source,
+                        target,
+                        settings=settings,
+                        cache=cache,
+                        extract_media_dir=extract_media_dir,
+                    )
+                    target = target if last else produced
+                elif step.target == "docx":
+                    await job.run(
+                        step.label,
+                        _markdown_to_docx,
+                        source,
+                        output_path=target,
+                        workspace_root=workspace_root,
+                        settings=settings,
+                    )
+                elif step.target == "html":
+                    # Cached HTML is returned in place of target.
+                    target = await job.run(
+                        step.label,
+                        _markdown_to_print_html,
+                        source,
+                        target,
+                        title=output_path.stem,
+                        css_text=css_text,
+                        workspace_root=workspace_root,
+                        settings=settings,
+                        chunked=True,
+                    )
+                else:
+                    notes.extend(
+                        await job.wait(
+                            step.label,
+                            functools.partial(
+                                _print_html_to_pdf,
+                                source,
+                                output_path=target,
+                                css_text=css_text,
+                                settings=settings,
+                            ),
+                        )
+                    )
+                source = target
 
     return DocumentConvertResult(
         input_format=input_format,
@@ -239,13 +978,70 @@ async def convert_document_async(
     )
 
 
+def _write_text_chunks(target: Path, chunks: Iterable[str]) -> int:
+    """Stream chunks to target as they are produced; returns characters written."""
+    written = 0
+    with target.open("w", encoding="utf-8") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _source_to_markdown(
+    source: Path,
+    target: Path,
+    *,
+    settings: DocumentSettings,
+    cache: ArtifactCache | None,
+    extract_media_dir: Path | None = None,
+) -> Path:
+    """Write Markdown for a DOCX, PDF or XLSX file, reusing an earlier extraction.
+
+    Extractions are cached by source content, except when media files are
+    extracted alongside, since the Markdown then points at that directory.
+    Returns the cached copy when there is one: later steps read it from a
+    stable path, so what they derive from it can be cached too.
+    """
+    input_format = _detect_format(source)
+    key = ""
+    if cache is not None and extract_media_dir is None:
+        key = artifact_key(
+            f"{input_format}->md", str(DOCUMENT_READER_VERSION), _sha256_file(source)
+        )
+        cached = cache.get(key, ".md")
+        if cached is not None:
+            shutil.copyfile(cached, target)
+            return cached
+    if input_format == "docx":
+        _docx_to_markdown(
+            source, output_path=target, extract_media_dir=extract_media_dir, settings=settings
+        )
+    elif input_format == "pdf":
+        if not _write_text_chunks(target, _iter_pdf_markdown(source, settings)):
+            raise RuntimeError(_PDF_NO_TEXT_ERROR)
+    else:
+        _write_text_chunks(target, _iter_xlsx_markdown(source))
+    stored = cache.put(key, ".md", target) if cache is not None and key else None
+    return stored or target
+
+
 def _read_text(
     path: Path,
     *,
     max_chars: int,
     offset: int,
     length: int | None,
+    cache: DocumentCache | None = None,
 ) -> DocumentReadResult:
+    try:
+        large = path.stat().st_size >= _TEXT_WINDOW_MIN_BYTES
+    except OSError:
+        large = False
+    if large and _window_limit(max_chars, length) > 0:
+        return _read_text_window(
+            path, max_chars=max_chars, offset=offset, length=length, cache=cache
+        )
     try:
         text = path.read_text(encoding="utf-8", errors="replace")
     except Exception as exc:  # noqa: BLE001
@@ -271,23 +1067,148 @@ def _read_text(
     )
 
 
-def _read_docx(
+class _TextIndex:
+    """Sparse checkpoints mapping decoded character offsets to byte offsets.
+
+    Checkpoints are only recorded where the decoder holds no partial bytes or
+    pending carriage return, so decoding restarted there yields exactly the
+    characters a full read_text() would.
+    """
+
+    def __init__(
+        self,
+        checkpoints: Iterable[Iterable[int]] = (),
+        total_chars: int | None = None,
+    ) -> None:
+        self.checkpoints = [(int(chars), int(offset)) for chars, offset in checkpoints]
+        if not self.checkpoints:
+            self.checkpoints = [(0, 0)]
+        self.total_chars = total_chars
+
+    def seek(self, char_offset: int) -> tuple[int, int]:
+        idx = bisect.bisect_right(self.checkpoints, (char_offset, float("inf"))) - 1
+        return self.checkpoints[max(0, idx)]
+
+    def add(self, char_offset: int, byte_offset: int) -> None:
+        if char_offset > self.checkpoints[-1][0]:
+            self.checkpoints.append((char_offset, byte_offset))
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "checkpoints": [list(item) for item in self.checkpoints],
+            "total_chars": self.total_chars,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any] | None) -> "_TextIndex":
+        if isinstance(payload, dict):
+            checkpoints = payload.get("checkpoints")
+            total_chars = payload.get("total_chars")
+            if (
+                isinstance(checkpoints, list)
+                and all(
+                    isinstance(item, list)
+                    and len(item) == 2
+                    and all(isinstance(value, int) for value in item)
+                    for item in checkpoints
+                )
+                and (total_chars is None or isinstance(total_chars, int))
+            ):
+                return cls(checkpoints, total_chars)
+        return cls()
+
+
+def _read_text_window(
     path: Path,
     *,
     max_chars: int,
     offset: int,
     length: int | None,
+    cache: DocumentCache | None,
 ) -> DocumentReadResult:
+    index_variant = str(DOCUMENT_READER_VERSION)
+    index = _TextIndex.from_payload(
+        cache.get(path, kind="text-index", variant=index_variant) if cache else None
+    )
+    known_before = (len(index.checkpoints), index.total_chars)
+    limit = _window_limit(max_chars, length)
+    safe_offset = max(0, int(offset))
+    if index.total_chars is not None:
+        safe_offset = min(safe_offset, index.total_chars)
+    # One character past the window tells whether more text follows.
+    stop = safe_offset + limit + 1
+    char_pos, byte_pos = index.seek(safe_offset)
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    pieces: list[str] = []
     try:
-        _ensure_pandoc_available()
-        import pypandoc
-
-        text = pypandoc.convert_file(
-            str(path),
-            to="markdown",
-            format="docx",
-            extra_args=["--track-changes=all"],
+        with path.open("rb") as handle:
+            handle.seek(byte_pos)
+            while True:
+                chunk = handle.read(_TEXT_CHECKPOINT_BYTES)
+                text = decoder.decode(chunk, final=not chunk)
+                if char_pos + len(text) > safe_offset and char_pos < stop:
+                    pieces.append(
+                        text[max(0, safe_offset - char_pos) : stop - char_pos]
+                    )
+                char_pos += len(text)
+                byte_pos += len(chunk)
+                if not chunk:
+                    index.total_chars = char_pos
+                    break
+                buffered, flag = decoder.getstate()
+                if not flag & 1:
+                    index.add(char_pos, byte_pos - len(buffered))
+                if char_pos >= stop:
+                    break
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return DocumentReadResult(
+            content="",
+            truncated=False,
+            format=_format_from_suffix(path),
+            metadata={},
+            error=str(exc),
         )
+    if cache and (len(index.checkpoints), index.total_chars) != known_before:
+        cache.put(path, index.to_payload(), kind="text-index", variant=index_variant)
+
+    if index.total_chars is not None:
+        safe_offset = min(safe_offset, index.total_chars)
+    window = "".join(pieces)
+    segment = window[:limit]
+    truncated = len(window) > limit
+    end = safe_offset + len(segment)
+    if truncated and safe_offset == 0 and length is None and max_chars > 0:
+        segment = segment.rstrip() + "\n...[truncated]..."
+    paging = {
+        "offset": safe_offset,
+        "returned": end - safe_offset,
+        "total_chars": index.total_chars,
+        "next_offset": end if truncated else None,
+    }
+    return DocumentReadResult(
+        content=segment,
+        truncated=truncated,
+        format=_format_from_suffix(path),
+        metadata=paging,
+    )
+
+
+def _read_docx(
+    path: Path,
+    *,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    settings: DocumentSettings | None = None,
+) -> DocumentReadResult:
+    text = _docx_to_markdown_native(path, media_dir=None)
+    try:
+        if text is None:
+            _ensure_pandoc_available()
+            text = _pandoc_docx_to_markdown(path, settings)
     except Exception as exc:  # noqa: BLE001
         log_exception("document_io", exc)
         return DocumentReadResult(
@@ -316,8 +1237,17 @@ def _docx_to_markdown(
     *,
     output_path: Path,
     extract_media_dir: Path | None,
+    settings: DocumentSettings | None = None,
 ) -> None:
+    text = _docx_to_markdown_native(input_path, media_dir=extract_media_dir)
+    if text is not None:
+        output_path.write_text(text, encoding="utf-8")
+        return
     _ensure_pandoc_available()
+    if not extract_media_dir:
+        # The pandoc server cannot write media files, so extraction stays on the CLI.
+        output_path.write_text(_pandoc_docx_to_markdown(input_path, settings), encoding="utf-8")
+        return
     import pypandoc
 
     extra_args = ["--track-changes=all"]
@@ -333,57 +1263,467 @@ def _docx_to_markdown(
     )
 
 
-def _read_pdf(
+def _pandoc_docx_to_markdown(path: Path, settings: DocumentSettings | None) -> str:
+    served = _convert_with_pandoc_server(
+        settings,
+        path.read_bytes(),
+        from_format="docx",
+        to="markdown",
+        options={"track-changes": "all"},
+    )
+    if isinstance(served, str):
+        return served
+    import pypandoc
+
+    return pypandoc.convert_file(
+        str(path),
+        to="markdown",
+        format="docx",
+        extra_args=["--track-changes=all"],
+    )
+
+
+def _convert_with_pandoc_server(
+    settings: DocumentSettings | None,
+    text: str | bytes,
+    *,
+    from_format: str,
+    to: str,
+    options: dict[str, Any] | None = None,
+    files: dict[str, bytes] | None = None,
+) -> str | bytes | None:
+    """Convert through the shared pandoc server; None means run pandoc as a subprocess."""
+    if (settings or DocumentSettings()).pandoc_backend != PANDOC_BACKEND_SERVER:
+        return None
+    server = pandoc_server()
+    if server is None:
+        return None
+    try:
+        return server.convert(
+            text, from_format=from_format, to=to, options=options, files=files
+        )
+    except PandocServerUnavailable as exc:
+        log_exception("document_io", exc)
+        mark_pandoc_server_unavailable()
+    except PandocServerError as exc:
+        log_exception("document_io", exc)
+    return None
+
+
+def _docx_to_markdown_native(path: Path, *, media_dir: Path | None) -> str | None:
+    """Return Markdown from the in-process reader, or None to fall back to pandoc."""
+    try:
+        return docx_to_markdown(path, media_dir=media_dir)
+    except DocxUnsupported:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return None
+
+
+def _open_pdf(path: Path) -> tuple[Any | None, DocumentReadResult | None]:
+    try:
+        import fitz
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return None, DocumentReadResult(
+            content="",
+            truncated=False,
+            format="pdf",
+            metadata={},
+            error=f"PDF read failed (missing PyMuPDF): {exc}",
+        )
+
+    try:
+        return fitz.open(str(path)), None
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return None, DocumentReadResult(
+            content="",
+            truncated=False,
+            format="pdf",
+            metadata={},
+            error=f"PDF read failed: {exc}",
+        )
+
+
+def _pdf_page_part(page_number: int, text: str) -> str:
+    text = text.strip()
+    if not text:
+        return ""
+    return f"<!-- page:{page_number} -->\n\n{text}\n"
+
+
+def _read_pdf(
+    path: Path,
+    *,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    cache: DocumentCache | None = None,
+    settings: DocumentSettings | None = None,
+) -> DocumentReadResult:
+    if _window_limit(max_chars, length) > 0:
+        return _read_pdf_window(
+            path, max_chars=max_chars, offset=offset, length=length, cache=cache
+        )
+    doc, failure = _open_pdf(path)
+    if failure:
+        return failure
+
+    try:
+        page_count = len(doc)
+        resolved = settings or DocumentSettings()
+        workers = min(resolved.resolved_pdf_workers(), page_count)
+        page_parts: list[str] | None = None
+        if workers > 1 and page_count >= resolved.pdf_parallel_min_pages:
+            page_parts = _extract_pdf_pages_parallel(path, page_count, workers)
+        if page_parts is None:
+            page_parts = [
+                _pdf_page_part(idx, page.get_text("text"))
+                for idx, page in enumerate(doc, start=1)
+            ]
+        parts = [part for part in page_parts if part]
+        metadata = {"pages": page_count}
+        if not parts:
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format="pdf",
+                metadata=metadata,
+                error=_PDF_NO_TEXT_ERROR,
+            )
+        combined = "\n\n".join(parts).strip() + "\n"
+        content, truncated, paging = _apply_size_limit(
+            combined,
+            max_chars,
+            offset=offset,
+            length=length,
+        )
+        return DocumentReadResult(
+            content=content,
+            truncated=truncated,
+            format="pdf",
+            metadata={**metadata, **paging},
+        )
+    finally:
+        doc.close()
+
+
+def _extract_pdf_pages_parallel(
+    path: Path, page_count: int, workers: int
+) -> list[str] | None:
+    """Extract page parts across worker processes; None means use the serial path."""
+    chunk_size = max(1, -(-page_count // (workers * 4)))
+    ranges = [
+        (start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    try:
+        chunks = pdf_process_pool(workers).map(
+            _extract_pdf_page_range,
+            [str(path)] * len(ranges),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges],
+        )
+        return [part for chunk in chunks for part in chunk]
+    except BrokenProcessPool as exc:
+        log_exception("document_io", exc)
+        close_pdf_process_pool()
+        return None
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return None
+
+
+def _extract_pdf_page_range(path: str, start: int, stop: int) -> list[str]:
+    import fitz
+
+    doc = fitz.open(path)
+    try:
+        return [
+            _pdf_page_part(idx + 1, doc.load_page(idx).get_text("text"))
+            for idx in range(start, stop)
+        ]
+    finally:
+        doc.close()
+
+
+def _iter_pdf_markdown(path: Path, settings: DocumentSettings) -> Iterator[str]:
+    """Yield the same Markdown as a full _read_pdf, one page part at a time.
+
+    Worker processes, when enabled, extract page ranges ahead of the writer;
+    only the ranges not yet written are held in memory.
+    """
+    doc, failure = _open_pdf(path)
+    if failure:
+        raise RuntimeError(failure.error)
+    try:
+        page_count = len(doc)
+        workers = min(settings.resolved_pdf_workers(), page_count)
+        next_page = 0
+        first = True
+        if workers > 1 and page_count >= settings.pdf_parallel_min_pages:
+            for parts in _iter_pdf_page_ranges_parallel(path, page_count, workers):
+                for part in parts:
+                    next_page += 1
+                    if part:
+                        yield part if first else f"\n\n{part}"
+                        first = False
+        for idx in range(next_page, page_count):
+            part = _pdf_page_part(idx + 1, doc.load_page(idx).get_text("text"))
+            if part:
+                yield part if first else f"\n\n{part}"
+                first = False
+    finally:
+        doc.close()
+
+
+def _iter_pdf_page_ranges_parallel(
+    path: Path, page_count: int, workers: int
+) -> Iterator[list[str]]:
+    """Yield page parts per range in page order; stops early if the pool fails.
+
+    The caller extracts whatever is left serially after a failure.
+    """
+    chunk_size = max(1, -(-page_count // (workers * 4)))
+    futures: list[Future[list[str]]] = []
+    try:
+        pool = pdf_process_pool(workers)
+        futures = [
+            pool.submit(
+                _extract_pdf_page_range, str(path), start, min(start + chunk_size, page_count)
+            )
+            for start in range(0, page_count, chunk_size)
+        ]
+        for future in futures:
+            yield future.result()
+    except CancelledError as exc:
+        # close_pdf_process_pool() ran because the conversion was cancelled.
+        raise ConversionCancelled(f"PDF extraction cancelled: {path.name}") from exc
+    except BrokenProcessPool as exc:
+        log_exception("document_io", exc)
+        close_pdf_process_pool()
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+class _PdfPageIndex:
+    """Rendered character length of each PDF page, filled in page order on demand.
+
+    Page parts are joined with a blank line, so the rendered text of page N
+    starts after the parts of every earlier page that had text.
+    """
+
+    def __init__(self, page_count: int, page_chars: Iterable[int] = ()) -> None:
+        self.page_count = page_count
+        self.page_chars = [int(value) for value in page_chars][:page_count]
+
+    @property
+    def complete(self) -> bool:
+        return len(self.page_chars) >= self.page_count
+
+    def known_chars(self) -> int:
+        text_pages = sum(1 for value in self.page_chars if value)
+        return sum(self.page_chars) + 2 * max(0, text_pages - 1)
+
+    def chunks(self) -> list[tuple[int, int, int]]:
+        """Return (page index, chunk start, chunk end) for indexed pages with text.
+
+        A chunk covers the page part plus the separator in front of it.
+        """
+        chunks: list[tuple[int, int, int]] = []
+        position = 0
+        for idx, chars in enumerate(self.page_chars):
+            if not chars:
+                continue
+            separator = 2 if chunks else 0
+            chunks.append((idx, position, position + separator + chars))
+            position += separator + chars
+        return chunks
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"page_count": self.page_count, "page_chars": self.page_chars}
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any] | None, page_count: int) -> "_PdfPageIndex":
+        if (
+            isinstance(payload, dict)
+            and payload.get("page_count") == page_count
+            and isinstance(payload.get("page_chars"), list)
+            and all(isinstance(value, int) for value in payload["page_chars"])
+        ):
+            return cls(page_count, payload["page_chars"])
+        return cls(page_count)
+
+
+def _pdf_toc_outline(path: Path, text: str) -> list[dict[str, Any]]:
+    """Map the PDF bookmarks onto the rendered text.
+
+    Each entry starts at its title within the target page when the title can
+    be found there, otherwise at the page marker.
+    """
+    doc, failure = _open_pdf(path)
+    if failure:
+        return []
+    try:
+        toc = doc.get_toc(simple=True)
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return []
+    finally:
+        doc.close()
+    markers = [
+        (int(match.group(1)), match.start())
+        for match in re.finditer(r"<!-- page:(\d+) -->", text)
+    ]
+    headings: list[dict[str, Any]] = []
+    for item in toc:
+        if len(item) < 3:
+            continue
+        level, title, page = int(item[0]), str(item[1]).strip(), int(item[2])
+        if not title:
+            continue
+        positions = [idx for idx, (number, _) in enumerate(markers) if number >= page]
+        if not positions:
+            continue
+        start = markers[positions[0]][1]
+        page_end = (
+            markers[positions[0] + 1][1] if positions[0] + 1 < len(markers) else len(text)
+        )
+        pattern = r"\s+".join(re.escape(word) for word in title.split())
+        found = re.compile(pattern, re.IGNORECASE).search(text, start, page_end)
+        offset = found.start() if found else start
+        if headings and offset < headings[-1]["offset"]:
+            offset = headings[-1]["offset"]
+        headings.append({"level": max(1, level), "title": title, "offset": offset})
+    return close_outline(headings, len(text))
+
+
+def _read_pdf_window(
+    path: Path,
+    *,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    cache: DocumentCache | None,
+) -> DocumentReadResult:
+    doc, failure = _open_pdf(path)
+    if failure:
+        return failure
+
+    try:
+        page_count = len(doc)
+        index_variant = str(DOCUMENT_READER_VERSION)
+        index = _PdfPageIndex.from_payload(
+            cache.get(path, kind="pdf-index", variant=index_variant) if cache else None,
+            page_count,
+        )
+        indexed_before = len(index.page_chars)
+        safe_offset = max(0, int(offset))
+        end = safe_offset + _window_limit(max_chars, length)
+        texts: dict[int, str] = {}
+        while not index.complete and index.known_chars() < end:
+            idx = len(index.page_chars)
+            part = _pdf_page_part(idx + 1, doc.load_page(idx).get_text("text"))
+            texts[idx] = part
+            index.page_chars.append(len(part))
+        if cache and len(index.page_chars) > indexed_before:
+            cache.put(path, index.to_payload(), kind="pdf-index", variant=index_variant)
+
+        metadata: dict[str, Any] = {"pages": page_count}
+        known_chars = index.known_chars()
+        if index.complete and known_chars == 0:
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format="pdf",
+                metadata=metadata,
+                error=_PDF_NO_TEXT_ERROR,
+            )
+        safe_offset = min(safe_offset, known_chars)
+        end = min(end, known_chars)
+        pieces: list[str] = []
+        base: int | None = None
+        for idx, chunk_start, chunk_end in index.chunks():
+            if chunk_end <= safe_offset or chunk_start >= end:
+                continue
+            if base is None:
+                base = chunk_start
+            part = texts.get(idx)
+            if part is None:
+                part = _pdf_page_part(idx + 1, doc.load_page(idx).get_text("text"))
+            pieces.append(part if chunk_start == 0 else f"\n\n{part}")
+        assembled = "".join(pieces)
+        base = base or 0
+        segment = assembled[safe_offset - base : end - base]
+        truncated = end < known_chars or not index.complete
+        if truncated and safe_offset == 0 and length is None and max_chars > 0:
+            segment = segment.rstrip() + "\n...[truncated]..."
+        if not index.complete:
+            metadata["indexed_pages"] = len(index.page_chars)
+        paging = {
+            "offset": safe_offset,
+            "returned": end - safe_offset,
+            "total_chars": known_chars if index.complete else None,
+            "next_offset": end if truncated else None,
+        }
+        return DocumentReadResult(
+            content=segment,
+            truncated=truncated,
+            format="pdf",
+            metadata={**metadata, **paging},
+        )
+    finally:
+        doc.close()
+
+
+def _read_pdf_pages(
     path: Path,
     *,
+    pages: str,
     max_chars: int,
     offset: int,
     length: int | None,
 ) -> DocumentReadResult:
-    try:
-        import fitz
-    except Exception as exc:  # noqa: BLE001
-        log_exception("document_io", exc)
-        return DocumentReadResult(
-            content="",
-            truncated=False,
-            format="pdf",
-            metadata={},
-            error=f"PDF read failed (missing PyMuPDF): {exc}",
-        )
-
-    try:
-        doc = fitz.open(str(path))
-    except Exception as exc:  # noqa: BLE001
-        log_exception("document_io", exc)
-        return DocumentReadResult(
-            content="",
-            truncated=False,
-            format="pdf",
-            metadata={},
-            error=f"PDF read failed: {exc}",
-        )
+    doc, failure = _open_pdf(path)
+    if failure:
+        return failure
 
     try:
-        parts: list[str] = []
-        pages_with_text = 0
-        for idx, page in enumerate(doc, start=1):
-            text = page.get_text("text").strip()
-            if text:
-                pages_with_text += 1
-                parts.append(f"<!-- page:{idx} -->\n\n{text}\n")
-        metadata = {"pages": len(doc)}
-        if pages_with_text == 0:
+        page_count = len(doc)
+        try:
+            selected = _parse_page_ranges(pages, page_count)
+        except ValueError as exc:
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format="pdf",
+                metadata={"pages": page_count},
+                error=str(exc),
+            )
+        parts = [
+            part
+            for part in (
+                _pdf_page_part(number, doc.load_page(number - 1).get_text("text"))
+                for number in selected
+            )
+            if part
+        ]
+        metadata = {"pages": page_count, "page_range": pages.strip()}
+        if not parts:
             return DocumentReadResult(
                 content="",
                 truncated=False,
                 format="pdf",
                 metadata=metadata,
-                error="Unsupported PDF: no extractable text (scanned PDF not supported).",
+                error=f"No extractable text on pages {pages.strip()}.",
             )
-        combined = "\n\n".join(parts).strip() + "\n"
         content, truncated, paging = _apply_size_limit(
-            combined,
+            "\n\n".join(parts),
             max_chars,
             offset=offset,
             length=length,
@@ -398,6 +1738,28 @@ def _read_pdf(
         doc.close()
 
 
+def _parse_page_ranges(spec: str, page_count: int) -> list[int]:
+    # Keys keep the first-seen order; a dict dedupes without a list scan per page.
+    selected: dict[int, None] = {}
+    for raw in spec.split(","):
+        item = raw.strip()
+        if not item:
+            continue
+        match = re.fullmatch(r"(\d+)\s*(?:-\s*(\d+))?", item)
+        if not match:
+            raise ValueError(f"Invalid page range: {item}")
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range: {item}")
+        if first > page_count:
+            raise ValueError(f"Page range {item} is outside the document ({page_count} pages).")
+        selected.update(dict.fromkeys(range(first, min(last, page_count) + 1)))
+    if not selected:
+        raise ValueError("Empty page range.")
+    return list(selected)
+
+
 def _read_xlsx(
     path: Path,
     *,
@@ -446,32 +1808,11 @@ def _read_xlsx(
                     metadata={"sheets": sheetnames},
                     error=f"Sheet not found: {sheet}",
                 )
-            ws = workbook[sheet_name]
-            total_rows = int(ws.max_row or 0)
-            total_cols = int(ws.max_column or 0)
-            if total_rows == 0 or total_cols == 0:
-                table, meta = _sheet_to_markdown_table(
-                    [],
-                    total_rows=total_rows,
-                    total_cols=total_cols,
-                    max_rows=DEFAULT_XLSX_MAX_ROWS,
-                    max_cols=DEFAULT_XLSX_MAX_COLS,
-                )
-            else:
-                capped_rows = min(total_rows, DEFAULT_XLSX_MAX_ROWS)
-                capped_cols = min(total_cols, DEFAULT_XLSX_MAX_COLS)
-                table, meta = _sheet_to_markdown_table(
-                    ws.iter_rows(
-                        min_row=1,
-                        max_row=capped_rows,
-                        max_col=capped_cols,
-                        values_only=True,
-                    ),
-                    total_rows=total_rows,
-                    total_cols=total_cols,
-                    max_rows=DEFAULT_XLSX_MAX_ROWS,
-                    max_cols=DEFAULT_XLSX_MAX_COLS,
-                )
+            table, meta = _openpyxl_sheet_to_markdown(
+                workbook[sheet_name],
+                max_rows=DEFAULT_XLSX_MAX_ROWS,
+                max_cols=DEFAULT_XLSX_MAX_COLS,
+            )
             metadata = {"sheet": sheet_name, **meta}
             content, truncated, paging = _apply_size_limit(
                 table,
@@ -496,32 +1837,11 @@ def _read_xlsx(
         sections = [f"# {path.stem}"]
         sheets_meta: list[dict[str, Any]] = []
         for sheet_name in sheetnames:
-            ws = workbook[sheet_name]
-            total_rows = int(ws.max_row or 0)
-            total_cols = int(ws.max_column or 0)
-            if total_rows == 0 or total_cols == 0:
-                table, meta = _sheet_to_markdown_table(
-                    [],
-                    total_rows=total_rows,
-                    total_cols=total_cols,
-                    max_rows=DEFAULT_XLSX_MAX_ROWS,
-                    max_cols=DEFAULT_XLSX_MAX_COLS,
-                )
-            else:
-                capped_rows = min(total_rows, DEFAULT_XLSX_MAX_ROWS)
-                capped_cols = min(total_cols, DEFAULT_XLSX_MAX_COLS)
-                table, meta = _sheet_to_markdown_table(
-                    ws.iter_rows(
-                        min_row=1,
-                        max_row=capped_rows,
-                        max_col=capped_cols,
-                        values_only=True,
-                    ),
-                    total_rows=total_rows,
-                    total_cols=total_cols,
-                    max_rows=DEFAULT_XLSX_MAX_ROWS,
-                    max_cols=DEFAULT_XLSX_MAX_COLS,
-                )
+            table, meta = _openpyxl_sheet_to_markdown(
+                workbook[sheet_name],
+                max_rows=DEFAULT_XLSX_MAX_ROWS,
+                max_cols=DEFAULT_XLSX_MAX_COLS,
+            )
             sheets_meta.append({"name": sheet_name, **meta})
             sections.append(f"## {sheet_name}")
             sections.append(table)
@@ -546,6 +1866,113 @@ def _read_xlsx(
             pass
 
 
+def _openpyxl_sheet_to_markdown(
+    ws: Any,
+    *,
+    max_rows: int,
+    max_cols: int,
+) -> tuple[str, dict[str, Any]]:
+    total_rows = int(ws.max_row or 0)
+    total_cols = int(ws.max_column or 0)
+    if total_rows and total_cols:
+        # Read-only worksheets take their size from <dimension>, so only the
+        # capped window is ever parsed.
+        return _sheet_to_markdown_table(
+            ws.iter_rows(
+                min_row=1,
+                max_row=min(total_rows, max_rows),
+                max_col=min(total_cols, max_cols),
+                values_only=True,
+            ),
+            total_rows=total_rows,
+            total_cols=total_cols,
+            max_rows=max_rows,
+            max_cols=max_cols,
+        )
+    # No <dimension>: stream every row to learn the size, keeping only the
+    # capped window.
+    rows: list[list[object | None]] = []
+    total_rows = 0
+    total_cols = 0
+    for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+        total_rows = row_idx
+        total_cols = max(total_cols, len(row))
+        if row_idx <= max_rows:
+            rows.append(list(row[:max_cols]))
+    return _sheet_to_markdown_table(
+        rows,
+        total_rows=total_rows,
+        total_cols=total_cols,
+        max_rows=max_rows,
+        max_cols=max_cols,
+    )
+
+
+def _iter_xlsx_markdown(path: Path) -> Iterator[str]:
+    """Yield every row of every sheet as Markdown tables, a batch of rows at a time.
+
+    Unlike read_document, which previews the first rows of each sheet, this
+    converts whole sheets; rows are streamed from a read-only workbook so
+    memory stays flat however large the sheets are.
+    """
+    try:
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        # The XML fallback reader only renders previews; keep its output.
+        result = read_document(path, max_chars=0)
+        if result.error:
+            raise RuntimeError(result.error) from exc
+        yield result.content
+        return
+    try:
+        if not workbook.sheetnames:
+            raise RuntimeError("No sheets found in XLSX.")
+        yield f"# {path.stem}"
+        for sheet_name in workbook.sheetnames:
+            yield f"\n\n## {sheet_name}\n\n"
+            yield from _iter_openpyxl_sheet_markdown(workbook[sheet_name])
+    finally:
+        try:
+            workbook.close()
+        except Exception as exc:
+            log_exception("document_io", exc)
+
+
+def _iter_openpyxl_sheet_markdown(ws: Any) -> Iterator[str]:
+    width = int(ws.max_column or 0)
+    if not width:
+        # No <dimension>: one streaming pass to find the widest row.
+        width = max((len(row) for row in ws.iter_rows(values_only=True)), default=0)
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None or not width:
+        yield "(empty sheet)"
+        return
+
+    def line(row: Iterable[object | None]) -> str:
+        cells = list(row)[:width]
+        cells.extend([None] * (width - len(cells)))
+        return "| " + " | ".join(_cell_to_str(cell) for cell in cells) + " |"
+
+    if not any(_cell_to_str(cell) for cell in header):
+        header = tuple(_excel_col_name(idx + 1) for idx in range(width))
+    yield line(header) + "\n| " + " | ".join(["---"] * width) + " |"
+    batch: list[str] = []
+    for row in rows:
+        batch.append(line(row))
+        if len(batch) >= _XLSX_STREAM_BATCH_ROWS:
+            yield "\n" + "\n".join(batch)
+            batch = []
+    if batch:
+        yield "\n" + "\n".join(batch)
+
+
+_XLSX_STREAM_BATCH_ROWS = 1000
+
+
 def _read_xlsx_xml(
     path: Path,
     *,
@@ -567,7 +1994,7 @@ def _read_xlsx_xml(
                     error="No sheets found in XLSX.",
                 )
             sheetnames = [name for name, _ in sheet_info]
-            shared_strings = _xlsx_shared_strings(zf)
+            shared_strings = _XlsxSharedStrings(zf)
             if sheet:
                 sheet_name, sheet_path = _xlsx_select_sheet(sheet_info, sheet)
                 if not sheet_name:
@@ -600,11 +2027,25 @@ def _read_xlsx_xml(
                 )
             sections = [f"# {path.stem}"]
             sheets_meta: list[dict[str, Any]] = []
-            for sheet_name, sheet_path in sheet_info:
-                table, meta = _xlsx_sheet_to_markdown(
+            windows = [
+                _xlsx_sheet_window(
                     zf,
                     sheet_path,
+                    max_rows=DEFAULT_XLSX_MAX_ROWS,
+                    max_cols=DEFAULT_XLSX_MAX_COLS,
+                )
+                for _, sheet_path in sheet_info
+            ]
+            # One pass over sharedStrings.xml covers every sheet window.
+            shared_strings.resolve(
+                index for window in windows for index in _xlsx_window_refs(window[0])
+            )
+            for (sheet_name, _), (rows, total_rows, total_cols) in zip(sheet_info, windows):
+                table, meta = _xlsx_window_to_markdown(
+                    rows,
                     shared_strings,
+                    total_rows=total_rows,
+                    total_cols=total_cols,
                     max_rows=DEFAULT_XLSX_MAX_ROWS,
                     max_cols=DEFAULT_XLSX_MAX_COLS,
                 )
@@ -636,6 +2077,382 @@ def _read_xlsx_xml(
         )
 
 
+@dataclass
+class _SheetRowPage:
+    header: list[object | None]
+    rows: list[list[object | None]]
+    columns: list[int]
+    total_rows: int | None
+    total_cols: int | None
+    has_more: bool
+
+
+def _read_xlsx_rows(
+    path: Path,
+    *,
+    sheet: str | None,
+    row_offset: int,
+    row_limit: int | None,
+    columns: str | None,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+) -> DocumentReadResult:
+    """Read one window of data rows from a sheet, repeating the header row.
+
+    Row 1 is treated as the header; row_offset counts data rows after it.
+    Rows are streamed from the top of the sheet and reading stops after the
+    window. Rows before the window are skipped without decoding their cells,
+    but they are still parsed, so a page costs more the deeper it lies.
+    """
+    row_offset = max(0, int(row_offset))
+    if row_limit is None or row_limit <= 0:
+        row_limit = DEFAULT_XLSX_MAX_ROWS
+    row_limit = min(int(row_limit), MAX_XLSX_ROW_LIMIT)
+    try:
+        wanted_cols = _parse_column_spec(columns) if columns else None
+    except ValueError as exc:
+        return DocumentReadResult(
+            content="",
+            truncated=False,
+            format="xlsx",
+            metadata={},
+            error=str(exc),
+        )
+    first_row = 2 + row_offset
+    last_row = first_row + row_limit - 1
+    try:
+        import openpyxl
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return DocumentReadResult(
+            content="",
+            truncated=False,
+            format="xlsx",
+            metadata={},
+            error=f"XLSX read failed (missing openpyxl): {exc}",
+        )
+    try:
+        workbook = openpyxl.load_workbook(
+            path,
+            read_only=True,
+            data_only=True,
+            keep_links=False,
+        )
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return _read_xlsx_rows_xml(
+            path,
+            sheet=sheet,
+            first_row=first_row,
+            last_row=last_row,
+            columns=wanted_cols,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+            error_context=exc,
+        )
+    try:
+        sheetnames = workbook.sheetnames
+        sheet_name = _select_sheet(sheetnames, sheet)
+        if not sheet_name:
+            return DocumentReadResult(
+                content="",
+                truncated=False,
+                format="xlsx",
+                metadata={"sheets": sheetnames},
+                error=f"Sheet not found: {sheet}" if sheet else "No sheets found in XLSX.",
+            )
+        page = _openpyxl_row_page(
+            workbook[sheet_name],
+            first_row=first_row,
+            last_row=last_row,
+            columns=wanted_cols,
+        )
+        return _row_page_result(
+            page,
+            sheet_name=sheet_name,
+            row_offset=row_offset,
+            max_chars=max_chars,
+            offset=offset,
+            length=length,
+        )
+    finally:
+        try:
+            workbook.close()
+        except Exception as exc:
+            log_exception("document_io", exc)
+
+
+def _read_xlsx_rows_xml(
+    path: Path,
+    *,
+    sheet: str | None,
+    first_row: int,
+    last_row: int,
+    columns: list[int] | None,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+    error_context: Exception | None = None,
+) -> DocumentReadResult:
+    try:
+        with zipfile.ZipFile(path) as zf:
+            sheet_info = _xlsx_sheet_info(zf)
+            if not sheet_info:
+                return DocumentReadResult(
+                    content="",
+                    truncated=False,
+                    format="xlsx",
+                    metadata={},
+                    error="No sheets found in XLSX.",
+                )
+            if sheet:
+                sheet_name, sheet_path = _xlsx_select_sheet(sheet_info, sheet)
+            else:
+                sheet_name, sheet_path = sheet_info[0]
+            if not sheet_name or not sheet_path:
+                return DocumentReadResult(
+                    content="",
+                    truncated=False,
+                    format="xlsx",
+                    metadata={"sheets": [name for name, _ in sheet_info]},
+                    error=f"Sheet not found: {sheet}",
+                )
+            page = _xlsx_row_page(
+                zf,
+                sheet_path,
+                _XlsxSharedStrings(zf),
+                first_row=first_row,
+                last_row=last_row,
+                columns=columns,
+            )
+            return _row_page_result(
+                page,
+                sheet_name=sheet_name,
+                row_offset=first_row - 2,
+                max_chars=max_chars,
+                offset=offset,
+                length=length,
+            )
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        hint = f"{error_context}; " if error_context else ""
+        return DocumentReadResult(
+            content="",
+            truncated=False,
+            format="xlsx",
+            metadata={},
+            error=f"XLSX read failed: {hint}{exc}",
+        )
+
+
+def _openpyxl_row_page(
+    ws: Any,
+    *,
+    first_row: int,
+    last_row: int,
+    columns: list[int] | None,
+) -> _SheetRowPage:
+    total_rows = int(ws.max_row or 0) or None
+    total_cols = int(ws.max_column or 0) or None
+    if columns:
+        fetch_cols: int | None = max(columns)
+    elif total_cols:
+        fetch_cols = min(total_cols, DEFAULT_XLSX_MAX_COLS)
+    else:
+        fetch_cols = None
+    header = list(
+        next(
+            ws.iter_rows(min_row=1, max_row=1, max_col=fetch_cols, values_only=True),
+            (),
+        )
+    )
+    # Without <dimension> one extra row tells whether another page exists.
+    probe_row = last_row if total_rows else last_row + 1
+    rows = [
+        list(row)
+        for row in ws.iter_rows(
+            min_row=first_row, max_row=probe_row, max_col=fetch_cols, values_only=True
+        )
+    ]
+    limit = last_row - first_row + 1
+    has_more = total_rows > last_row if total_rows else len(rows) > limit
+    rows = rows[:limit]
+    if not columns:
+        width = max([len(header), *(len(row) for row in rows)])
+        columns = list(range(1, min(width, DEFAULT_XLSX_MAX_COLS) + 1))
+    return _SheetRowPage(
+        header=_pick_columns(header, columns),
+        rows=[_pick_columns(row, columns) for row in rows],
+        columns=columns,
+        total_rows=total_rows,
+        total_cols=total_cols,
+        has_more=has_more,
+    )
+
+
+def _xlsx_row_page(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    shared_strings: _XlsxSharedStrings,
+    *,
+    first_row: int,
+    last_row: int,
+    columns: list[int] | None,
+) -> _SheetRowPage:
+    wanted = set(columns) if columns else None
+    dimension: tuple[int, int] | None = None
+    kept: dict[int, dict[int, object | None]] = {}
+    max_col = 0
+    has_more = False
+    with zf.open(sheet_path) as handle:
+        sheet_data: ET.Element | None = None
+        row_idx = 0
+        for event, elem in ET.iterparse(handle, events=("start", "end")):
+            tag = _xlsx_strip_ns(elem.tag)
+            if event == "start":
+                if tag == "sheetData":
+                    sheet_data = elem
+                continue
+            if tag == "dimension":
+                dimension = _xlsx_dimension(elem.attrib.get("ref"))
+                continue
+            if tag != "row":
+                continue
+            row_idx_raw = elem.attrib.get("r")
+            if row_idx_raw and row_idx_raw.isdigit():
+                row_idx = int(row_idx_raw)
+            else:
+                row_idx += 1
+            if row_idx > last_row:
+                has_more = True
+                break
+            if row_idx == 1 or row_idx >= first_row:
+                values: dict[int, object | None] = {}
+                for cell in elem:
+                    col_idx = _xlsx_cell_column(cell)
+                    if col_idx <= 0:
+                        continue
+                    max_col = max(max_col, col_idx)
+                    if wanted is not None and col_idx not in wanted:
+                        continue
+                    if wanted is None and col_idx > DEFAULT_XLSX_MAX_COLS:
+                        continue
+                    values[col_idx] = _xlsx_cell_value(cell)
+                kept[row_idx] = values
+            elem.clear()
+            if sheet_data is not None:
+                sheet_data.clear()
+    if dimension:
+        has_more = dimension[0] > last_row
+        max_col = max(max_col, dimension[1])
+    if not columns:
+        columns = list(range(1, min(max_col, DEFAULT_XLSX_MAX_COLS) + 1))
+    body_indices = [idx for idx in kept if idx >= first_row]
+    end_row = max(body_indices) if body_indices else first_row - 1
+    raw_rows = [
+        [kept.get(idx, {}).get(col) for col in columns]
+        for idx in range(first_row, end_row + 1)
+    ]
+    header = [kept.get(1, {}).get(col) for col in columns]
+    shared_strings.resolve(_xlsx_window_refs([header, *raw_rows]))
+
+    def resolve(row: list[object | None]) -> list[object | None]:
+        return [
+            shared_strings.get(value.index)
+            if isinstance(value, _XlsxSharedStringRef)
+            else value
+            for value in row
+        ]
+
+    return _SheetRowPage(
+        header=resolve(header),
+        rows=[resolve(row) for row in raw_rows],
+        columns=columns,
+        total_rows=dimension[0] if dimension else None,
+        total_cols=dimension[1] if dimension else None,
+        has_more=has_more,
+    )
+
+
+def _pick_columns(row: list[object | None], columns: list[int]) -> list[object | None]:
+    return [row[col - 1] if col <= len(row) else None for col in columns]
+
+
+def _row_page_result(
+    page: _SheetRowPage,
+    *,
+    sheet_name: str,
+    row_offset: int,
+    max_chars: int,
+    offset: int,
+    length: int | None,
+) -> DocumentReadResult:
+    labels = [_excel_col_name(col) for col in page.columns]
+    header = page.header
+    if not any(_cell_to_str(cell) for cell in header):
+        header = list(labels)
+    next_row_offset = row_offset + len(page.rows) if page.has_more else None
+    if page.columns:
+        lines = [
+            "| " + " | ".join(_cell_to_str(cell) for cell in header) + " |",
+            "| " + " | ".join(["---"] * len(page.columns)) + " |",
+        ]
+        for row in page.rows:
+            lines.append("| " + " | ".join(_cell_to_str(cell) for cell in row) + " |")
+    else:
+        lines = ["(empty sheet)"]
+    if not page.rows:
+        lines.append(f"\n[No rows at row_offset {row_offset}]")
+    elif next_row_offset is not None:
+        lines.append(
+            f"\n[Rows {row_offset + 1}-{row_offset + len(page.rows)}; "
+            f"next row_offset={next_row_offset}]"
+        )
+    content, truncated, paging = _apply_size_limit(
+        "\n".join(lines),
+        max_chars,
+        offset=offset,
+        length=length,
+    )
+    metadata = {
+        "sheet": sheet_name,
+        "rows": page.total_rows,
+        "cols": page.total_cols,
+        "columns": labels,
+        "row_offset": row_offset,
+        "returned_rows": len(page.rows),
+        "next_row_offset": next_row_offset,
+    }
+    return DocumentReadResult(
+        content=content,
+        truncated=truncated,
+        format="xlsx",
+        metadata={**metadata, **paging},
+    )
+
+
+def _parse_column_spec(spec: str) -> list[int]:
+    # Keys keep the first-seen order; a dict dedupes without a list scan per column.
+    selected: dict[int, None] = {}
+    for raw in spec.split(","):
+        item = raw.strip()
+        if not item:
+            continue
+        match = re.fullmatch(r"([A-Za-z]{1,3})\s*(?:[:-]\s*([A-Za-z]{1,3}))?", item)
+        if not match:
+            raise ValueError(f"Invalid column range: {item}")
+        first = _excel_col_index(match.group(1))
+        last = _excel_col_index(match.group(2) or match.group(1))
+        if last < first:
+            raise ValueError(f"Invalid column range: {item}")
+        selected.update(dict.fromkeys(range(first, last + 1)))
+    if not selected:
+        raise ValueError("Empty column selection.")
+    return list(selected)
+
+
 def _sheet_to_markdown_table(
     rows: Iterable[Iterable[object | None]],
     *,
@@ -774,27 +2591,58 @@ def _xlsx_select_sheet(
     return None, None
 
 
-def _xlsx_shared_strings(zf: zipfile.ZipFile) -> list[str]:
-    try:
-        data = zf.read("xl/sharedStrings.xml")
-    except KeyError:
-        return []
-    root = ET.fromstring(data)
-    strings: list[str] = []
-    for si in root.iter():
-        if _xlsx_strip_ns(si.tag) != "si":
-            continue
-        parts: list[str] = []
-        for node in si.iter():
-            if _xlsx_strip_ns(node.tag) == "t":
-                parts.append(node.text or "")
-        strings.append("".join(parts))
-    return strings
+@dataclass(frozen=True)
+class _XlsxSharedStringRef:
+    index: int
+
+
+class _XlsxSharedStrings:
+    """Shared-strings table that decodes only the indices a rendered window uses.
+
+    sharedStrings.xml is streamed on resolve() and parsing stops at the highest
+    requested index, so memory follows the rendered window, not the workbook.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile) -> None:
+        self._zf = zf
+        self._values: dict[int, str] = {}
+
+    def resolve(self, indices: Iterable[int]) -> None:
+        wanted = {idx for idx in indices if idx >= 0 and idx not in self._values}
+        if not wanted:
+            return
+        last = max(wanted)
+        try:
+            handle = self._zf.open("xl/sharedStrings.xml")
+        except KeyError:
+            return
+        with handle:
+            root: ET.Element | None = None
+            position = 0
+            for event, elem in ET.iterparse(handle, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    continue
+                if _xlsx_strip_ns(elem.tag) != "si":
+                    continue
+                if position in wanted:
+                    self._values[position] = "".join(
+                        node.text or ""
+                        for node in elem.iter()
+                        if _xlsx_strip_ns(node.tag) == "t"
+                    )
+                position += 1
+                if root is not None:
+                    root.clear()
+                if position > last:
+                    break
+
+    def get(self, index: int) -> str:
+        return self._values.get(index, "")
 
 
-def _xlsx_cell_value(
-    cell: ET.Element, shared_strings: list[str]
-) -> object | None:
+def _xlsx_cell_value(cell: ET.Element) -> object | None:
     cell_type = cell.attrib.get("t")
     v_text = None
     inline_parts: list[str] = []
@@ -815,9 +2663,9 @@ def _xlsx_cell_value(
             idx = int(v_text)
         except ValueError:
             return ""
-        if 0 <= idx < len(shared_strings):
-            return shared_strings[idx]
-        return ""
+        if idx < 0:
+            return ""
+        return _XlsxSharedStringRef(idx)
     if cell_type == "b":
         if v_text is None:
             return ""
@@ -830,63 +2678,153 @@ def _xlsx_cell_value(
 def _xlsx_sheet_to_markdown(
     zf: zipfile.ZipFile,
     sheet_path: str,
-    shared_strings: list[str],
+    shared_strings: _XlsxSharedStrings,
+    *,
+    max_rows: int,
+    max_cols: int,
+) -> tuple[str, dict[str, Any]]:
+    rows, total_rows, total_cols = _xlsx_sheet_window(
+        zf, sheet_path, max_rows=max_rows, max_cols=max_cols
+    )
+    shared_strings.resolve(_xlsx_window_refs(rows))
+    return _xlsx_window_to_markdown(
+        rows,
+        shared_strings,
+        total_rows=total_rows,
+        total_cols=total_cols,
+        max_rows=max_rows,
+        max_cols=max_cols,
+    )
+
+
+def _xlsx_window_refs(rows: list[list[object | None]]) -> Iterable[int]:
+    for row in rows:
+        for value in row:
+            if isinstance(value, _XlsxSharedStringRef):
+                yield value.index
+
+
+def _xlsx_window_to_markdown(
+    rows: list[list[object | None]],
+    shared_strings: _XlsxSharedStrings,
     *,
+    total_rows: int,
+    total_cols: int,
     max_rows: int,
     max_cols: int,
 ) -> tuple[str, dict[str, Any]]:
-    data = zf.read(sheet_path)
+    resolved = [
+        [
+            shared_strings.get(value.index)
+            if isinstance(value, _XlsxSharedStringRef)
+            else value
+            for value in row
+        ]
+        for row in rows
+    ]
+    return _sheet_to_markdown_table(
+        resolved,
+        total_rows=total_rows,
+        total_cols=total_cols,
+        max_rows=max_rows,
+        max_cols=max_cols,
+    )
+
+
+def _xlsx_sheet_window(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    *,
+    max_rows: int,
+    max_cols: int,
+) -> tuple[list[list[object | None]], int, int]:
+    """Stream a sheet and return (capped rows, total rows, total cols).
+
+    Shared-string cells are left as _XlsxSharedStringRef placeholders.
+    """
     max_row = 0
     max_col = 0
+    dimension: tuple[int, int] | None = None
     row_cache: list[dict[int, object | None]] = []
-    with io.BytesIO(data) as handle:
-        for _, elem in ET.iterparse(handle, events=("end",)):
-            if _xlsx_strip_ns(elem.tag) != "row":
+    with zf.open(sheet_path) as handle:
+        sheet_data: ET.Element | None = None
+        for event, elem in ET.iterparse(handle, events=("start", "end")):
+            tag = _xlsx_strip_ns(elem.tag)
+            if event == "start":
+                if tag == "sheetData":
+                    sheet_data = elem
+                continue
+            if tag == "dimension":
+                dimension = _xlsx_dimension(elem.attrib.get("ref"))
+                continue
+            if tag != "row":
                 continue
             row_idx_raw = elem.attrib.get("r")
             row_idx = int(row_idx_raw) if row_idx_raw and row_idx_raw.isdigit() else 0
             if row_idx == 0:
                 row_idx = max_row + 1
+            if row_idx > max_rows and dimension:
+                # Everything past the cap is only counted; <dimension> already
+                # has the totals, so stop reading here.
+                max_row = max(max_row, row_idx, dimension[0])
+                max_col = max(max_col, dimension[1])
+                break
             max_row = max(max_row, row_idx)
-            row_values: dict[int, object | None] = {}
-            for cell in elem:
-                if _xlsx_strip_ns(cell.tag) != "c":
-                    continue
-                ref = cell.attrib.get("r")
-                if not ref:
-                    continue
-                match = re.match(r"([A-Z]+)", ref)
-                if not match:
-                    continue
-                col_idx = _excel_col_index(match.group(1))
-                if col_idx <= 0:
-                    continue
-                max_col = max(max_col, col_idx)
-                if row_idx <= max_rows and col_idx <= max_cols:
-                    row_values[col_idx] = _xlsx_cell_value(cell, shared_strings)
             if row_idx <= max_rows:
+                row_values: dict[int, object | None] = {}
+                for cell in elem:
+                    col_idx = _xlsx_cell_column(cell)
+                    if col_idx <= 0:
+                        continue
+                    max_col = max(max_col, col_idx)
+                    if col_idx <= max_cols:
+                        row_values[col_idx] = _xlsx_cell_value(cell)
                 row_cache.append(row_values)
+            else:
+                cells = [cell for cell in elem if _xlsx_strip_ns(cell.tag) == "c"]
+                if cells:
+                    max_col = max(max_col, _xlsx_cell_column(cells[-1]))
             elem.clear()
+            if sheet_data is not None:
+                sheet_data.clear()
     if max_row == 0 or max_col == 0:
-        return _sheet_to_markdown_table(
-            [],
-            total_rows=max_row,
-            total_cols=max_col,
-            max_rows=max_rows,
-            max_cols=max_cols,
-        )
+        return [], max_row, max_col
     capped_cols = min(max_col, max_cols)
-    rows: list[list[object | None]] = []
-    for row_values in row_cache:
-        row = [row_values.get(idx) for idx in range(1, capped_cols + 1)]
-        rows.append(row)
-    return _sheet_to_markdown_table(
-        rows,
-        total_rows=max_row,
-        total_cols=max_col,
-        max_rows=max_rows,
-        max_cols=max_cols,
-    )
+    rows = [
+        [row_values.get(idx) for idx in range(1, capped_cols + 1)]
+        for row_values in row_cache
+    ]
+    return rows, max_row, max_col
+
+
+def _xlsx_cell_column(cell: ET.Element) -> int:
+    if _xlsx_strip_ns(cell.tag) != "c":
+        return 0
+    ref = cell.attrib.get("r")
+    if not ref:
+        return 0
+    match = re.match(r"([A-Z]+)", ref)
+    if not match:
+        return 0
+    return _excel_col_index(match.group(1))
+
+
+def _xlsx_dimension(ref: str | None) -> tuple[int, int] | None:
+    if not ref:
+        return None
+    last = ref.split(":")[-1].replace("$", "")
+    match = re.fullmatch(r"([A-Za-z]+)(\d+)", last.strip())
+    if not match:
+        return None
+    rows = int(match.group(2))
+    cols = _excel_col_index(match.group(1))
+    if rows <= 0 or cols <= 0:
+        return None
+    return rows, cols
+
+
+def _window_limit(max_chars: int, length: int | None) -> int:
+    return int(length) if length is not None else int(max_chars)
 
 
 def _apply_size_limit(
@@ -1123,18 +3061,45 @@ def _format_pandoc_attrs(attrs: dict[str, str]) -> str:
 
 
 def _markdown_to_docx(
-    md_path: Path, *, output_path: Path, workspace_root: Path | None = None
+    md_path: Path,
+    *,
+    output_path: Path,
+    workspace_root: Path | None = None,
+    settings: DocumentSettings | None = None,
 ) -> None:
     _ensure_pandoc_available()
     import pypandoc
 
     md_text = md_path.read_text(encoding="utf-8", errors="replace")
     normalized, _ = _normalize_markdown_for_docx(md_text)
+    prepare_image = _export_image_preparer(workspace_root, settings)
+    if prepare_image:
+        normalized = _prepare_markdown_images(
+            normalized, md_path.parent, workspace_root, prepare_image
+        )
     resource_paths = [md_path.parent.resolve()]
     if workspace_root:
         root_resolved = workspace_root.resolve()
         if root_resolved not in resource_paths:
             resource_paths.append(root_resolved)
+    source_format = (
+        "markdown+raw_html+link_attributes+pipe_tables"
+        "+multiline_tables+grid_tables+fenced_code_blocks"
+    )
+    served = None
+    if (settings or DocumentSettings()).pandoc_backend == PANDOC_BACKEND_SERVER:
+        served_text, files = _pandoc_resource_files(normalized, resource_paths)
+        served = _convert_with_pandoc_server(
+            settings,
+            served_text,
+            from_format=source_format,
+            to="docx",
+            options={"standalone": True, "highlight-style": "tango"},
+            files=files,
+        )
+    if isinstance(served, bytes):
+        output_path.write_bytes(served)
+        return
     resource_arg = f"--resource-path={os.pathsep.join(str(p) for p in resource_paths)}"
     extra_args = ["--standalone", resource_arg, "--highlight-style=tango"]
     with tempfile.TemporaryDirectory() as tmp:
@@ -1143,15 +3108,87 @@ def _markdown_to_docx(
         pypandoc.convert_file(
             str(tmp_md),
             to="docx",
-            format=(
-                "markdown+raw_html+link_attributes+pipe_tables"
-                "+multiline_tables+grid_tables+fenced_code_blocks"
-            ),
+            format=source_format,
             outputfile=str(output_path),
             extra_args=extra_args,
         )
 
 
+def _pandoc_resource_files(
+    md_text: str, resource_paths: list[Path]
+) -> tuple[str, dict[str, bytes]]:
+    """Resolve local image targets the way --resource-path would, for the pandoc server.
+
+    Targets are rewritten to absolute paths and returned with their bytes, since
+    the server cannot read files itself.
+    """
+    files: dict[str, bytes] = {}
+
+    def replace(match: re.Match[str]) -> str:
+        raw = match.group(2)
+        src = _normalize_image_src(raw[1:-1] if raw.startswith("<") else raw)
+        if src is None:
+            return match.group(0)
+        path = Path(unquote(src))
+        candidates = [path] if path.is_absolute() else [base / path for base in resource_paths]
+        for candidate in candidates:
+            if not candidate.is_file():
+                continue
+            key = candidate.resolve().as_posix()
+            if key not in files:
+                files[key] = candidate.read_bytes()
+            target = f"<{key}>" if re.search(r"[\s()<>]", key) else key
+            return f"{match.group(1)}{target}"
+        return match.group(0)
+
+    return _MD_IMAGE_TARGET.sub(replace, md_text), files
+
+
+def _export_image_preparer(
+    workspace_root: Path | None, settings: DocumentSettings | None
+) -> Callable[[Path], Path] | None:
+    settings = settings or DocumentSettings()
+    if workspace_root is None or settings.image_dpi <= 0 or settings.cache_max_mb <= 0:
+        # Prepared images only exist in the cache, so no cache means original images.
+        return None
+    return functools.partial(
+        prepare_export_image,
+        cache=ArtifactCache(
+            DogentPaths(workspace_root).image_cache_dir,
+            max_bytes=settings.cache_max_mb * 1024 * 1024,
+        ),
+        dpi=settings.image_dpi,
+        quality=settings.image_quality,
+    )
+
+
+def _prepare_markdown_images(
+    md_text: str,
+    base_dir: Path,
+    workspace_root: Path | None,
+    prepare_image: Callable[[Path], Path],
+) -> str:
+    """Point Markdown image targets inside the workspace at their export-sized copies."""
+
+    def replace(match: re.Match[str]) -> str:
+        raw = match.group(2)
+        src = raw[1:-1] if raw.startswith("<") else raw
+        path = _resolve_local_image(src, base_dir, workspace_root)
+        if path is None and workspace_root is not None:
+            path = _resolve_local_image(src, workspace_root, workspace_root)
+        if path is None:
+            return match.group(0)
+        prepared = prepare_image(path)
+        if prepared == path:
+            return match.group(0)
+        target = prepared.as_posix()
+        if re.search(r"[\s()<>]", target):
+            target = f"<{target}>"
+        return f"{match.group(1)}{target}"
+
+    return _MD_IMAGE_TARGET.sub(replace, md_text)
+
+
 def _default_pdf_css() -> str:
     return read_config_text(PDF_STYLE_FILENAME)
 
@@ -1204,14 +3241,9 @@ def _build_pdf_header_footer(css_text: str) -> tuple[str | None, str | None]:
     return None, footer
 
 
-def _markdown_to_html(
-    md_text: str,
-    *,
-    title: str,
-    css_text: str | None = None,
-    base_path: Path | None = None,
-    workspace_root: Path | None = None,
-) -> str:
+@functools.lru_cache(maxsize=1)
+def _markdown_renderer() -> Any:
+    """Shared MarkdownIt instance; rendering keeps no state on it between calls."""
     from markdown_it import MarkdownIt
 
     mdi = MarkdownIt(
@@ -1223,27 +3255,68 @@ def _markdown_to_html(
         },
     ).enable("table").enable("strikethrough").enable("fence")
     try:
-        from pygments import highlight  # type: ignore
         from pygments.formatters import HtmlFormatter  # type: ignore
-        from pygments.lexers import TextLexer, get_lexer_by_name  # type: ignore
 
         formatter = HtmlFormatter(nowrap=True)
+    except Exception as exc:
+        log_exception("document_io", exc)
+        return mdi
+
+    def highlight_code(code: str, lang: str, _attrs: object | None = None) -> str:
+        return _highlight_cached(code, lang, formatter)
+
+    mdi.options["highlight"] = highlight_code
+    return mdi
 
-        def highlight_code(code: str, lang: str, _attrs: object | None = None) -> str:
-            try:
-                lexer = get_lexer_by_name(lang) if lang else TextLexer()
-            except Exception as exc:
-                log_exception("document_io", exc)
-                lexer = TextLexer()
-            return highlight(code, lexer, formatter)
 
-        mdi.options["highlight"] = highlight_code
+@functools.lru_cache(maxsize=256)
+def _pygments_lexer(lang: str) -> Any:
+    from pygments.lexers import TextLexer, get_lexer_by_name  # type: ignore
+
+    try:
+        return get_lexer_by_name(lang) if lang else TextLexer()
     except Exception as exc:
         log_exception("document_io", exc)
-        pass
+        return TextLexer()
+
+
+def _highlight_cached(code: str, lang: str, formatter: Any) -> str:
+    from pygments import highlight  # type: ignore
+
+    key = (lang, hashlib.sha1(code.encode("utf-8")).hexdigest())
+    with _HIGHLIGHT_LOCK:
+        cached = _HIGHLIGHT_CACHE.get(key)
+        if cached is not None:
+            _HIGHLIGHT_CACHE.move_to_end(key)
+            return cached
+    rendered = highlight(code, _pygments_lexer(lang), formatter)
+    with _HIGHLIGHT_LOCK:
+        _HIGHLIGHT_CACHE[key] = rendered
+        while len(_HIGHLIGHT_CACHE) > _HIGHLIGHT_CACHE_MAX_ENTRIES:
+            _HIGHLIGHT_CACHE.popitem(last=False)
+    return rendered
+
+
+def _markdown_to_html(
+    md_text: str,
+    *,
+    title: str,
+    css_text: str | None = None,
+    base_path: Path | None = None,
+    workspace_root: Path | None = None,
+    image_mode: str = IMAGE_MODE_INLINE,
+    prepare_image: Callable[[Path], Path] | None = None,
+) -> str:
+    mdi = _markdown_renderer()
     body = mdi.render(md_text)
     if base_path:
-        body = _inline_local_images(body, base_path, workspace_root)
+        body = _inline_local_images(
+            body,
+            base_path,
+            workspace_root,
+            image_mode=image_mode,
+            prepare_image=prepare_image,
+        )
     css = css_text if css_text is not None else _default_pdf_css()
     css = _ensure_page_break_css(css)
     base_tag = ""
@@ -1268,7 +3341,15 @@ def _inline_local_images(
     html: str,
     base_dir: Path,
     workspace_root: Path | None,
+    *,
+    image_mode: str = IMAGE_MODE_INLINE,
+    prepare_image: Callable[[Path], Path] | None = None,
 ) -> str:
+    """Point local <img> sources at workspace files, inlined or by file:// URL.
+
+    File URLs only load when the HTML itself is opened from a file:// URL.
+    Images outside the workspace are left untouched in either mode.
+    """
     img_pattern = re.compile(
         r'(<img\b[^>]*\bsrc=)(["\']?)([^"\'>\s]+)\2',
         re.IGNORECASE,
@@ -1276,7 +3357,15 @@ def _inline_local_images(
 
     def replace(match: re.Match[str]) -> str:
         prefix, quote, src = match.groups()
-        new_src = _to_data_uri(src, base_dir, workspace_root)
+        path = _resolve_local_image(src, base_dir, workspace_root)
+        if path is None:
+            return match.group(0)
+        if prepare_image:
+            path = prepare_image(path)
+        if image_mode == IMAGE_MODE_FILE:
+            new_src: str | None = path.as_uri()
+        else:
+            new_src = _DATA_URI_CACHE.get(path)
         if not new_src:
             return match.group(0)
         q = quote or '"'
@@ -1285,11 +3374,11 @@ def _inline_local_images(
     return img_pattern.sub(replace, html)
 
 
-def _to_data_uri(
+def _resolve_local_image(
     src: str,
     base_dir: Path,
     workspace_root: Path | None,
-) -> str | None:
+) -> Path | None:
     parsed = urlparse(src)
     if parsed.scheme in {"http", "https", "data", "file"}:
         return None
@@ -1307,11 +3396,70 @@ def _to_data_uri(
             return None
     if not path.exists() or not path.is_file():
         return None
-    mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
-    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
-    return f"data:{mime};base64,{encoded}"
+    return path
+
+
+class _DataUriCache:
+    """Encoded data URIs for local images, keyed by (path, mtime, size).
+
+    Files with identical bytes share one encoded string. The total size of the
+    encoded strings is capped, and the least recently used files are evicted.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._uris: dict[str, tuple[str, int]] = {}
+        self._bytes = 0
+
+    def get(self, path: Path) -> str | None:
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            log_exception("document_io", exc)
+            return None
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._files.get(key)
+            if digest is not None:
+                self._files.move_to_end(key)
+                return self._uris[digest][0]
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            log_exception("document_io", exc)
+            return None
+        mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        digest = f"{mime}:{hashlib.sha256(data).hexdigest()}"
+        with self._lock:
+            self._forget_path(key[0])
+            if digest in self._uris:
+                uri, refs = self._uris[digest]
+                self._uris[digest] = (uri, refs + 1)
+            else:
+                uri = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+                self._uris[digest] = (uri, 1)
+                self._bytes += len(uri)
+            self._files[key] = digest
+            while self._bytes > self.max_bytes and len(self._files) > 1:
+                self._release(self._files.popitem(last=False)[1])
+        return uri
 
+    def _forget_path(self, path: str) -> None:
+        for key in [key for key in self._files if key[0] == path]:
+            self._release(self._files.pop(key))
 
+    def _release(self, digest: str) -> None:
+        uri, refs = self._uris[digest]
+        if refs > 1:
+            self._uris[digest] = (uri, refs - 1)
+        else:
+            del self._uris[digest]
+            self._bytes -= len(uri)
+
+
+_DATA_URI_CACHE = _DataUriCache(_DATA_URI_CACHE_MAX_BYTES)
 
 
 async def _markdown_to_pdf(
@@ -1320,28 +3468,323 @@ async def _markdown_to_pdf(
     output_path: Path,
     title: str | None,
     workspace_root: Path | None = None,
+    settings: DocumentSettings | None = None,
+    pooled: bool = True,
 ) -> list[str]:
-    md_text = md_path.read_text(encoding="utf-8", errors="replace")
+    settings = settings or DocumentSettings()
     css_text, warnings = _resolve_pdf_style(workspace_root)
-    header_template, footer_template = _build_pdf_header_footer(css_text)
-    html = _markdown_to_html(
-        md_text,
-        title=title or "Document",
-        css_text=css_text,
-        base_path=md_path.parent,
-        workspace_root=workspace_root,
-    )
     with tempfile.TemporaryDirectory() as tmp:
-        html_path = Path(tmp) / "document.html"
-        html_path.write_text(html, encoding="utf-8")
+        # Image preparation can decode large photos, so keep it off the event loop.
+        html_path = await asyncio.to_thread(
+            _markdown_to_print_html,
+            md_path,
+            Path(tmp) / "document.html",
+            title=title,
+            css_text=css_text,
+            workspace_root=workspace_root,
+            settings=settings,
+            chunked=pooled,
+        )
+        notes = await _print_html_to_pdf(
+            html_path,
+            output_path=output_path,
+            css_text=css_text,
+            settings=settings,
+            pooled=pooled,
+        )
+    return [*warnings, *notes]
+
+
+def _markdown_to_print_html(
+    md_path: Path,
+    target: Path,
+    *,
+    title: str | None,
+    css_text: str,
+    workspace_root: Path | None,
+    settings: DocumentSettings,
+    chunked: bool,
+) -> Path:
+    """Write print-ready HTML for md_path to target, or return a cached copy.
+
+    When settings.pdf_chunk_chars is set, longer Markdown becomes several HTML
+    documents joined by _PDF_CHUNK_SEPARATOR, which _print_html_to_pdf renders
+    on parallel pages. Documents whose in-page links would point into another
+    chunk are rendered whole, since such links cannot survive the merge. The
+    result is cached by the content of the Markdown, the stylesheet and the
+    referenced images.
+    """
+    md_text = md_path.read_text(encoding="utf-8", errors="replace")
+    chunks = [md_text]
+    if chunked and 0 < settings.pdf_chunk_chars < len(md_text) and _pymupdf_available():
+        chunks = _split_markdown_for_pdf(md_text, settings.pdf_chunk_chars)
+    cache = _artifact_cache(workspace_root, settings)
+    key = ""
+    if cache is not None:
+        images = _local_image_refs(md_text, md_path.parent, workspace_root)
+        key = artifact_key(
+            "md->html",
+            str(DOCUMENT_EXPORT_VERSION),
+            _sha256_text(md_text),
+            _sha256_text(css_text),
+            title or "",
+            str(md_path.parent.resolve()),
+            f"{settings.image_dpi}/{settings.image_quality}",
+            str(settings.pdf_chunk_chars if len(chunks) > 1 else 0),
+            *(f"{image}:{_sha256_file(image)}" for image in images),
+        )
+        cached = cache.get(key, ".html")
+        # Prepared images live in their own cache and may have been evicted since.
+        if cached is not None and _file_images_exist(cached):
+            return cached
+    prepare_image = _export_image_preparer(workspace_root, settings)
+
+    def render(chunk: str) -> str:
+        return _markdown_to_html(
+            chunk,
+            title=title or "Document",
+            css_text=css_text,
+            base_path=md_path.parent,
+            workspace_root=workspace_root,
+            # The page is opened from a file:// URL, so images load straight from disk.
+            image_mode=IMAGE_MODE_FILE,
+            prepare_image=prepare_image,
+        )
+
+    parts = [render(chunk) for chunk in chunks]
+    if len(parts) > 1 and _links_cross_chunks(parts):
+        parts = [render(md_text)]
+    target.write_text(_PDF_CHUNK_SEPARATOR.join(parts), encoding="utf-8")
+    if cache is not None:
+        cache.put(key, ".html", target)
+    return target
+
+
+_HTML_FILE_IMG_SRC = re.compile(
+    r"""<img\b[^>]*\bsrc=["']?(file://[^"'>\s]+)""", re.IGNORECASE
+)
+
+
+def _file_images_exist(html_path: Path) -> bool:
+    """Return True if every file:// image in html_path still exists on disk."""
+    from urllib.request import url2pathname
+
+    try:
+        html_text = html_path.read_text(encoding="utf-8")
+    except OSError as exc:
+        log_exception("document_io", exc)
+        return False
+    return all(
+        Path(url2pathname(urlparse(src).path)).is_file()
+        for src in _HTML_FILE_IMG_SRC.findall(html_text)
+    )
+
+
+async def _print_html_to_pdf(
+    html_path: Path,
+    *,
+    output_path: Path,
+    css_text: str,
+    settings: DocumentSettings,
+    pooled: bool = True,
+) -> list[str]:
+    header_template, footer_template = _build_pdf_header_footer(css_text)
+    parts = html_path.read_text(encoding="utf-8").split(_PDF_CHUNK_SEPARATOR)
+    if len(parts) > 1:
+        await _html_chunks_to_pdf(parts, output_path=output_path, footer_template=footer_template)
+    else:
         await _html_to_pdf(
-            html,
+            parts[0],
             output_path=output_path,
             header_template=header_template,
             footer_template=footer_template,
             source_url=html_path.resolve().as_uri(),
+            pooled=pooled,
+        )
+    if not settings.pdf_optimize:
+        return []
+    optimized = await asyncio.to_thread(optimize_pdf, output_path)
+    return [optimized.describe()] if optimized is not None else []
+
+
+async def _html_chunks_to_pdf(
+    parts: list[str],
+    *,
+    output_path: Path,
+    footer_template: str | None,
+) -> None:
+    """Render HTML chunks on parallel pooled pages and merge them.
+
+    Chromium numbers pages per render, so chunks are printed with a blank
+    footer and the real footer is rendered once over a blank document with as
+    many pages as the merged PDF, then overlaid page by page.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        async def render_chunk(index: int, html: str) -> Path:
+            html_path = tmp_dir / f"chunk-{index:04}.html"
+            html_path.write_text(html, encoding="utf-8")
+            pdf_path = tmp_dir / f"chunk-{index:04}.pdf"
+            await _html_to_pdf(
+                html,
+                output_path=pdf_path,
+                footer_template=_BLANK_PDF_TEMPLATE,
+                source_url=html_path.resolve().as_uri(),
+            )
+            return pdf_path
+
+        pdfs = await asyncio.gather(*(render_chunk(index, html) for index, html in enumerate(parts)))
+        merged_path = tmp_dir / "merged.pdf"
+        page_count = await asyncio.to_thread(_merge_pdfs, pdfs, merged_path)
+        if not footer_template:
+            shutil.move(str(merged_path), output_path)
+            return
+        footer_path = tmp_dir / "footer.pdf"
+        await _html_to_pdf(
+            _blank_pages_html(page_count),
+            output_path=footer_path,
+            footer_template=footer_template,
+        )
+        await asyncio.to_thread(_overlay_pdf_pages, merged_path, footer_path, output_path)
+
+
+def _artifact_cache(
+    workspace_root: Path | None, settings: DocumentSettings
+) -> ArtifactCache | None:
+    if workspace_root is None or settings.cache_max_mb <= 0:
+        return None
+    return ArtifactCache(
+        DogentPaths(workspace_root).artifact_cache_dir,
+        max_bytes=settings.cache_max_mb * 1024 * 1024,
+    )
+
+
+_PDF_CHUNK_SEPARATOR = "\n<!-- dogent:pdf-chunk -->\n"
+_BLANK_PDF_TEMPLATE = "<span></span>"
+_ATX_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]|$)")
+_FENCE_OPEN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_PAGE_BREAK_MARKER = re.compile(
+    r"<div\b[^>]*\bclass=[\"'][^\"']*\bpage-break\b", re.IGNORECASE
+)
+
+
+def _split_markdown_for_pdf(md_text: str, chunk_chars: int) -> list[str]:
+    """Split Markdown into chunks of about chunk_chars for separate rendering.
+
+    Cuts only happen before a top-level heading (the shallowest level used more
+    than once) or after a page-break marker, never inside fenced code. A marker
+    at a cut is dropped because the chunk boundary already starts a new page.
+    Link reference definitions are copied into every chunk.
+    """
+    lines = md_text.splitlines(keepends=True)
+    headings: dict[int, list[int]] = {}
+    breaks: list[int] = []
+    fence: str | None = None
+    for index, line in enumerate(lines):
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+            continue
+        fence_match = _FENCE_OPEN.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+        heading = _ATX_HEADING.match(line)
+        if heading and index > 0:
+            headings.setdefault(len(heading.group(1)), []).append(index)
+        elif _PAGE_BREAK_MARKER.search(line):
+            breaks.append(index)
+
+    # Cut candidates: (line the next chunk starts at, marker line to drop or None).
+    candidates = [(index + 1, index) for index in breaks]
+    top_level = next((level for level in sorted(headings) if len(headings[level]) > 1), None)
+    if top_level is not None:
+        candidates.extend((index, None) for index in headings[top_level])
+    candidates.sort()
+
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    chunks: list[str] = []
+    start = 0
+    for cut, marker in candidates:
+        if cut >= len(lines) or offsets[cut] - offsets[start] < chunk_chars:
+            continue
+        end = marker if marker is not None else cut
+        chunks.append("".join(lines[start:end]))
+        start = cut
+    chunks.append("".join(lines[start:]))
+    chunks = [chunk for chunk in chunks if chunk.strip()]
+    if len(chunks) > 1:
+        definitions = "".join(
+            line for line in lines if _MD_LINK_DEFINITION.match(line)
         )
-    return warnings
+        if definitions:
+            chunks = [f"{chunk.rstrip()}\n\n{definitions}" for chunk in chunks]
+    return chunks
+
+
+_HTML_ID = re.compile(r"""\b(?:id|name)=["']([^"']+)["']""", re.IGNORECASE)
+_HTML_FRAGMENT_LINK = re.compile(r"""\bhref=["']#([^"']+)["']""", re.IGNORECASE)
+
+
+def _links_cross_chunks(parts: list[str]) -> bool:
+    """Return True if an in-page link in one HTML chunk targets another chunk."""
+    ids = [set(_HTML_ID.findall(part)) for part in parts]
+    every_id = set().union(*ids)
+    for part, own in zip(parts, ids):
+        for target in _HTML_FRAGMENT_LINK.findall(part):
+            target = unquote(target)
+            if target not in own and target in every_id:
+                return True
+    return False
+
+
+def _pymupdf_available() -> bool:
+    try:
+        import fitz  # noqa: F401
+    except Exception as exc:  # noqa: BLE001
+        log_exception("document_io", exc)
+        return False
+    return True
+
+
+def _merge_pdfs(parts: list[Path], output_path: Path) -> int:
+    import fitz
+
+    merged = fitz.open()
+    try:
+        for part in parts:
+            with fitz.open(part) as doc:
+                merged.insert_pdf(doc)
+        merged.save(str(output_path), garbage=1, deflate=True)
+        return merged.page_count
+    finally:
+        merged.close()
+
+
+def _blank_pages_html(page_count: int) -> str:
+    breaks = '<div style="height:1px;break-after:page"></div>' * (page_count - 1)
+    return (
+        "<!doctype html><html><head><meta charset=\"utf-8\" />"
+        "<style>html,body{margin:0;background:transparent}</style></head>"
+        f"<body>{breaks}<div style=\"height:1px\"></div></body></html>"
+    )
+
+
+def _overlay_pdf_pages(base_path: Path, overlay_path: Path, output_path: Path) -> None:
+    import fitz
+
+    with fitz.open(base_path) as base, fitz.open(overlay_path) as overlay:
+        if overlay.page_count != base.page_count:
+            raise RuntimeError(
+                f"Footer render produced {overlay.page_count} pages for {base.page_count}."
+            )
+        for page in base:
+            page.show_pdf_page(page.rect, overlay, page.number, overlay=True)
+        base.save(str(output_path), garbage=1, deflate=True)
 
 
 async def _html_to_pdf(
@@ -1351,41 +3794,53 @@ async def _html_to_pdf(
     header_template: str | None = None,
     footer_template: str | None = None,
     source_url: str | None = None,
+    pooled: bool = True,
 ) -> None:
+    """Render HTML to PDF.
+
+    Async callers share the warm browser from chromium_pool(); pooled=False
+    launches a one-shot browser for callers that run on a throwaway loop.
+    """
     _configure_playwright_browsers()
     try:
         from playwright.async_api import async_playwright
     except Exception as exc:  # noqa: BLE001
         log_exception("document_io", exc)
         raise RuntimeError("PDF export requires Playwright. Install dependency.") from exc
+
+    async def render(page: Any) -> None:
+        if source_url:
+            await page.goto(source_url, wait_until="load")
+        else:
+            await page.set_content(html, wait_until="load")
+        pdf_options = {
+            "path": str(output_path),
+            "format": "A4",
+            "print_background": True,
+        }
+        if header_template or footer_template:
+            pdf_options.update(
+                {
+                    "display_header_footer": True,
+                    "header_template": header_template or "<span></span>",
+                    "footer_template": footer_template or "<span></span>",
+                    "margin": {
+                        "top": "18mm",
+                        "bottom": "18mm",
+                        "left": "18mm",
+                        "right": "18mm",
+                    },
+                }
+            )
+        await page.pdf(**pdf_options)
+
     try:
+        if pooled:
+            await chromium_pool().run(render)
+            return
         async with async_playwright() as p:
             browser = await p.chromium.launch()
-            page = await browser.new_page()
-            if source_url:
-                await page.goto(source_url, wait_until="load")
-            else:
-                await page.set_content(html, wait_until="load")
-            pdf_options = {
-                "path": str(output_path),
-                "format": "A4",
-                "print_background": True,
-            }
-            if header_template or footer_template:
-                pdf_options.update(
-                    {
-                        "display_header_footer": True,
-                        "header_template": header_template or "<span></span>",
-                        "footer_template": footer_template or "<span></span>",
-                        "margin": {
-                            "top": "18mm",
-                            "bottom": "18mm",
-                            "left": "18mm",
-                            "right": "18mm",
-                        },
-                    }
-                )
-            await page.pdf(**pdf_options)
+            await render(await browser.new_page())
             await browser.close()
     except Exception as exc:
         log_exception("document_io", exc)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable
+
+_ATX_HEADING = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_MD_ESCAPE = re.compile(r"\\(.)")
+_SECTION_NUMBER = re.compile(r"^\d+(?:\.\d+)*\.?$")
+
+
+def markdown_outline(lines: Iterable[str]) -> tuple[list[dict[str, Any]], int]:
+    """Return ATX headings with character offsets, plus the total characters seen.
+
+    Lines must keep their line endings so offsets line up with the rendered text.
+    Headings inside fenced code blocks are ignored.
+    """
+    headings: list[dict[str, Any]] = []
+    position = 0
+    fence: str | None = None
+    for line in lines:
+        stripped = line.rstrip("\n")
+        fence_match = _FENCE.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker[0] * len(marker)
+            elif marker.startswith(fence) and not stripped[fence_match.end() :].strip():
+                # A closing fence carries no info string; "```python" stays inside.
+                fence = None
+        elif fence is None:
+            match = _ATX_HEADING.match(stripped)
+            if match:
+                title = _MD_ESCAPE.sub(r"\1", match.group(2)).strip()
+                if title:
+                    headings.append(
+                        {"level": len(match.group(1)), "title": title, "offset": position}
+                    )
+        position += len(line)
+    return close_outline(headings, position), position
+
+
+def close_outline(headings: list[dict[str, Any]], total_chars: int) -> list[dict[str, Any]]:
+    """Set each heading's end to the next heading at the same or a higher level."""
+    for idx, heading in enumerate(headings):
+        end = total_chars
+        for later in headings[idx + 1 :]:
+            if later["level"] <= heading["level"]:
+                end = later["offset"]
+                break
+        heading["end"] = max(end, heading["offset"])
+    return headings
+
+
+def find_section(headings: list[dict[str, Any]], query: str) -> dict[str, Any] | None:
+    """Match a section by exact title, by its number (e.g. "3.2"), then by prefix."""
+    wanted = _normalize(query)
+    if not wanted:
+        return None
+    for heading in headings:
+        if _normalize(heading["title"]) == wanted:
+            return heading
+    if _SECTION_NUMBER.match(wanted):
+        number = wanted.rstrip(".")
+        for heading in headings:
+            title = _normalize(heading["title"])
+            if re.match(rf"{re.escape(number)}\.?(?:\s|$)", title):
+                return heading
+    for heading in headings:
+        if _normalize(heading["title"]).startswith(wanted):
+            return heading
+    for heading in headings:
+        if wanted in _normalize(heading["title"]):
+            return heading
+    return None
+
+
+def format_outline(headings: list[dict[str, Any]]) -> str:
+    if not headings:
+        return "(no headings found)"
+    top = min(heading["level"] for heading in headings)
+    return "\n".join(
+        f"{'  ' * (heading['level'] - top)}- {heading['title']} "
+        f"(offset {heading['offset']}, {heading['end'] - heading['offset']} chars)"
+        for heading in headings
+    )
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.strip().lstrip("#").rstrip(":").casefold().split())
@@ -1,33 +1,66 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from claude_agent_sdk import SdkMcpTool, tool
 
+from .conversion_jobs import ConversionCancelled
+from .document_cache import DocumentCache
 from .document_io import (
     DEFAULT_MAX_CHARS,
+    DocumentReadResult,
+    DocumentSettings,
+    ExportJob,
     convert_document_async,
     export_markdown_async,
+    export_markdown_batch_async,
+    load_document_settings,
     read_document,
 )
+from ..config.paths import DogentPaths
 from ..core.session_log import log_exception
 
+if TYPE_CHECKING:
+    from ..config import ConfigManager
+
+
+DEFAULT_BATCH_MAX_CHARS = 40000
+MAX_BATCH_FILES = 20
 
 DOGENT_DOC_ALLOWED_TOOLS = [
     "mcp__dogent__read_document",
+    "mcp__dogent__read_documents",
     "mcp__dogent__export_document",
+    "mcp__dogent__export_documents",
     "mcp__dogent__convert_document",
 ]
 DOGENT_DOC_TOOL_DISPLAY_NAMES = {
     "mcp__dogent__read_document": "dogent_read_document",
+    "mcp__dogent__read_documents": "dogent_read_documents",
     "mcp__dogent__export_document": "dogent_export_document",
+    "mcp__dogent__export_documents": "dogent_export_documents",
     "mcp__dogent__convert_document": "dogent_convert_document",
 }
 
 
-def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
+def create_dogent_doc_tools(
+    root: Path, config: "ConfigManager | None" = None
+) -> list[SdkMcpTool]:
+    def document_settings() -> DocumentSettings:
+        if config is None:
+            return DocumentSettings()
+        return load_document_settings(config.load_project_config())
+
+    def document_cache(settings: DocumentSettings) -> DocumentCache:
+        return DocumentCache(
+            DogentPaths(root).document_cache_dir,
+            max_bytes=settings.cache_max_mb * 1024 * 1024,
+        )
+
     read_schema = {
         "type": "object",
         "properties": {
@@ -47,11 +80,77 @@ def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
                 "type": "integer",
                 "description": "Preferred segment length (overrides max_chars).",
             },
+            "pages": {
+                "type": "string",
+                "description": (
+                    "Optional PDF page range such as \"40-55\" or \"1,3-5\"; "
+                    "offset/length then apply within the selected pages."
+                ),
+            },
+            "row_offset": {
+                "type": "integer",
+                "description": (
+                    "XLSX only: number of data rows to skip after the header row; "
+                    "reads a row window instead of the capped sheet preview."
+                ),
+            },
+            "row_limit": {
+                "type": "integer",
+                "description": "XLSX only: rows per window (default 50).",
+            },
+            "columns": {
+                "type": "string",
+                "description": "XLSX only: column letters such as \"A:C,F\" for the row window.",
+            },
+            "outline": {
+                "type": "boolean",
+                "description": (
+                    "Return the heading tree with character offsets instead of content "
+                    "(PDFs use their bookmarks when present)."
+                ),
+            },
+            "section": {
+                "type": "string",
+                "description": (
+                    "Read only one section, matched by heading title or number such as "
+                    "\"3.2 Pricing\" or \"3.2\"; offset/length apply within it."
+                ),
+            },
         },
         "required": ["path"],
         "additionalProperties": False,
     }
 
+    read_many_schema = {
+        "type": "object",
+        "properties": {
+            "files": {
+                "type": "array",
+                "description": (
+                    "Files to read, each with the same per-file options as read_document "
+                    f"(at most {MAX_BATCH_FILES})."
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        key: value
+                        for key, value in read_schema["properties"].items()
+                        if key != "max_chars"
+                    },
+                    "required": ["path"],
+                    "additionalProperties": False,
+                },
+            },
+            "max_chars": {
+                "type": "integer",
+                "description": "Total characters shared across all files.",
+                "default": DEFAULT_BATCH_MAX_CHARS,
+            },
+        },
+        "required": ["files"],
+        "additionalProperties": False,
+    }
+
     export_schema = {
         "type": "object",
         "properties": {
@@ -76,6 +175,22 @@ def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
         "additionalProperties": False,
     }
 
+    export_many_schema = {
+        "type": "object",
+        "properties": {
+            "jobs": {
+                "type": "array",
+                "description": (
+                    "Exports to run, each with the same fields as export_document "
+                    f"(at most {MAX_BATCH_FILES})."
+                ),
+                "items": export_schema,
+            },
+        },
+        "required": ["jobs"],
+        "additionalProperties": False,
+    }
+
     convert_schema = {
         "type": "object",
         "properties": {
@@ -101,88 +216,215 @@ def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
         raw_path = str(args.get("path") or "").strip()
         if not raw_path:
             return _error("Missing required field: path")
-        sheet = args.get("sheet")
         max_chars = int(args.get("max_chars") or DEFAULT_MAX_CHARS)
-        offset = int(args.get("offset") or 0)
-        raw_length = args.get("length")
-        if raw_length is None or raw_length == "":
-            length = None
-        else:
-            length = int(raw_length)
+        options = _read_options(args)
         try:
             path = _resolve_workspace_path(root, raw_path, must_exist=True)
         except ValueError as exc:
             log_exception("document_tools", exc)
             return _error(str(exc))
 
-        result = read_document(
+        settings = document_settings()
+        # Parsing, and any PDF worker pool it starts, stays off the event loop.
+        result = await asyncio.to_thread(
+            read_document,
             path,
-            sheet=str(sheet) if sheet else None,
             max_chars=max_chars,
-            offset=offset,
-            length=length,
+            cache=document_cache(settings),
+            settings=settings,
+            **options,
         )
         if result.error:
             return _error(result.error)
 
-        lines = [
-            f"Path: {_readable_path(root, path)}",
-            f"Format: {result.format}",
-        ]
-        if result.metadata:
-            lines.append(f"Metadata: {json.dumps(result.metadata, ensure_ascii=True)}")
-        if result.truncated:
-            lines.append("Note: content was truncated.")
-        lines.append("")
-        lines.append(result.content or "(no content)")
+        note = "Note: content was truncated." if result.truncated else None
+        lines = _format_read_result(root, path, result, note=note)
         return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
-    @tool("export_document", "Export a Markdown file to PDF or DOCX.", export_schema)
-    async def export_document_tool(args: dict[str, Any]) -> dict[str, Any]:
-        raw_md_path = str(args.get("md_path") or "").strip()
-        raw_output_path = str(args.get("output_path") or "").strip()
-        fmt = str(args.get("format") or "").strip().lower()
-        title = str(args.get("title") or "").strip() or None
+    @tool(
+        "read_documents",
+        "Read several documents concurrently within one shared character budget.",
+        read_many_schema,
+    )
+    async def read_documents_tool(args: dict[str, Any]) -> dict[str, Any]:
+        files = args.get("files")
+        if not isinstance(files, list) or not files:
+            return _error("Missing required field: files")
+        if len(files) > MAX_BATCH_FILES:
+            return _error(f"At most {MAX_BATCH_FILES} files per call.")
+        budget = max(1, int(args.get("max_chars") or DEFAULT_BATCH_MAX_CHARS))
+        settings = document_settings()
+        cache = document_cache(settings)
+        semaphore = asyncio.Semaphore(settings.read_workers)
 
-        if not raw_md_path:
-            return _error("Missing required field: md_path")
-        if not raw_output_path:
-            return _error("Missing required field: output_path")
-        if fmt not in {"pdf", "docx"}:
-            return _error("format must be 'pdf' or 'docx'")
+        async def read_one(
+            item: Any,
+        ) -> tuple[str, tuple[Path, DocumentReadResult] | str]:
+            if not isinstance(item, dict):
+                return "(invalid entry)", "Each file entry must be an object."
+            raw_path = str(item.get("path") or "").strip()
+            if not raw_path:
+                return "(missing path)", "Missing required field: path"
+            try:
+                path = _resolve_workspace_path(root, raw_path, must_exist=True)
+                options = _read_options(item)
+            except ValueError as exc:
+                log_exception("document_tools", exc)
+                return raw_path, str(exc)
+            # Each file may use the whole budget; the split happens afterwards so
+            # short files leave their share to the longer ones.
+            requested = options.pop("length")
+            cap = budget if requested is None else max(1, min(budget, requested))
+            async with semaphore:
+                result = await asyncio.to_thread(
+                    read_document,
+                    path,
+                    max_chars=cap,
+                    length=cap,
+                    cache=cache,
+                    settings=settings,
+                    **options,
+                )
+            if result.error:
+                return raw_path, result.error
+            return raw_path, (path, result)
+
+        outcomes = await asyncio.gather(*(read_one(item) for item in files))
+        sizes = [
+            0 if isinstance(outcome, str) else len(outcome[1].content)
+            for _, outcome in outcomes
+        ]
+        allowances = _split_budget(sizes, budget)
 
+        sections: list[str] = []
+        failures = 0
+        for idx, ((label, outcome), allowance) in enumerate(
+            zip(outcomes, allowances), start=1
+        ):
+            header = f"===== [{idx}/{len(outcomes)}] {label} ====="
+            if isinstance(outcome, str):
+                failures += 1
+                sections.append(f"{header}\nError: {outcome}")
+                continue
+            path, result = outcome
+            result = _trim_read_result(result, allowance)
+            note = None
+            if result.truncated:
+                next_offset = result.metadata.get("next_offset")
+                note = "Note: content was truncated." + (
+                    f" Continue with offset={next_offset}." if next_offset is not None else ""
+                )
+            lines = _format_read_result(root, path, result, note=note)
+            sections.append("\n".join([header, *lines]))
+        summary = (
+            f"Read {len(outcomes) - failures} of {len(outcomes)} files "
+            f"({sum(min(size, allowance) for size, allowance in zip(sizes, allowances))}"
+            f" of {budget} chars)."
+        )
+        text = "\n\n".join([summary, *sections])
+        if failures == len(outcomes):
+            return _error(text)
+        return {"content": [{"type": "text", "text": text}]}
+
+    @tool("export_document", "Export a Markdown file to PDF or DOCX.", export_schema)
+    async def export_document_tool(args: dict[str, Any]) -> dict[str, Any]:
         try:
-            md_path = _resolve_workspace_path(root, raw_md_path, must_exist=True)
-            output_path = _resolve_workspace_path(root, raw_output_path, must_exist=False)
+            job = _export_job(root, args)
         except ValueError as exc:
             log_exception("document_tools", exc)
             return _error(str(exc))
 
-        if md_path.suffix.lower() != ".md":
-            return _error("md_path must point to a .md file")
-        if output_path.suffix.lower() != f".{fmt}":
-            return _error("output_path extension must match format")
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        job.output_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            warnings = await export_markdown_async(
-                md_path,
-                output_path=output_path,
-                format=fmt,
-                title=title,
+            result = await export_markdown_async(
+                job.md_path,
+                output_path=job.output_path,
+                format=job.format,
+                title=job.title,
                 workspace_root=root,
+                settings=document_settings(),
             )
         except Exception as exc:  # noqa: BLE001
             log_exception("document_tools", exc)
             return _error(f"Export failed: {exc}")
+        verb = "Exported"
+        if result.skipped:
+            verb = "Up to date (sources unchanged, rendering skipped):"
         lines = [
-            f"Exported {_readable_path(root, md_path)} -> {_readable_path(root, output_path)}"
+            f"{verb} {_readable_path(root, job.md_path)} -> "
+            f"{_readable_path(root, job.output_path)}"
         ]
-        if warnings:
+        if result.warnings:
             lines.append("Warnings:")
-            lines.extend(f"- {warning}" for warning in warnings)
+            lines.extend(f"- {warning}" for warning in result.warnings)
         return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
+    @tool(
+        "export_documents",
+        "Export several Markdown files to PDF or DOCX concurrently.",
+        export_many_schema,
+    )
+    async def export_documents_tool(args: dict[str, Any]) -> dict[str, Any]:
+        items = args.get("jobs")
+        if not isinstance(items, list) or not items:
+            return _error("Missing required field: jobs")
+        if len(items) > MAX_BATCH_FILES:
+            return _error(f"At most {MAX_BATCH_FILES} jobs per call.")
+
+        jobs: list[ExportJob] = []
+        invalid: dict[int, str] = {}
+        outputs: set[Path] = set()
+        for idx, item in enumerate(items):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Each job must be an object.")
+                job = _export_job(root, item)
+                if job.output_path in outputs:
+                    raise ValueError("output_path is used by another job")
+            except ValueError as exc:
+                log_exception("document_tools", exc)
+                invalid[idx] = str(exc)
+                continue
+            outputs.add(job.output_path)
+            jobs.append(job)
+
+        started = time.perf_counter()
+        results = iter(
+            await export_markdown_batch_async(
+                jobs, workspace_root=root, settings=document_settings()
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+        lines: list[str] = []
+        failures = 0
+        for idx, item in enumerate(items):
+            prefix = f"[{idx + 1}/{len(items)}]"
+            if idx in invalid:
+                failures += 1
+                label = item.get("md_path") if isinstance(item, dict) else None
+                lines.append(f"{prefix} {label or '(invalid job)'}: Error: {invalid[idx]}")
+                continue
+            result = next(results)
+            source = _readable_path(root, result.job.md_path)
+            target = _readable_path(root, result.job.output_path)
+            if result.error:
+                failures += 1
+                lines.append(
+                    f"{prefix} {source}: Export failed ({result.seconds:.2f}s): {result.error}"
+                )
+                continue
+            status = "unchanged, " if result.skipped else ""
+            lines.append(f"{prefix} {source} -> {target} ({status}{result.seconds:.2f}s)")
+            lines.extend(f"    Warning: {warning}" for warning in result.warnings)
+        summary = (
+            f"Exported {len(items) - failures} of {len(items)} files in {elapsed:.2f}s."
+        )
+        text = "\n".join([summary, *lines])
+        if failures == len(items):
+            return _error(text)
+        return {"content": [{"type": "text", "text": text}]}
+
     @tool(
         "convert_document",
         "Convert between DOCX, PDF, and Markdown files.",
@@ -221,7 +463,10 @@ def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
                 output_path=output_path,
                 extract_media_dir=extract_dir,
                 workspace_root=root,
+                settings=document_settings(),
             )
+        except ConversionCancelled as exc:
+            return _error(str(exc))
         except Exception as exc:  # noqa: BLE001
             log_exception("document_tools", exc)
             return _error(f"Conversion failed: {exc}")
@@ -236,7 +481,99 @@ def create_dogent_doc_tools(root: Path) -> list[SdkMcpTool]:
             lines.extend(f"- {note}" for note in result.notes)
         return {"content": [{"type": "text", "text": "\n".join(lines)}]}
 
-    return [read_document_tool, export_document_tool, convert_document_tool]
+    return [
+        read_document_tool,
+        read_documents_tool,
+        export_document_tool,
+        export_documents_tool,
+        convert_document_tool,
+    ]
+
+
+def _read_options(args: dict[str, Any]) -> dict[str, Any]:
+    """Parse the per-file read_document options (everything but path/max_chars)."""
+    sheet = args.get("sheet")
+    raw_length = args.get("length")
+    raw_row_offset = args.get("row_offset")
+    raw_row_limit = args.get("row_limit")
+    return {
+        "sheet": str(sheet) if sheet else None,
+        "offset": int(args.get("offset") or 0),
+        "length": None if raw_length in (None, "") else int(raw_length),
+        "pages": str(args.get("pages") or "").strip() or None,
+        "row_offset": None if raw_row_offset in (None, "") else int(raw_row_offset),
+        "row_limit": None if raw_row_limit in (None, "") else int(raw_row_limit),
+        "columns": str(args.get("columns") or "").strip() or None,
+        "outline": bool(args.get("outline")),
+        "section": str(args.get("section") or "").strip() or None,
+    }
+
+
+def _format_read_result(
+    root: Path, path: Path, result: DocumentReadResult, *, note: str | None = None
+) -> list[str]:
+    lines = [
+        f"Path: {_readable_path(root, path)}",
+        f"Format: {result.format}",
+    ]
+    if result.metadata:
+        lines.append(f"Metadata: {json.dumps(result.metadata, ensure_ascii=True)}")
+    if note:
+        lines.append(note)
+    lines.append("")
+    lines.append(result.content or "(no content)")
+    return lines
+
+
+def _split_budget(sizes: list[int], budget: int) -> list[int]:
+    """Share budget across files: small files take what they need, the rest split evenly."""
+    allowances = [0] * len(sizes)
+    remaining = budget
+    order = sorted(range(len(sizes)), key=lambda idx: sizes[idx])
+    for position, idx in enumerate(order):
+        share = remaining // (len(order) - position)
+        allowances[idx] = min(sizes[idx], share)
+        remaining -= allowances[idx]
+    return allowances
+
+
+def _trim_read_result(result: DocumentReadResult, allowance: int) -> DocumentReadResult:
+    if len(result.content) <= allowance:
+        return result
+    metadata = dict(result.metadata)
+    start = metadata.get("offset")
+    if isinstance(start, int):
+        metadata["returned"] = allowance
+        metadata["next_offset"] = start + allowance
+    return DocumentReadResult(
+        content=result.content[:allowance],
+        truncated=True,
+        format=result.format,
+        metadata=metadata,
+        error=result.error,
+    )
+
+
+def _export_job(root: Path, args: dict[str, Any]) -> ExportJob:
+    raw_md_path = str(args.get("md_path") or "").strip()
+    raw_output_path = str(args.get("output_path") or "").strip()
+    fmt = str(args.get("format") or "").strip().lower()
+    title = str(args.get("title") or "").strip() or None
+
+    if not raw_md_path:
+        raise ValueError("Missing required field: md_path")
+    if not raw_output_path:
+        raise ValueError("Missing required field: output_path")
+    if fmt not in {"pdf", "docx"}:
+        raise ValueError("format must be 'pdf' or 'docx'")
+
+    md_path = _resolve_workspace_path(root, raw_md_path, must_exist=True)
+    output_path = _resolve_workspace_path(root, raw_output_path, must_exist=False)
+    if md_path.suffix.lower() != ".md":
+        raise ValueError("md_path must point to a .md file")
+    if output_path.suffix.lower() != f".{fmt}":
+        raise ValueError("output_path extension must match format")
+    return ExportJob(md_path=md_path, output_path=output_path, format=fmt, title=title)
 
 
 def _resolve_workspace_path(root: Path, raw: str, *, must_exist: bool) -> Path:
@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_WP = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+_M = "{http://schemas.openxmlformats.org/officeDocument/2006/math}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Constructs that pandoc renders but this reader would silently drop.
+_UNSUPPORTED_TAGS = {
+    _M + "oMath": "equations",
+    _M + "oMathPara": "equations",
+    _W + "txbxContent": "text boxes",
+    _W + "object": "embedded objects",
+    _W + "pict": "VML pictures",
+    _W + "footnoteReference": "footnotes",
+    _W + "endnoteReference": "endnotes",
+    _W + "commentReference": "comments",
+    _MC + "AlternateContent": "alternate content",
+}
+# Wrappers whose children are ordinary paragraph content.
+_TRANSPARENT_TAGS = {
+    _W + "smartTag",
+    _W + "customXml",
+    _W + "fldSimple",
+    _W + "bdo",
+    _W + "dir",
+}
+_TRACKED_TAGS = {
+    _W + "ins": "insertion",
+    _W + "moveTo": "insertion",
+    _W + "del": "deletion",
+    _W + "moveFrom": "deletion",
+}
+_IGNORED_RUN_TAGS = {
+    _W + "rPr",
+    _W + "instrText",
+    _W + "delInstrText",
+    _W + "fldChar",
+    _W + "lastRenderedPageBreak",
+    _W + "softHyphen",
+}
+_FALSE_VALUES = {"0", "false", "off", "none"}
+_MD_SPECIAL = re.compile(r"([\\`*_\[\]<>])")
+_BLOCK_START = re.compile(r"^(#|>|[-+](?=\s))")
+_ORDERED_START = re.compile(r"^(\d+)([.)])(?=\s)")
+_LINE_BREAK = "\n"
+
+
+class DocxUnsupported(Exception):
+    """Raised when a DOCX uses constructs the native reader does not handle."""
+
+
+def docx_to_markdown(path: Path, *, media_dir: Path | None = None) -> str:
+    """Convert the common subset of DOCX to Markdown without pandoc.
+
+    Covers paragraphs, headings, lists, tables, hyperlinks, tracked changes
+    (as pandoc-style insertion/deletion spans) and images. Images are written
+    under media_dir/media only after the whole document converted, so a
+    DocxUnsupported fallback leaves nothing behind.
+    """
+    with zipfile.ZipFile(path) as zf:
+        converter = _DocxConverter(zf, media_dir=media_dir)
+        text = converter.convert()
+        if media_dir is not None:
+            media_dir.mkdir(parents=True, exist_ok=True)
+            for member, target in converter.media.items():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(zf.read(member))
+    return text
+
+
+@dataclass(frozen=True)
+class _Style:
+    heading: int | None
+    num_id: str | None
+    ilvl: int
+
+
+@dataclass
+class _Run:
+    text: str
+    bold: bool
+    italic: bool
+    strike: bool
+
+    @property
+    def marks(self) -> tuple[bool, bool, bool]:
+        return self.bold, self.italic, self.strike
+
+
+class _DocxConverter:
+    def __init__(self, zf: zipfile.ZipFile, *, media_dir: Path | None) -> None:
+        self._zf = zf
+        self._media_dir = media_dir
+        self.media: dict[str, Path] = {}
+        self._members = set(zf.namelist())
+        self._media_names: dict[str, str] = {}
+        self._taken_names: set[str] = set()
+        self._rels = self._read_rels()
+        self._styles = self._read_styles()
+        self._list_formats = self._read_numbering()
+
+    def convert(self) -> str:
+        try:
+            root = ET.fromstring(self._zf.read("word/document.xml"))
+        except KeyError as exc:
+            raise DocxUnsupported("missing word/document.xml") from exc
+        body = root.find(f"{_W}body")
+        if body is None:
+            raise DocxUnsupported("no document body")
+        blocks: list[tuple[str, str]] = []
+        self._blocks(body, blocks)
+        parts: list[str] = []
+        previous = ""
+        for kind, text in blocks:
+            if parts:
+                parts.append("\n" if kind == previous == "list" else "\n\n")
+            parts.append(text)
+            previous = kind
+        return "".join(parts) + "\n" if parts else ""
+
+    def _blocks(self, parent: ET.Element, blocks: list[tuple[str, str]]) -> None:
+        for child in parent:
+            tag = child.tag
+            if tag == f"{_W}p":
+                block = self._paragraph(child)
+                if block:
+                    blocks.append(block)
+            elif tag == f"{_W}tbl":
+                table = self._table(child)
+                if table:
+                    blocks.append(("table", table))
+            elif tag == f"{_W}sdt":
+                content = child.find(f"{_W}sdtContent")
+                if content is not None:
+                    self._blocks(content, blocks)
+            elif tag in _TRANSPARENT_TAGS:
+                self._blocks(child, blocks)
+            else:
+                self._check_unknown(child)
+
+    def _paragraph(self, p: ET.Element) -> tuple[str, str] | None:
+        ppr = p.find(f"{_W}pPr")
+        style = self._styles.get(_val(ppr, "pStyle") or "")
+        text = self._inline(p).strip()
+        if not text:
+            return None
+        heading = style.heading if style else None
+        if heading:
+            return "heading", "#" * heading + " " + text.replace(_LINE_BREAK, " ")
+        num_id, ilvl = self._numbering_of(ppr, style)
+        if num_id:
+            bullet = self._list_formats.get((num_id, ilvl), "bullet") == "bullet"
+            indent = "    " * ilvl
+            marker = "-" if bullet else "1."
+            body = text.replace(_LINE_BREAK, "\\\n" + indent + " " * (len(marker) + 1))
+            return "list", f"{indent}{marker} {body}"
+        text = _BLOCK_START.sub(r"\\\1", text, count=1)
+        text = _ORDERED_START.sub(r"\1\\\2", text, count=1)
+        return "paragraph", text.replace(_LINE_BREAK, "\\\n")
+
+    def _numbering_of(
+        self, ppr: ET.Element | None, style: _Style | None
+    ) -> tuple[str | None, int]:
+        num_pr = ppr.find(f"{_W}numPr") if ppr is not None else None
+        if num_pr is not None:
+            num_id = _val(num_pr, "numId")
+            ilvl = _int(_val(num_pr, "ilvl"))
+        elif style is not None:
+            num_id, ilvl = style.num_id, style.ilvl
+        else:
+            return None, 0
+        if not num_id or num_id == "0":
+            return None, 0
+        return num_id, ilvl
+
+    def _table(self, tbl: ET.Element) -> str:
+        rows: list[list[str]] = []
+        for tr in tbl.findall(f"{_W}tr"):
+            cells: list[str] = []
+            for tc in tr.findall(f"{_W}tc"):
+                if tc.find(f".//{_W}tbl") is not None:
+                    raise DocxUnsupported("nested tables")
+                tcpr = tc.find(f"{_W}tcPr")
+                merge = tcpr.find(f"{_W}vMerge") if tcpr is not None else None
+                if merge is not None and merge.attrib.get(f"{_W}val") != "restart":
+                    text = ""
+                else:
+                    paragraphs = [
+                        self._inline(p).strip().replace(_LINE_BREAK, " ")
+                        for p in tc.iter(f"{_W}p")
+                    ]
+                    text = "<br>".join(item for item in paragraphs if item)
+                cells.append(text.replace("|", "\\|"))
+                cells.extend([""] * (_int(_val(tcpr, "gridSpan"), 1) - 1))
+            rows.append(cells)
+        width = max((len(row) for row in rows), default=0)
+        if width == 0:
+            return ""
+        lines = []
+        for idx, row in enumerate(rows):
+            padded = row + [""] * (width - len(row))
+            lines.append("| " + " | ".join(padded) + " |")
+            if idx == 0:
+                lines.append("| " + " | ".join(["---"] * width) + " |")
+        return "\n".join(lines)
+
+    def _inline(self, parent: ET.Element) -> str:
+        return _render_pieces(self._pieces(parent))
+
+    def _pieces(self, parent: ET.Element) -> list[_Run | str]:
+        pieces: list[_Run | str] = []
+        for child in parent:
+            tag = child.tag
+            if tag == f"{_W}r":
+                pieces.extend(self._run(child))
+            elif tag == f"{_W}hyperlink":
+                inner = _render_pieces(self._pieces(child))
+                target = self._rels.get(child.attrib.get(f"{_R}id", ""))
+                pieces.append(f"[{inner}]({target})" if target and inner else inner)
+            elif tag in _TRACKED_TAGS:
+                inner = _render_pieces(self._pieces(child))
+                if inner:
+                    attrs = " ".join(
+                        f'{name}="{child.attrib.get(_W + name, "")}"'
+                        for name in ("author", "date")
+                    )
+                    pieces.append(f"[{inner}]{{.{_TRACKED_TAGS[tag]} {attrs}}}")
+            elif tag == f"{_W}sdt":
+                content = child.find(f"{_W}sdtContent")
+                if content is not None:
+                    pieces.extend(self._pieces(content))
+            elif tag in _TRANSPARENT_TAGS:
+                pieces.extend(self._pieces(child))
+            elif tag != f"{_W}pPr":
+                self._check_unknown(child)
+        return pieces
+
+    def _run(self, r: ET.Element) -> list[_Run | str]:
+        rpr = r.find(f"{_W}rPr")
+        if _flag(rpr, "vanish"):
+            return []
+        bold = _flag(rpr, "b")
+        italic = _flag(rpr, "i")
+        strike = _flag(rpr, "strike") or _flag(rpr, "dstrike")
+        pieces: list[_Run | str] = []
+        for child in r:
+            tag = child.tag
+            if tag in (f"{_W}t", f"{_W}delText"):
+                text = _MD_SPECIAL.sub(r"\\\1", child.text or "")
+            elif tag == f"{_W}tab":
+                text = " "
+            elif tag in (f"{_W}br", f"{_W}cr"):
+                if child.attrib.get(f"{_W}type") == "page":
+                    continue
+                text = _LINE_BREAK
+            elif tag == f"{_W}noBreakHyphen":
+                text = "-"
+            elif tag == f"{_W}drawing":
+                pieces.append(self._image(child))
+                continue
+            elif tag in _IGNORED_RUN_TAGS:
+                continue
+            else:
+                self._check_unknown(child)
+                continue
+            pieces.append(_Run(text, bold, italic, strike))
+        return pieces
+
+    def _image(self, drawing: ET.Element) -> str:
+        if drawing.find(f".//{_W}txbxContent") is not None:
+            raise DocxUnsupported("text boxes")
+        blip = drawing.find(f".//{_A}blip")
+        if blip is None:
+            raise DocxUnsupported("drawings without images")
+        doc_pr = drawing.find(f".//{_WP}docPr")
+        alt = doc_pr.attrib.get("descr", "") if doc_pr is not None else ""
+        alt = _MD_SPECIAL.sub(r"\\\1", alt.replace("\n", " "))
+        rel_id = blip.attrib.get(f"{_R}embed") or blip.attrib.get(f"{_R}link") or ""
+        target = self._rels.get(rel_id)
+        if not target:
+            return ""
+        if "://" in target:
+            return f"![{alt}]({target})"
+        member = posixpath.normpath(posixpath.join("word", target))
+        if member.startswith("../") or member not in self._members:
+            return ""
+        name = self._media_name(member)
+        if self._media_dir is None:
+            return f"![{alt}](media/{name})"
+        output = self._media_dir / "media" / name
+        self.media[member] = output
+        return f"![{alt}]({output.as_posix()})"
+
+    def _media_name(self, member: str) -> str:
+        # Parts from different folders may share a basename; number the later
+        # ones so one image never overwrites another under media/.
+        name = self._media_names.get(member)
+        if name is not None:
+            return name
+        stem, ext = posixpath.splitext(posixpath.basename(member))
+        name = f"{stem}{ext}"
+        index = 1
+        while name in self._taken_names:
+            index += 1
+            name = f"{stem}-{index}{ext}"
+        self._media_names[member] = name
+        self._taken_names.add(name)
+        return name
+
+    def _check_unknown(self, elem: ET.Element) -> None:
+        reason = _UNSUPPORTED_TAGS.get(elem.tag)
+        if reason is None:
+            for node in elem.iter():
+                reason = _UNSUPPORTED_TAGS.get(node.tag)
+                if reason:
+                    break
+        if reason is None and elem.find(f".//{_W}t") is not None:
+            reason = f"unknown element {elem.tag}"
+        if reason:
+            raise DocxUnsupported(reason)
+
+    def _read_rels(self) -> dict[str, str]:
+        root = self._read_xml("word/_rels/document.xml.rels")
+        if root is None:
+            return {}
+        return {
+            rel.attrib["Id"]: rel.attrib.get("Target", "")
+            for rel in root.iter(f"{_PKG_REL}Relationship")
+            if "Id" in rel.attrib
+        }
+
+    def _read_styles(self) -> dict[str, _Style]:
+        root = self._read_xml("word/styles.xml")
+        if root is None:
+            return {}
+        styles: dict[str, _Style] = {}
+        for style in root.iter(f"{_W}style"):
+            style_id = style.attrib.get(f"{_W}styleId")
+            if not style_id or style.attrib.get(f"{_W}type") != "paragraph":
+                continue
+            name = (_val(style, "name") or style_id).strip().lower()
+            heading: int | None = None
+            match = re.fullmatch(r"heading\s*([1-6])", name)
+            if match:
+                heading = int(match.group(1))
+            elif name == "title":
+                heading = 1
+            ppr = style.find(f"{_W}pPr")
+            num_pr = ppr.find(f"{_W}numPr") if ppr is not None else None
+            styles[style_id] = _Style(
+                heading=heading,
+                num_id=_val(num_pr, "numId"),
+                ilvl=_int(_val(num_pr, "ilvl")),
+            )
+        return styles
+
+    def _read_numbering(self) -> dict[tuple[str, int], str]:
+        root = self._read_xml("word/numbering.xml")
+        if root is None:
+            return {}
+        abstract_formats: dict[str, dict[int, str]] = {}
+        for abstract in root.iter(f"{_W}abstractNum"):
+            levels = {
+                _int(lvl.attrib.get(f"{_W}ilvl")): _val(lvl, "numFmt") or "decimal"
+                for lvl in abstract.findall(f"{_W}lvl")
+            }
+            abstract_formats[abstract.attrib.get(f"{_W}abstractNumId", "")] = levels
+        formats: dict[tuple[str, int], str] = {}
+        for num in root.iter(f"{_W}num"):
+            num_id = num.attrib.get(f"{_W}numId", "")
+            levels = abstract_formats.get(_val(num, "abstractNumId") or "", {})
+            for ilvl, fmt in levels.items():
+                formats[(num_id, ilvl)] = fmt
+        return formats
+
+    def _read_xml(self, member: str) -> ET.Element | None:
+        try:
+            return ET.fromstring(self._zf.read(member))
+        except KeyError:
+            return None
+
+
+def _render_pieces(pieces: list[_Run | str]) -> str:
+    out: list[str] = []
+    group: list[_Run] = []
+
+    def flush() -> None:
+        if not group:
+            return
+        text = "".join(run.text for run in group)
+        bold, italic, strike = group[0].marks
+        group.clear()
+        core = text.strip()
+        if not core or not (bold or italic or strike):
+            out.append(text)
+            return
+        lead = text[: len(text) - len(text.lstrip())]
+        tail = text[len(text.rstrip()) :]
+        marker = ("**" if bold else "") + ("*" if italic else "")
+        if strike:
+            core = f"~~{core}~~"
+        out.append(f"{lead}{marker}{core}{marker[::-1]}{tail}")
+
+    for piece in pieces:
+        if isinstance(piece, _Run):
+            if group and group[0].marks != piece.marks:
+                flush()
+            group.append(piece)
+        else:
+            flush()
+            out.append(piece)
+    flush()
+    return "".join(out)
+
+
+def _val(parent: ET.Element | None, name: str) -> str | None:
+    if parent is None:
+        return None
+    child = parent.find(f"{_W}{name}")
+    if child is None:
+        return None
+    return child.attrib.get(f"{_W}val")
+
+
+def _flag(rpr: ET.Element | None, name: str) -> bool:
+    if rpr is None:
+        return False
+    child = rpr.find(f"{_W}{name}")
+    if child is None:
+        return False
+    return child.attrib.get(f"{_W}val", "true").lower() not in _FALSE_VALUES
+
+
+def _int(value: str | None, default: int = 0) -> int:
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
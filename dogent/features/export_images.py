@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from ..core.session_log import log_exception
+from .document_cache import ArtifactCache, artifact_key
+
+DEFAULT_IMAGE_DPI = 150
+DEFAULT_IMAGE_QUALITY = 85
+# Below screen resolution a downscaled image would render smaller than the original.
+MIN_IMAGE_DPI = 96
+# A4 text width with the 18 mm export margins (174 mm).
+MAX_RENDER_WIDTH_IN = 6.85
+_RASTER_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+_JPEG_SUFFIXES = {".jpg", ".jpeg"}
+# PNGs that take more than this per pixel are photos rather than screenshots or
+# diagrams, and shrink far better as JPEG.
+_PHOTO_PNG_BYTES_PER_PIXEL = 1.0
+_SKIP_MARKER = ".skip"
+# Bump when derived images change, so stale cache entries are not reused.
+_CACHE_VERSION = 2
+
+
+def prepare_export_image(path: Path, *, cache: ArtifactCache, dpi: int, quality: int) -> Path:
+    """Return a copy of path sized for export, or path itself when that is no smaller.
+
+    Images wider than MAX_RENDER_WIDTH_IN at dpi are scaled down to that width.
+    Opaque photos are re-encoded as JPEG at the given quality. Derived files live
+    in cache, keyed by content hash and settings, so each image is only processed
+    once; when the cache cannot store them the original is used.
+    """
+    if dpi <= 0 or path.suffix.lower() not in _RASTER_SUFFIXES:
+        return path
+    dpi = max(dpi, MIN_IMAGE_DPI)
+    quality = min(max(quality, 1), 100)
+    try:
+        data = path.read_bytes()
+    except OSError as exc:
+        log_exception("export_images", exc)
+        return path
+    key = artifact_key(
+        "image", hashlib.sha256(data).hexdigest(), str(_CACHE_VERSION), str(dpi), str(quality)
+    )
+    for suffix in (".jpg", ".png"):
+        cached = cache.get(key, suffix)
+        if cached is not None:
+            return cached
+    if cache.get(key, _SKIP_MARKER) is not None:
+        return path
+
+    derived = _derive_image(data, path.suffix.lower(), dpi=dpi, quality=quality)
+    if derived is None or len(derived[0]) >= len(data):
+        cache.put_bytes(key, _SKIP_MARKER, b"")
+        return path
+    payload, suffix = derived
+    return cache.put_bytes(key, suffix, payload) or path
+
+
+def _derive_image(
+    data: bytes, suffix: str, *, dpi: int, quality: int
+) -> tuple[bytes, str] | None:
+    try:
+        import fitz
+
+        pix = fitz.Pixmap(data)
+        # Unscaled images keep their own DPI so they render at the same size as before.
+        resolution = (pix.xres, pix.yres)
+        max_width = round(MAX_RENDER_WIDTH_IN * dpi)
+        original_pixels = pix.width * pix.height
+        if pix.width > max_width:
+            height = max(1, round(pix.height * max_width / pix.width))
+            pix = fitz.Pixmap(pix, max_width, height)
+            resolution = (dpi, dpi)
+        as_photo = not pix.alpha and (
+            suffix in _JPEG_SUFFIXES
+            or len(data) / max(1, original_pixels) >= _PHOTO_PNG_BYTES_PER_PIXEL
+        )
+        if pix.colorspace is None or pix.colorspace.n not in (1, 3):
+            # CMYK and other spaces cannot be written as PNG/JPEG directly.
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+        pix.set_dpi(*resolution)
+        if as_photo:
+            return pix.tobytes("jpeg", jpg_quality=quality), ".jpg"
+        return pix.tobytes("png"), ".png"
+    except Exception as exc:  # noqa: BLE001
+        log_exception("export_images", exc)
+        return None
+
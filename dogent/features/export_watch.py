@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..core.session_log import log_exception
+from .document_io import (
+    DocumentSettings,
+    ExportJob,
+    ExportJobResult,
+    export_dependencies,
+    export_markdown_batch_async,
+)
+
+DEFAULT_WATCH_INTERVAL = 0.5
+DEFAULT_WATCH_DEBOUNCE = 0.3
+
+ResultListener = Callable[[list[ExportJobResult]], None]
+_Stat = tuple[int, int] | None
+
+
+class ExportWatcher:
+    """Keep exported PDF/DOCX files current while their sources are edited.
+
+    Polls the Markdown, its local images and pdf_style.css, waits until a burst
+    of saves settles, then re-exports only the jobs that depend on the changed
+    files through export_markdown_batch_async, so PDFs render on the warm
+    Chromium pool and unchanged outputs are skipped by the export manifest.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[ExportJob] = (),
+        *,
+        workspace_root: Path | None,
+        settings: DocumentSettings | None = None,
+        on_results: ResultListener | None = None,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+        debounce: float = DEFAULT_WATCH_DEBOUNCE,
+        force: bool = False,
+    ) -> None:
+        self.workspace_root = workspace_root
+        self.settings = settings or DocumentSettings()
+        self.on_results = on_results
+        # Rebuild newly added jobs even when their outputs are up to date.
+        self.force = force
+        self.interval = interval
+        self.debounce = debounce
+        self.jobs: list[ExportJob] = []
+        self._deps: dict[ExportJob, set[Path]] = {}
+        self._stats: dict[Path, _Stat] = {}
+        self._pending: set[ExportJob] = set()
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: ExportJob) -> bool:
+        """Watch job and export it on the next pass; False if already watched."""
+        if job in self.jobs:
+            return False
+        self.jobs.append(job)
+        self._track(job)
+        self._pending.add(job)
+        return True
+
+    def remove(self, md_path: Path) -> list[ExportJob]:
+        target = md_path.resolve()
+        removed = [job for job in self.jobs if job.md_path.resolve() == target]
+        for job in removed:
+            self.jobs.remove(job)
+            self._deps.pop(job, None)
+            self._pending.discard(job)
+        self._prune_stats()
+        return removed
+
+    def poll(self) -> list[ExportJob]:
+        """Return jobs whose dependencies changed since the last poll."""
+        changed: set[Path] = set()
+        for path, previous in list(self._stats.items()):
+            current = _stat(path)
+            if current != previous:
+                self._stats[path] = current
+                changed.add(path)
+        if not changed:
+            return []
+        return [job for job in self.jobs if self._deps.get(job, set()) & changed]
+
+    async def export(
+        self, jobs: list[ExportJob], *, force: bool = False
+    ) -> list[ExportJobResult]:
+        results = await export_markdown_batch_async(
+            jobs, workspace_root=self.workspace_root, settings=self.settings, force=force
+        )
+        for job in jobs:
+            if job in self._deps:
+                # Image references may have been added or removed in this save.
+                self._track(job)
+        if self.on_results is not None:
+            try:
+                self.on_results(results)
+            except Exception as exc:  # noqa: BLE001
+                log_exception("export_watch", exc)
+        return results
+
+    async def run(self) -> None:
+        """Export pending jobs, then re-export on change until cancelled."""
+        while True:
+            pending = self._take_pending()
+            changed = pending | set(self.poll())
+            if changed:
+                # Debounce: editors often write a file several times per save.
+                while True:
+                    await asyncio.sleep(self.debounce)
+                    more = set(self.poll())
+                    if not more:
+                        break
+                    changed |= more
+                ordered = [job for job in self.jobs if job in changed]
+                if ordered:
+                    await self.export(ordered, force=self.force and bool(pending))
+            await asyncio.sleep(self.interval)
+
+    def _take_pending(self) -> set[ExportJob]:
+        pending, self._pending = self._pending, set()
+        return pending
+
+    def _track(self, job: ExportJob) -> None:
+        deps = set(
+            export_dependencies(
+                job.md_path, format=job.format, workspace_root=self.workspace_root
+            )
+        )
+        self._deps[job] = deps
+        for path in deps:
+            if path not in self._stats:
+                self._stats[path] = _stat(path)
+        self._prune_stats()
+
+    def _prune_stats(self) -> None:
+        """Stop polling files that no watched job depends on any more."""
+        needed = set().union(*self._deps.values())
+        for path in [path for path in self._stats if path not in needed]:
+            del self._stats[path]
+
+
+def _stat(path: Path) -> _Stat:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import ssl
+import time
+import zlib
+from contextlib import suppress
+from dataclasses import dataclass
+from urllib.parse import SplitResult, quote, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+from ..core.session_log import log_exception
+
+try:  # Optional: "br" is only advertised when it can be decoded.
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_CONNECT_TIMEOUT_S = 10.0
+DEFAULT_IDLE_TIMEOUT_S = 30.0
+MAX_IDLE_PER_HOST = 4
+MAX_REDIRECTS = 5
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Reserved and already-escaped characters stay as they are; anything else is quoted.
+_URL_SAFE = "%/:=&?~#+!$,;'@()*[]"
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class HttpProtocolError(OSError):
+    pass
+
+
+_HostKey = tuple[str, str, int]
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    idle_since: float = 0.0
+
+    def reusable(self, idle_timeout_s: float) -> bool:
+        return (
+            not self.writer.is_closing()
+            and not self.reader.at_eof()
+            and time.monotonic() - self.idle_since < idle_timeout_s
+        )
+
+    def close(self) -> None:
+        with suppress(Exception):
+            self.writer.close()
+
+
+class AsyncHttpClient:
+    """GET-only HTTP/1.1 client on asyncio streams with per-host keep-alive.
+
+    Idle connections are pooled per (scheme, host, port) so sequential requests
+    to one site skip the TCP/TLS handshake. Bodies are decoded from gzip,
+    deflate and (with the brotli package) br; redirects are followed. Requests
+    that the environment routes through a proxy use urllib in a worker thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+        max_idle_per_host: int = MAX_IDLE_PER_HOST,
+    ) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.idle_timeout_s = idle_timeout_s
+        self.max_idle_per_host = max_idle_per_host
+        self.connections_opened = 0
+        self._idle: dict[_HostKey, list[_Connection]] = {}
+        self._ssl: ssl.SSLContext | None = None
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        timeout_s: float,
+        connect_timeout_s: float = DEFAULT_CONNECT_TIMEOUT_S,
+    ) -> HttpResponse:
+        """Fetch url; timeout_s bounds the whole exchange including redirects."""
+        if _uses_proxy(urlsplit(url)):
+            return await asyncio.to_thread(_urllib_get, url, headers, timeout_s)
+        return await asyncio.wait_for(
+            self._get(url, headers, min(connect_timeout_s, timeout_s)), timeout_s
+        )
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+                with suppress(Exception):
+                    await asyncio.wait_for(conn.writer.wait_closed(), 1)
+
+    def discard(self) -> None:
+        """Drop pooled connections without awaiting, e.g. after their loop closed."""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    async def _get(
+        self, url: str, headers: dict[str, str], connect_timeout_s: float
+    ) -> HttpResponse:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._request(current, headers, connect_timeout_s)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            current = urljoin(current, location)
+        raise HttpProtocolError(f"Too many redirects: {url}")
+
+    async def _request(
+        self, url: str, headers: dict[str, str], connect_timeout_s: float
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in _DEFAULT_PORTS or not parts.hostname:
+            raise HttpProtocolError(f"Unsupported URL: {url}")
+        port = parts.port or _DEFAULT_PORTS[parts.scheme]
+        key = (parts.scheme, _ascii_host(parts.hostname), port)
+        request = _build_request(parts, headers)
+        for attempt in range(2):
+            conn, reused = await self._acquire(key, connect_timeout_s)
+            try:
+                conn.writer.write(request)
+                await conn.writer.drain()
+                version, status, resp_headers = await _read_head(conn.reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                conn.close()
+                # The server may have dropped a pooled connection while it sat idle.
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                body, complete = await _read_body(conn.reader, status, resp_headers)
+            except BaseException:
+                conn.close()
+                raise
+            if complete and _keep_alive(version, resp_headers):
+                self._release(key, conn)
+            else:
+                conn.close()
+            body, resp_headers = _decode_body(body, resp_headers)
+            return HttpResponse(url=url, status=status, headers=resp_headers, body=body)
+        raise HttpProtocolError(f"Connection closed: {url}")  # pragma: no cover
+
+    async def _acquire(self, key: _HostKey, connect_timeout_s: float) -> tuple[_Connection, bool]:
+        idle = self._idle.get(key, [])
+        while idle:
+            conn = idle.pop()
+            if conn.reusable(self.idle_timeout_s):
+                return conn, True
+            conn.close()
+        scheme, host, port = key
+        context = self._ssl_context() if scheme == "https" else None
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port, ssl=context, server_hostname=host if context else None
+            ),
+            connect_timeout_s,
+        )
+        self.connections_opened += 1
+        return _Connection(reader, writer), False
+
+    def _release(self, key: _HostKey, conn: _Connection) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.max_idle_per_host:
+            conn.close()
+            return
+        conn.idle_since = time.monotonic()
+        idle.append(conn)
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        if self._ssl is None:
+            self._ssl = ssl.create_default_context()
+        return self._ssl
+
+
+_CLIENT: AsyncHttpClient | None = None
+
+
+def http_client() -> AsyncHttpClient:
+    """Return the shared client for the running event loop."""
+    global _CLIENT
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.loop is not loop:
+        if _CLIENT is not None:
+            _CLIENT.discard()
+        _CLIENT = AsyncHttpClient()
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.close()
+
+
+def _ascii_host(hostname: str) -> str:
+    """IDNA-encode internationalized host names, as urllib does."""
+    try:
+        return hostname.encode("ascii").decode("ascii")
+    except UnicodeEncodeError:
+        return hostname.encode("idna").decode("ascii")
+
+
+def _build_request(parts: SplitResult, headers: dict[str, str]) -> bytes:
+    target = quote(parts.path or "/", safe=_URL_SAFE)
+    if parts.query:
+        target += "?" + quote(parts.query, safe=_URL_SAFE)
+    host = _ascii_host(parts.hostname or "")
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    fields = {
+        "Host": host,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+    for name, value in headers.items():
+        fields[_canonical_header(name)] = str(value)
+    lines = [f"GET {target} HTTP/1.1"]
+    for name, value in fields.items():
+        if any(ch in name + value for ch in "\r\n") or not (name + value).isascii():
+            raise ValueError(f"Invalid header: {name}")
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("ascii")
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, int, dict[str, str]]:
+    while True:
+        raw = await reader.readuntil(b"\r\n\r\n")
+        lines = raw.decode("latin-1").split("\r\n")
+        version, _, rest = lines[0].partition(" ")
+        try:
+            status = int(rest.split(" ", 1)[0])
+        except ValueError as exc:
+            raise HttpProtocolError(f"Malformed status line: {lines[0]!r}") from exc
+        if 100 <= status < 200 and status != 101:
+            continue
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if not line or ":" not in line:
+                continue
+            name, _, value = line.partition(":")
+            name = _canonical_header(name.strip())
+            value = value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        return version.upper(), status, headers
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, status: int, headers: dict[str, str]
+) -> tuple[bytes, bool]:
+    """Return the body and whether the connection ended cleanly after it."""
+    if status in {204, 304} or 100 <= status < 200:
+        return b"", True
+    if "chunked" in headers.get("Transfer-Encoding", "").lower():
+        return await _read_chunked(reader), True
+    length = headers.get("Content-Length")
+    if length is not None:
+        try:
+            size = int(length)
+        except ValueError as exc:
+            raise HttpProtocolError(f"Invalid Content-Length: {length!r}") from exc
+        return await reader.readexactly(size), True
+    # No framing: the body runs until the server closes the connection.
+    return await reader.read(), False
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        try:
+            size = int(line.split(b";", 1)[0].strip(), 16)
+        except ValueError as exc:
+            raise HttpProtocolError(f"Invalid chunk size: {line!r}") from exc
+        if size == 0:
+            break
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+    while await reader.readuntil(b"\r\n") != b"\r\n":
+        pass  # Trailer fields.
+    return b"".join(chunks)
+
+
+def _keep_alive(version: str, headers: dict[str, str]) -> bool:
+    connection = headers.get("Connection", "").lower()
+    if "close" in connection:
+        return False
+    return version == "HTTP/1.1" or "keep-alive" in connection
+
+
+def _decode_body(body: bytes, headers: dict[str, str]) -> tuple[bytes, dict[str, str]]:
+    encoding = headers.get("Content-Encoding", "").strip().lower()
+    if encoding in {"", "identity"}:
+        return body, headers
+    try:
+        if encoding in {"gzip", "x-gzip"}:
+            decoded = gzip.decompress(body)
+        elif encoding == "deflate":
+            try:
+                decoded = zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib wrapper.
+                decoded = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            decoded = brotli.decompress(body)
+        else:
+            return body, headers
+    except Exception as exc:  # noqa: BLE001
+        log_exception("http_client", exc)
+        return body, headers
+    cleaned = {
+        name: value
+        for name, value in headers.items()
+        if name not in {"Content-Encoding", "Content-Length"}
+    }
+    return decoded, cleaned
+
+
+def _canonical_header(name: str) -> str:
+    return "-".join(part.capitalize() for part in name.split("-"))
+
+
+def _uses_proxy(parts: SplitResult) -> bool:
+    proxies = getproxies()
+    return parts.scheme in proxies and not proxy_bypass(parts.hostname or "")
+
+
+def _urllib_get(url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
+    req = Request(url, headers=headers)
+    with urlopen(req, timeout=timeout_s) as resp:  # noqa: S310
+        status = getattr(resp, "status", None)
+        if status is None:
+            status = int(resp.getcode())
+        headers_out = {k: v for k, v in resp.headers.items()}
+        body = resp.read()
+        return HttpResponse(url=resp.geturl(), status=status, headers=headers_out, body=body)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import atexit
+import base64
+import json
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+from ..core.session_log import log_exception
+
+PANDOC_BACKEND_SUBPROCESS = "subprocess"
+PANDOC_BACKEND_SERVER = "server"
+PANDOC_BACKENDS = (PANDOC_BACKEND_SUBPROCESS, PANDOC_BACKEND_SERVER)
+DEFAULT_PANDOC_REQUEST_TIMEOUT_S = 120
+_STARTUP_TIMEOUT_S = 10.0
+
+
+class PandocServerError(RuntimeError):
+    pass
+
+
+class PandocServerUnavailable(PandocServerError):
+    """The server could not be started; use subprocess pandoc instead."""
+
+
+class PandocServer:
+    """A long-lived `pandoc server` child process shared by conversions.
+
+    The server has no filesystem access: inputs, outputs and any resources such
+    as images travel in the request body. It is started on first use, probed
+    with a tiny conversion (some pandoc builds ship a server that crashes on its
+    first request), and restarted once if it dies between requests.
+    """
+
+    def __init__(
+        self,
+        executable: str,
+        *,
+        request_timeout_s: int = DEFAULT_PANDOC_REQUEST_TIMEOUT_S,
+    ) -> None:
+        self.executable = executable
+        self.request_timeout_s = request_timeout_s
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._url: str | None = None
+
+    def convert(
+        self,
+        text: str | bytes,
+        *,
+        from_format: str,
+        to: str,
+        options: dict[str, Any] | None = None,
+        files: dict[str, bytes] | None = None,
+    ) -> str | bytes:
+        """Convert text (bytes for binary formats such as DOCX) like `pandoc -f -t`.
+
+        options use pandoc's long option names without dashes, e.g.
+        {"standalone": True, "track-changes": "all"}. Binary output is returned
+        as bytes, text output as str.
+        """
+        payload: dict[str, Any] = {
+            "text": base64.b64encode(text).decode("ascii") if isinstance(text, bytes) else text,
+            "from": from_format,
+            "to": to,
+            **(options or {}),
+        }
+        if files:
+            payload["files"] = {
+                name: base64.b64encode(data).decode("ascii") for name, data in files.items()
+            }
+        body = json.dumps(payload).encode("utf-8")
+        for attempt in range(2):
+            url = self._ensure_started()
+            try:
+                response = self._post(url, body)
+                break
+            except (urllib.error.URLError, ConnectionError) as exc:
+                if attempt == 1 or self.is_running():
+                    raise PandocServerError(f"pandoc server request failed: {exc}") from exc
+                log_exception("pandoc_backend", exc)
+        if "error" in response:
+            raise PandocServerError(str(response["error"]))
+        output = response.get("output", "")
+        if response.get("base64"):
+            return base64.b64decode(output)
+        return str(output)
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process, self._url = self._process, None, None
+        if process is None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _post(self, url: str, body: bytes) -> dict[str, Any]:
+        request = urllib.request.Request(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.request_timeout_s + 5) as reply:
+                raw = reply.read()
+        except urllib.error.HTTPError as exc:
+            raw = exc.read()
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            # Option errors come back as plain text.
+            return {"error": raw.decode("utf-8", errors="replace").strip()}
+        return parsed if isinstance(parsed, dict) else {"error": "Unexpected response"}
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _ensure_started(self) -> str:
+        with self._lock:
+            if self.is_running() and self._url:
+                return self._url
+            self._url = None
+            port = _free_port()
+            try:
+                self._process = subprocess.Popen(
+                    [
+                        self.executable,
+                        "server",
+                        f"--port={port}",
+                        f"--timeout={self.request_timeout_s}",
+                    ],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as exc:
+                raise PandocServerUnavailable(f"Cannot start pandoc server: {exc}") from exc
+            url = f"http://127.0.0.1:{port}/"
+            try:
+                self._wait_until_ready(url)
+            except PandocServerUnavailable:
+                self._process.kill()
+                self._process = None
+                raise
+            self._url = url
+            return url
+
+    def _wait_until_ready(self, url: str) -> None:
+        probe = json.dumps({"text": "x", "from": "markdown", "to": "html"}).encode("utf-8")
+        deadline = time.monotonic() + _STARTUP_TIMEOUT_S
+        while True:
+            if self._process is None or self._process.poll() is not None:
+                raise PandocServerUnavailable("pandoc server exited during startup.")
+            try:
+                reply = self._post(url, probe)
+            except urllib.error.URLError as exc:
+                refused = isinstance(exc.reason, ConnectionRefusedError)
+                if not refused or time.monotonic() > deadline:
+                    raise PandocServerUnavailable(f"pandoc server did not start: {exc}") from exc
+                time.sleep(0.05)
+                continue
+            except ConnectionError as exc:
+                raise PandocServerUnavailable(f"pandoc server failed its probe: {exc}") from exc
+            if reply.get("output") is None:
+                raise PandocServerUnavailable(f"pandoc server failed its probe: {reply}")
+            return
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+_SERVER: PandocServer | None = None
+_SERVER_UNAVAILABLE = False
+_SERVER_LOCK = threading.Lock()
+
+
+def pandoc_server() -> PandocServer | None:
+    """Return the shared pandoc server, or None once it has failed to start."""
+    global _SERVER, _SERVER_UNAVAILABLE
+    with _SERVER_LOCK:
+        if _SERVER_UNAVAILABLE:
+            return None
+        if _SERVER is None:
+            try:
+                import pypandoc
+
+                _SERVER = PandocServer(pypandoc.get_pandoc_path())
+            except Exception as exc:  # noqa: BLE001
+                log_exception("pandoc_backend", exc)
+                _SERVER_UNAVAILABLE = True
+                return None
+            atexit.register(_SERVER.close)
+        return _SERVER
+
+
+def mark_pandoc_server_unavailable() -> None:
+    """Stop using the server for the rest of the process and shut it down."""
+    global _SERVER, _SERVER_UNAVAILABLE
+    with _SERVER_LOCK:
+        server, _SERVER = _SERVER, None
+        _SERVER_UNAVAILABLE = True
+    if server is not None:
+        server.close()
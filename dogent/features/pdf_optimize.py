@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..core.session_log import log_exception
+
+
+@dataclass(frozen=True)
+class PdfOptimizeResult:
+    before_bytes: int
+    after_bytes: int
+    linearized: bool = False
+
+    @property
+    def replaced(self) -> bool:
+        return self.after_bytes < self.before_bytes
+
+    def describe(self) -> str:
+        if not self.replaced:
+            return f"PDF optimization skipped: already compact ({_format_size(self.before_bytes)})."
+        saved = 100 * (self.before_bytes - self.after_bytes) / self.before_bytes
+        layout = ", linearized" if self.linearized else ""
+        return (
+            f"PDF optimized: {_format_size(self.before_bytes)} -> "
+            f"{_format_size(self.after_bytes)} ({saved:.0f}% smaller{layout})."
+        )
+
+
+def optimize_pdf(path: Path) -> PdfOptimizeResult | None:
+    """Losslessly shrink the PDF at path in place.
+
+    Fonts are subset, streams deflated and duplicate objects (repeated fonts
+    and images) merged. The file is linearized for fast web view when the
+    installed MuPDF still supports it. The original is kept if the rewrite is
+    not smaller; None means PyMuPDF is missing or the file could not be read.
+    """
+    try:
+        import fitz
+    except Exception as exc:  # noqa: BLE001
+        log_exception("pdf_optimize", exc)
+        return None
+    try:
+        before = path.stat().st_size
+        doc = fitz.open(path)
+    except Exception as exc:  # noqa: BLE001
+        log_exception("pdf_optimize", exc)
+        return None
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".pdf")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            doc.subset_fonts()
+        except Exception as exc:  # noqa: BLE001
+            log_exception("pdf_optimize", exc)
+        linearized = _save_compact(doc, tmp_path)
+        doc.close()
+        after = tmp_path.stat().st_size
+        result = PdfOptimizeResult(before, after, linearized)
+        if result.replaced:
+            os.replace(tmp_path, path)
+        return result
+    except Exception as exc:  # noqa: BLE001
+        log_exception("pdf_optimize", exc)
+        return None
+    finally:
+        if not doc.is_closed:
+            doc.close()
+        tmp_path.unlink(missing_ok=True)
+
+
+def _save_compact(doc: object, target: Path) -> bool:
+    options = {
+        "garbage": 4,
+        "clean": True,
+        "deflate": True,
+        "deflate_images": True,
+        "deflate_fonts": True,
+    }
+    try:
+        doc.save(str(target), linear=True, **options)  # type: ignore[attr-defined]
+        return True
+    except Exception as exc:  # noqa: BLE001
+        log_exception("pdf_optimize", exc)
+        # MuPDF 1.22+ dropped linearization; object streams compress further.
+        doc.save(str(target), use_objstms=1, **options)  # type: ignore[attr-defined]
+        return False
+
+
+def _format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.0f} KB"
+    return f"{size} B"
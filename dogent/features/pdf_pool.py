@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def pdf_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared PDF extraction pool, started on first use.
+
+    Workers are spawned, not forked: a forked child would inherit the event loop,
+    its selector and locks held by other threads. Spawning costs an interpreter
+    start and a PyMuPDF import per worker, so the pool outlives a single read and
+    is only replaced when a caller needs more workers than it has.
+    """
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS < workers:
+            if _POOL is not None:
+                # Work already submitted to the smaller pool still completes.
+                _POOL.shutdown(wait=False)
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def close_pdf_process_pool() -> None:
+    """Shut the shared pool down, cancelling extraction work that has not started."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_WORKERS = _POOL, None, 0
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
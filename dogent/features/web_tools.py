@@ -1,21 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import gzip
 import hashlib
+import inspect
 import json
 import re
-from dataclasses import dataclass
 from html import unescape
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional
 from urllib.parse import urlencode, urlparse
-from urllib.request import Request, urlopen
 
 from claude_agent_sdk import SdkMcpTool, create_sdk_mcp_server, tool
 
 from .. import __version__
 from ..core.session_log import log_exception
+from .http_client import DEFAULT_CONNECT_TIMEOUT_S, HttpResponse, http_client
 
 DOGENT_WEB_ALLOWED_TOOLS = ["mcp__dogent__web_search", "mcp__dogent__web_fetch"]
 DOGENT_WEB_TOOL_DISPLAY_NAMES = {
@@ -24,23 +25,8 @@ DOGENT_WEB_TOOL_DISPLAY_NAMES = {
 }
 
 
-@dataclass(frozen=True)
-class HttpResponse:
-    url: str
-    status: int
-    headers: dict[str, str]
-    body: bytes
-
-
-def _http_get(url: str, *, headers: dict[str, str], timeout_s: float) -> HttpResponse:
-    req = Request(url, headers=headers)
-    with urlopen(req, timeout=timeout_s) as resp:  # noqa: S310
-        status = getattr(resp, "status", None)
-        if status is None:
-            status = int(resp.getcode())
-        headers_out = {k: v for k, v in resp.headers.items()}
-        body = resp.read()
-        return HttpResponse(url=resp.geturl(), status=status, headers=headers_out, body=body)
+# Injection point for tests and alternative transports; sync callables run in a thread.
+HttpGet = Callable[[str, dict[str, str], float], HttpResponse | Awaitable[HttpResponse]]
 
 
 def _default_user_agent(web_profile_cfg: dict[str, Any]) -> str:
@@ -239,12 +225,27 @@ def create_dogent_web_tools(
     root: Path,
     web_profile_name: Optional[str],
     web_profile_cfg: dict[str, Any],
-    http_get: Callable[[str, dict[str, str], float], HttpResponse] | None = None,
+    http_get: HttpGet | None = None,
 ) -> list[SdkMcpTool[Any]]:
-    def _adapter(url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
-        return _http_get(url, headers=headers, timeout_s=timeout_s)
+    connect_timeout_s = float(
+        web_profile_cfg.get("connect_timeout_s") or DEFAULT_CONNECT_TIMEOUT_S
+    )
 
-    http_get = http_get or _adapter
+    async def _pooled_get(url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
+        return await http_client().get(
+            url, headers=headers, timeout_s=timeout_s, connect_timeout_s=connect_timeout_s
+        )
+
+    fetch = http_get or _pooled_get
+
+    async def _get(url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
+        if inspect.iscoroutinefunction(fetch):
+            result = fetch(url, headers, timeout_s)
+        else:
+            result = await asyncio.to_thread(fetch, url, headers, timeout_s)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
     web_search_schema = {
         "type": "object",
@@ -335,7 +336,7 @@ def create_dogent_web_tools(
                 if mode == "image":
                     params["searchType"] = "image"
                 url = "https://www.googleapis.com/customsearch/v1?" + urlencode(params)
-                resp = http_get(url, headers, timeout_s)
+                resp = await _get(url, headers, timeout_s)
                 if resp.status >= 400:
                     raise ValueError(f"HTTP {resp.status} from Google Custom Search API")
                 payload = json.loads(resp.body.decode("utf-8", errors="replace"))
@@ -350,7 +351,7 @@ def create_dogent_web_tools(
                 path = "/images/search" if mode == "image" else "/search"
                 url = endpoint + path + "?" + urlencode({"q": query, "count": str(num_results)})
                 headers = {"User-Agent": user_agent, "Ocp-Apim-Subscription-Key": api_key}
-                resp = http_get(url, headers, timeout_s)
+                resp = await _get(url, headers, timeout_s)
                 if resp.status >= 400:
                     raise ValueError(f"HTTP {resp.status} from Bing Search API")
                 payload = json.loads(resp.body.decode("utf-8", errors="replace"))
@@ -365,7 +366,7 @@ def create_dogent_web_tools(
                 path = "/images/search" if mode == "image" else "/web/search"
                 url = endpoint + path + "?" + urlencode({"q": query, "count": str(num_results)})
                 headers = {"User-Agent": user_agent, "X-Subscription-Token": api_key}
-                resp = http_get(url, headers, timeout_s)
+                resp = await _get(url, headers, timeout_s)
                 if resp.status >= 400:
                     raise ValueError(f"HTTP {resp.status} from Brave Search API")
                 payload = json.loads(resp.body.decode("utf-8", errors="replace"))
@@ -418,7 +419,7 @@ def create_dogent_web_tools(
         headers = {"User-Agent": user_agent, "Accept": "*/*"}
 
         try:
-            resp = http_get(url, headers, timeout_s)
+            resp = await _get(url, headers, timeout_s)
         except Exception as exc:  # noqa: BLE001
             log_exception("web_tools", exc)
             return {"content": [{"type": "text", "text": f"WebFetch failed: {exc}"}], "is_error": True}
@@ -516,7 +517,7 @@ def create_dogent_web_mcp_server(
     root: Path,
     web_profile_name: Optional[str],
     web_profile_cfg: dict[str, Any],
-    http_get: Callable[[str, dict[str, str], float], HttpResponse] | None = None,
+    http_get: HttpGet | None = None,
 ):
     tools = create_dogent_web_tools(
         root=root,
@@ -0,0 +1,262 @@
+"""Console entry point: batch subcommands without loading the interactive CLI.
+
+`dogent convert` and `dogent export` only need the document pipeline, so they
+are dispatched here before dogent.cli (and the agent SDK behind it) is imported.
+Everything else falls through to the full CLI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from .config.paths import DogentPaths
+
+SUBCOMMANDS = ("convert", "export")
+_CONVERT_FORMATS = ("docx", "md", "pdf")
+_EXPORT_FORMATS = ("docx", "pdf")
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in SUBCOMMANDS:
+        raise SystemExit(run_subcommand(args))
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+def run_subcommand(argv: list[str]) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "convert":
+            jobs = _convert_jobs(args.inputs, args.output, args.to)
+        else:
+            jobs = _export_jobs(args.inputs, args.output, args.format)
+    except ValueError as exc:
+        parser.error(str(exc))
+    try:
+        return asyncio.run(_run(args, jobs))
+    except KeyboardInterrupt:
+        # Ctrl+C is how a watch session ends.
+        return 0 if getattr(args, "watch", False) else 14
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="dogent")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser(
+        "convert",
+        help="Convert documents between docx, pdf, xlsx and md",
+        description=(
+            "Convert INPUT to OUTPUT. With several inputs or glob patterns, "
+            "OUTPUT is a directory and --to picks the target format."
+        ),
+    )
+    convert.add_argument("inputs", nargs="+", metavar="INPUT")
+    convert.add_argument("output", metavar="OUTPUT")
+    convert.add_argument("--to", choices=_CONVERT_FORMATS, help="Target format for bulk jobs")
+
+    export = commands.add_parser(
+        "export",
+        help="Export Markdown to PDF or DOCX",
+        description="Export Markdown files; outputs default to the source name.",
+    )
+    export.add_argument("inputs", nargs="+", metavar="MD")
+    export.add_argument("--format", required=True, choices=_EXPORT_FORMATS)
+    export.add_argument("-o", "--output", help="Output file, or directory for several inputs")
+    export.add_argument("--title", help="PDF document title")
+    export.add_argument(
+        "--force", action="store_true", help="Re-export even when the output is up to date"
+    )
+    export.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-export when the Markdown, its images or pdf_style.css change",
+    )
+    return parser
+
+
+def expand_inputs(patterns: list[str]) -> list[Path]:
+    """Expand glob patterns (shells on Windows leave them to us), keeping order."""
+    paths: list[Path] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise ValueError(f"No files match: {pattern}")
+        else:
+            matches = [pattern]
+        for match in matches:
+            path = Path(match)
+            if path.is_dir():
+                continue
+            key = path.resolve()
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    if not paths:
+        raise ValueError("No input files.")
+    return paths
+
+
+def _convert_jobs(patterns: list[str], output: str, to: str | None) -> list[tuple[Path, Path]]:
+    inputs = expand_inputs(patterns)
+    bulk = len(inputs) > 1 or any(glob.has_magic(pattern) for pattern in patterns)
+    out = Path(output)
+    if not bulk and not out.is_dir() and not output.endswith(("/", "\\")):
+        return [(inputs[0], out)]
+    if not to:
+        raise ValueError("--to is required when OUTPUT is a directory.")
+    return _unique_targets([(path, out / f"{path.stem}.{to}") for path in inputs])
+
+
+def _export_jobs(patterns: list[str], output: str | None, fmt: str) -> list[tuple[Path, Path]]:
+    inputs = expand_inputs(patterns)
+    if output is None:
+        return _unique_targets([(path, path.with_suffix(f".{fmt}")) for path in inputs])
+    out = Path(output)
+    if len(inputs) == 1 and not out.is_dir() and not output.endswith(("/", "\\")):
+        return [(inputs[0], out)]
+    return _unique_targets([(path, out / f"{path.stem}.{fmt}") for path in inputs])
+
+
+def _unique_targets(jobs: list[tuple[Path, Path]]) -> list[tuple[Path, Path]]:
+    owners: dict[Path, Path] = {}
+    for source, target in jobs:
+        previous = owners.setdefault(target.resolve(), source)
+        if previous is not source:
+            raise ValueError(f"{previous} and {source} would both write {target}.")
+    return jobs
+
+
+async def _run(args: argparse.Namespace, jobs: list[tuple[Path, Path]]) -> int:
+    from .features import document_io
+    from .features.browser_pool import close_chromium_pool
+    from .features.pdf_pool import close_pdf_process_pool
+
+    root = Path.cwd()
+    settings = document_io.load_document_settings(_load_config(root))
+    try:
+        if args.command == "convert":
+            failures = await _convert(document_io, jobs, root, settings)
+        else:
+            failures = await _export(document_io, args, jobs, root, settings)
+    finally:
+        await close_chromium_pool()
+        close_pdf_process_pool()
+    return 1 if failures else 0
+
+
+async def _convert(
+    document_io: Any, jobs: list[tuple[Path, Path]], root: Path, settings: Any
+) -> int:
+    async def run(source: Path, target: Path) -> bool:
+        started = time.perf_counter()
+        try:
+            result = await document_io.convert_document_async(
+                source, output_path=target, workspace_root=root, settings=settings
+            )
+        except Exception as exc:  # noqa: BLE001
+            _report_error(source, exc)
+            return False
+        _report(source, target, time.perf_counter() - started, result.notes)
+        return True
+
+    results = await asyncio.gather(*(run(source, target) for source, target in jobs))
+    return results.count(False)
+
+
+async def _export(
+    document_io: Any,
+    args: argparse.Namespace,
+    jobs: list[tuple[Path, Path]],
+    root: Path,
+    settings: Any,
+) -> int:
+    export_jobs = [
+        document_io.ExportJob(source, target, args.format, args.title) for source, target in jobs
+    ]
+    if args.watch:
+        from .features.export_watch import ExportWatcher
+
+        watcher = ExportWatcher(
+            export_jobs,
+            workspace_root=root,
+            settings=settings,
+            on_results=_report_exports,
+            force=args.force,
+        )
+        print(f"Watching {len(export_jobs)} file(s); press Ctrl+C to stop.", file=sys.stderr)
+        await watcher.run()
+        return 0
+    results = await document_io.export_markdown_batch_async(
+        export_jobs, workspace_root=root, settings=settings, force=args.force
+    )
+    return _report_exports(results)
+
+
+def _report_exports(results: list[Any]) -> int:
+    failures = 0
+    for result in results:
+        job = result.job
+        if result.error:
+            failures += 1
+            _report_error(job.md_path, result.error)
+        elif result.skipped:
+            print(f"{job.md_path} -> {job.output_path} (up to date)")
+        else:
+            _report(job.md_path, job.output_path, result.seconds, result.warnings)
+    return failures
+
+
+def _report(source: Path, target: Path, seconds: float, notes: list[str]) -> None:
+    print(f"{source} -> {target} ({seconds:.1f}s)")
+    for note in notes:
+        print(f"  {note}")
+
+
+def _report_error(source: Path, error: object) -> None:
+    print(f"{source}: {error}", file=sys.stderr)
+
+
+def _load_config(root: Path) -> dict[str, Any]:
+    """Merge the global workspace defaults and the workspace config, keeping `documents`.
+
+    Read directly rather than through ConfigManager, which pulls in the agent SDK,
+    but merged the same way as ConfigManager.load_project_config.
+    """
+    paths = DogentPaths(root)
+    defaults = _read_json(paths.global_config_file).get("workspace_defaults")
+    merged = _merge_dicts(
+        defaults if isinstance(defaults, dict) else {}, _read_json(paths.config_file)
+    )
+    documents = merged.get("documents")
+    return {"documents": documents if isinstance(documents, dict) else {}}
+
+
+def _merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_dicts(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
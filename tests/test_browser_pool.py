@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from dogent.features.browser_pool import ChromiumPool
+
+
+class _FakePage:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.closed = False
+        self.context = self
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+        self.pages: list[_FakePage] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self) -> None:
+        self.browsers: list[_FakeBrowser] = []
+        self.chromium = self
+        self.stopped = 0
+
+    async def start(self) -> "_FakePlaywright":
+        return self
+
+    async def launch(self) -> _FakeBrowser:
+        browser = _FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self) -> None:
+        self.stopped += 1
+
+
+class ChromiumPoolTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.playwright = _FakePlaywright()
+        patcher = mock.patch(
+            "playwright.async_api.async_playwright", return_value=self.playwright
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_reuses_browser_and_pages_between_renders(self) -> None:
+        pool = ChromiumPool(max_pages=2)
+        seen = []
+
+        async def render(page: _FakePage) -> None:
+            seen.append(page)
+            await asyncio.sleep(0)
+
+        await pool.run(render)
+        await pool.run(render)
+        await asyncio.gather(pool.run(render), pool.run(render))
+
+        self.assertEqual(pool.launches, 1)
+        self.assertIs(seen[0], seen[1])
+        self.assertEqual(len(self.playwright.browsers[0].pages), 2)
+        await pool.close()
+        self.assertFalse(self.playwright.browsers[0].connected)
+
+    async def test_relaunches_after_crash_during_render(self) -> None:
+        pool = ChromiumPool()
+        calls = 0
+
+        async def render(page: _FakePage) -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                page.browser.connected = False
+                raise RuntimeError("Target closed")
+            return "ok"
+
+        self.assertEqual(await pool.run(render), "ok")
+        self.assertEqual(pool.launches, 2)
+
+        async def failing(page: _FakePage) -> None:
+            raise ValueError("bad html")
+
+        with self.assertRaises(ValueError):
+            await pool.run(failing)
+        self.assertEqual(pool.launches, 2)
+        await pool.close()
+
+    async def test_idle_timeout_closes_browser(self) -> None:
+        pool = ChromiumPool(idle_timeout_s=0.01)
+
+        async def render(page: _FakePage) -> None:
+            return None
+
+        await pool.run(render)
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(self.playwright.browsers[0].connected)
+        self.assertEqual(self.playwright.stopped, 1)
+        await pool.run(render)
+        self.assertEqual(pool.launches, 2)
+        await pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
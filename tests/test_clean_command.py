@@ -80,6 +80,28 @@ class CleanCommandTests(unittest.IsolatedAsyncioTestCase):
         else:
             os.environ.pop("HOME", None)
 
+    async def test_clean_cache_target(self) -> None:
+        original_home = os.environ.get("HOME")
+        with tempfile.TemporaryDirectory() as tmp_home, tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp_home
+            root = Path(tmp)
+            console = Console(record=True, force_terminal=False, color_system=None)
+            cli = DogentCLI(root=root, console=console, interactive_prompts=False)
+            cli.paths.document_cache_dir.mkdir(parents=True, exist_ok=True)
+            (cli.paths.document_cache_dir / "entry.json").write_text("{}", encoding="utf-8")
+            cli.paths.memory_file.write_text("keep", encoding="utf-8")
+
+            await cli._cmd_clean("/clean cache")
+
+            self.assertFalse(cli.paths.cache_dir.exists())
+            self.assertTrue(cli.paths.memory_file.exists())
+            self.assertIn(".dogent/cache", console.export_text())
+
+        if original_home is not None:
+            os.environ["HOME"] = original_home
+        else:
+            os.environ.pop("HOME", None)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import conversion_jobs, document_io, pdf_pool
+from dogent.features.conversion_jobs import (
+    ConversionCancelled,
+    ConversionScheduler,
+    cancel_conversion_jobs,
+    set_conversion_progress_listener,
+)
+
+
+class ConversionJobTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.events = []
+        set_conversion_progress_listener(self.events.append)
+        self.addCleanup(set_conversion_progress_listener, None)
+        self.scheduler = ConversionScheduler(max_workers=1)
+        self.addCleanup(self.scheduler.shutdown)
+
+    async def test_stages_run_off_loop_and_output_is_committed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "out.md"
+            async with self.scheduler.job("in.docx -> out.md", stages=2) as job:
+                target = job.staged_output(output)
+                thread = await job.run("first", lambda: threading.current_thread())
+                await job.run("second", target.write_text, "done", encoding="utf-8")
+                self.assertFalse(output.exists())
+
+            self.assertIsNot(thread, threading.main_thread())
+            self.assertEqual(output.read_text(encoding="utf-8"), "done")
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["out.md"])
+        self.assertEqual(
+            [event.describe() for event in self.events],
+            [
+                "Converting in.docx -> out.md: first (1/2)",
+                "Converting in.docx -> out.md: second (2/2)",
+                "Converted in.docx -> out.md",
+            ],
+        )
+
+    async def test_cancel_returns_immediately_and_discards_output(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(target: Path) -> None:
+            started.set()
+            release.wait(5)
+            target.write_text("late", encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "out.docx"
+
+            async def convert() -> None:
+                async with self.scheduler.job("in.md -> out.docx", stages=1) as job:
+                    await job.run("Markdown -> DOCX", slow, job.staged_output(output))
+
+            task = asyncio.create_task(convert())
+            await asyncio.to_thread(started.wait, 5)
+            self.assertEqual(cancel_conversion_jobs(), 1)
+            with self.assertRaisesRegex(ConversionCancelled, "in.md -> out.docx"):
+                await asyncio.wait_for(task, timeout=1)
+
+            release.set()
+            for _ in range(100):
+                if not list(Path(tmp).iterdir()):
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+        self.assertTrue(self.events[-1].finished)
+
+    async def test_cancel_shuts_down_the_shared_pdf_worker_pool(self) -> None:
+        pool = mock.Mock()
+        with mock.patch.object(pdf_pool, "_POOL", pool):
+            self.assertEqual(cancel_conversion_jobs(), 0)
+            self.assertIsNone(pdf_pool._POOL)
+        pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    async def test_async_stage_is_not_started_after_cancel(self) -> None:
+        started = []
+
+        async def render() -> str:
+            started.append(True)
+            return "pdf"
+
+        async with self.scheduler.job("in.md -> out.pdf", stages=2) as job:
+            self.assertEqual(await job.wait("HTML -> PDF", render), "pdf")
+            job.cancel()
+            with self.assertRaises(ConversionCancelled):
+                await job.wait("HTML -> PDF", render)
+        self.assertEqual(started, [True])
+
+    async def test_convert_document_runs_blocking_stage_on_worker(self) -> None:
+        calls = []
+
+        def fake_docx_to_markdown(input_path, *, output_path, extract_media_dir, settings):
+            calls.append(threading.current_thread())
+            output_path.write_text("# Converted", encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "spec.docx"
+            source.write_bytes(b"docx")
+            output = Path(tmp) / "spec.md"
+            with (
+                mock.patch.object(document_io, "_docx_to_markdown", fake_docx_to_markdown),
+                mock.patch.object(
+                    document_io, "conversion_scheduler", return_value=self.scheduler
+                ),
+            ):
+                await document_io.convert_document_async(source, output_path=output)
+            self.assertEqual(output.read_text(encoding="utf-8"), "# Converted")
+        self.assertIsNot(calls[0], threading.main_thread())
+        self.assertEqual(self.events[0].stage, "DOCX -> Markdown")
+
+    def test_scheduler_is_replaced_when_worker_limit_changes(self) -> None:
+        with mock.patch.object(conversion_jobs, "_SCHEDULER", None):
+            first = conversion_jobs.conversion_scheduler(2)
+            self.assertIs(conversion_jobs.conversion_scheduler(2), first)
+            second = conversion_jobs.conversion_scheduler(3)
+            self.assertIsNot(second, first)
+            self.assertEqual(second.max_workers, 3)
+            second.shutdown()
+
+    async def test_replaced_scheduler_finishes_jobs_it_started(self) -> None:
+        with mock.patch.object(conversion_jobs, "_SCHEDULER", None):
+            first = conversion_jobs.conversion_scheduler(1)
+            async with first.job("a.docx -> a.pdf", stages=2) as job:
+                await job.run("DOCX -> Markdown", lambda: None)
+                second = conversion_jobs.conversion_scheduler(2)
+                self.assertEqual(await job.run("Markdown -> PDF", lambda: "done"), "done")
+            with self.assertRaises(RuntimeError):
+                first._executor.submit(lambda: None)
+            async with second.job("b.md -> b.docx", stages=1) as job:
+                self.assertEqual(await job.run("Markdown -> DOCX", lambda: 2), 2)
+            second.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import document_io
+from dogent.features.conversion_planner import ConversionStep, plan_conversion
+
+
+class ConversionPlannerTests(unittest.TestCase):
+    def test_plans_cheapest_path_through_markdown_and_html(self) -> None:
+        self.assertEqual(
+            [step.target for step in plan_conversion("docx", "pdf")], ["md", "html", "pdf"]
+        )
+        self.assertEqual([step.target for step in plan_conversion("xlsx", "docx")], ["md", "docx"])
+        self.assertEqual(plan_conversion("md", "docx")[0].label, "Markdown -> DOCX")
+
+    def test_prefers_cheaper_edges_and_rejects_unreachable_targets(self) -> None:
+        steps = (
+            ConversionStep("a", "c", "direct", 10),
+            ConversionStep("a", "b", "first", 2),
+            ConversionStep("b", "c", "second", 3),
+        )
+        self.assertEqual([step.label for step in plan_conversion("a", "c", steps)], ["first", "second"])
+        with self.assertRaisesRegex(ValueError, "Unsupported conversion: md -> xlsx"):
+            plan_conversion("md", "xlsx")
+        with self.assertRaisesRegex(ValueError, "same"):
+            plan_conversion("md", "md")
+
+
+class ConversionArtifactReuseTests(unittest.IsolatedAsyncioTestCase):
+    async def test_fan_out_conversions_share_markdown_and_html(self) -> None:
+        extractions = []
+        renders = []
+
+        def fake_docx_to_markdown(input_path, *, output_path, extract_media_dir, settings):
+            extractions.append(input_path.name)
+            output_path.write_text("# Spec\n\nBody", encoding="utf-8")
+
+        async def fake_html_to_pdf(html, *, output_path, **kwargs):
+            renders.append(html)
+            output_path.write_bytes(b"%PDF")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            source = root / "spec.docx"
+            source.write_bytes(b"docx bytes")
+            copy = root / "copy.docx"
+            copy.write_bytes(b"docx bytes")
+            with (
+                mock.patch.object(document_io, "_docx_to_markdown", fake_docx_to_markdown),
+                mock.patch.object(document_io, "_html_to_pdf", side_effect=fake_html_to_pdf),
+                mock.patch.object(
+                    document_io, "_resolve_pdf_style", return_value=("body {}", [])
+                ),
+            ):
+                await document_io.convert_document_async(
+                    source, output_path=root / "spec.md", workspace_root=root
+                )
+                await document_io.convert_document_async(
+                    source, output_path=root / "spec.pdf", workspace_root=root
+                )
+                await document_io.convert_document_async(
+                    copy, output_path=root / "out" / "spec.pdf", workspace_root=root
+                )
+
+            self.assertEqual(extractions, ["spec.docx"])
+            self.assertEqual(len(renders), 2)
+            self.assertEqual(renders[0], renders[1])
+            self.assertEqual((root / "spec.md").read_text(encoding="utf-8"), "# Spec\n\nBody")
+            self.assertEqual((root / "out" / "spec.pdf").read_bytes(), b"%PDF")
+            artifacts = sorted(
+                path.suffix for path in (root / ".dogent" / "cache" / "artifacts").iterdir()
+            )
+            self.assertEqual(artifacts, [".html", ".md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
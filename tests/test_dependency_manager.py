@@ -37,6 +37,29 @@ class DependencyManagerTests(unittest.TestCase):
             )
         self.assertEqual(set(missing), {dm.DEP_PYPANDOC, dm.DEP_PANDOC})
 
+    def test_missing_dependencies_for_batch_read(self) -> None:
+        with (
+            mock.patch.object(dm, "_module_available", return_value=False),
+            mock.patch.object(dm, "_pandoc_available", return_value=False),
+        ):
+            missing = dm.missing_dependencies_for_tool(
+                "mcp__dogent__read_documents",
+                {"files": [{"path": "a.pdf"}, {"path": "b.xlsx"}, {"path": "c.pdf"}]},
+            )
+        self.assertEqual(missing, [dm.DEP_PYMUPDF, dm.DEP_OPENPYXL])
+
+    def test_missing_dependencies_for_batch_export(self) -> None:
+        with (
+            mock.patch.object(dm, "_module_available", return_value=False),
+            mock.patch.object(dm, "_pandoc_available", return_value=False),
+            mock.patch.object(dm, "_playwright_chromium_available", return_value=True),
+        ):
+            missing = dm.missing_dependencies_for_tool(
+                "mcp__dogent__export_documents",
+                {"jobs": [{"format": "docx"}, {"format": "pdf"}, {"format": "docx"}]},
+            )
+        self.assertEqual(missing, [dm.DEP_PYPANDOC, dm.DEP_PANDOC, dm.DEP_PLAYWRIGHT])
+
     def test_manual_instructions_include_download_path_on_install(self) -> None:
         with mock.patch.object(dm, "_os_name", return_value="linux"):
             message = dm.manual_instructions(
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from dogent.features.document_cache import ArtifactCache, DocumentCache, artifact_key
+
+
+class DocumentCacheTests(unittest.TestCase):
+    def test_round_trip_and_invalidation_on_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            source = tmp_path / "doc.pdf"
+            source.write_text("v1", encoding="utf-8")
+            cache = DocumentCache(tmp_path / "cache")
+
+            self.assertIsNone(cache.get(source, kind="text"))
+            cache.put(source, {"content": "one"}, kind="text")
+            self.assertEqual(cache.get(source, kind="text"), {"content": "one"})
+            self.assertIsNone(cache.get(source, kind="text", variant="Sheet2"))
+
+            source.write_text("version two", encoding="utf-8")
+            self.assertIsNone(cache.get(source, kind="text"))
+            cache.put(source, {"content": "two"}, kind="text")
+            self.assertEqual(len(list((tmp_path / "cache").glob("*.json"))), 1)
+
+    def test_evicts_least_recently_used_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            sources = []
+            for name in ("a", "b", "c"):
+                path = tmp_path / f"{name}.docx"
+                path.write_text(name, encoding="utf-8")
+                sources.append(path)
+            cache = DocumentCache(tmp_path / "cache", max_bytes=250)
+            payload = {"content": "x" * 80}
+
+            cache.put(sources[0], payload, kind="text")
+            cache.put(sources[1], payload, kind="text")
+            entries = sorted((tmp_path / "cache").glob("*.json"))
+            for idx, entry in enumerate(entries):
+                os.utime(entry, (1000 + idx, 1000 + idx))
+            cache.get(sources[0], kind="text")
+            cache.put(sources[2], payload, kind="text")
+
+            self.assertIsNotNone(cache.get(sources[0], kind="text"))
+            self.assertIsNone(cache.get(sources[1], kind="text"))
+            self.assertIsNotNone(cache.get(sources[2], kind="text"))
+            self.assertLessEqual(cache.size_bytes(), 250)
+
+    def test_clear_and_disabled_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            source = tmp_path / "doc.xlsx"
+            source.write_text("data", encoding="utf-8")
+
+            disabled = DocumentCache(tmp_path / "off", max_bytes=0)
+            disabled.put(source, {"content": "x"}, kind="text")
+            self.assertFalse((tmp_path / "off").exists())
+
+            cache = DocumentCache(tmp_path / "cache")
+            cache.put(source, {"content": "x"}, kind="text")
+            self.assertEqual(cache.clear(), 1)
+            self.assertIsNone(cache.get(source, kind="text"))
+
+
+
+class ArtifactCacheTests(unittest.TestCase):
+    def test_round_trip_and_lru_eviction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            cache = ArtifactCache(tmp_path / "artifacts", max_bytes=250)
+            keys = [artifact_key("docx->md", name) for name in ("a", "b", "c")]
+            self.assertEqual(len(set(keys)), 3)
+            self.assertIsNone(cache.get(keys[0], ".md"))
+
+            source = tmp_path / "out.md"
+            source.write_text("x" * 100, encoding="utf-8")
+            first = cache.put(keys[0], ".md", source)
+            self.assertEqual(first, tmp_path / "artifacts" / f"{keys[0]}.md")
+            cache.put(keys[1], ".md", source)
+            os.utime(first, (1, 1))
+            cache.put(keys[2], ".md", source)
+
+            self.assertIsNone(cache.get(keys[0], ".md"))
+            self.assertIsNotNone(cache.get(keys[1], ".md"))
+            self.assertEqual(cache.get(keys[2], ".md").read_text(encoding="utf-8"), "x" * 100)
+            self.assertIsNone(ArtifactCache(tmp_path / "off", max_bytes=0).put(keys[0], ".md", source))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,19 @@
+import json
 import os
+import re
+import shutil
 import sys
 import tempfile
 import unittest
+import zipfile
+from concurrent.futures import Future
 from unittest import mock
 from pathlib import Path
 from types import SimpleNamespace
+from urllib.parse import unquote, urlparse
 
-from dogent.features import document_io
+from dogent.features import document_io, pdf_pool
+from dogent.features.document_cache import DocumentCache
 from dogent.features.document_io import read_document
 
 
@@ -24,6 +31,112 @@ class DocumentIOTests(unittest.TestCase):
             self.assertEqual(result.metadata.get("returned"), 4)
             self.assertEqual(result.metadata.get("next_offset"), 7)
 
+    def test_read_large_text_window_matches_full_decode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "log.md"
+            data = ("line é中\r\n" * 30 + "x😀\r" * 20).encode("utf-8")
+            path.write_bytes(data + b"\xff tail \xe4\xb8")
+            full = path.read_text(encoding="utf-8", errors="replace")
+            cache = DocumentCache(tmp_path / "cache")
+
+            small_index = mock.patch.multiple(
+                document_io, _TEXT_WINDOW_MIN_BYTES=1, _TEXT_CHECKPOINT_BYTES=7
+            )
+            with small_index:
+                first = read_document(path, offset=5, length=10, cache=cache)
+                self.assertEqual(first.content, full[5:15])
+                self.assertIsNone(first.metadata["total_chars"])
+                self.assertEqual(first.metadata["next_offset"], 15)
+
+                for active_cache in (None, cache, cache):
+                    for offset in range(0, len(full) + 3, 13):
+                        result = read_document(
+                            path, offset=offset, length=17, cache=active_cache
+                        )
+                        self.assertEqual(result.content, full[offset : offset + 17])
+
+                tail = read_document(path, offset=len(full) - 4, length=10, cache=cache)
+                self.assertEqual(tail.metadata["total_chars"], len(full))
+                self.assertIsNone(tail.metadata["next_offset"])
+            index = cache.get(
+                path,
+                kind="text-index",
+                variant=str(document_io.DOCUMENT_READER_VERSION),
+            )
+            self.assertGreater(len(index["checkpoints"]), 10)
+
+    def test_outline_and_section_reads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "guide.md"
+            path.write_text(
+                "# Guide\n\nIntro\n\n## 3 Plans\n\n```\n# not a heading\n```\n\n"
+                "### 3.1 Basics\n\nbasic\n\n### 3.2 Pricing\n\nPrice is 5.\n\n"
+                "## 4 End\n\nbye\n",
+                encoding="utf-8",
+            )
+            cache = DocumentCache(tmp_path / "cache")
+
+            outline = read_document(path, outline=True, cache=cache)
+            self.assertIsNone(outline.error)
+            self.assertEqual(outline.metadata["headings"], 5)
+            self.assertIn("    - 3.2 Pricing (offset", outline.content)
+            self.assertNotIn("not a heading", outline.content)
+
+            pricing = read_document(path, section="3.2 Pricing", cache=cache)
+            self.assertEqual(pricing.content, "### 3.2 Pricing\n\nPrice is 5.\n\n")
+            self.assertEqual(pricing.metadata["total_chars"], len(pricing.content))
+            by_number = read_document(path, section="3", cache=cache)
+            self.assertTrue(by_number.content.startswith("## 3 Plans"))
+            self.assertTrue(by_number.content.endswith("Price is 5.\n\n"))
+            window = read_document(path, section="3", offset=4, length=5, cache=cache)
+            self.assertEqual(window.content, by_number.content[4:9])
+            self.assertEqual(window.metadata["next_offset"], 9)
+
+            missing = read_document(path, section="Appendix")
+            self.assertIn("Section not found", missing.error or "")
+
+    def test_outline_ignores_fence_openers_inside_a_code_block(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested.md"
+            text = (
+                "# Guide\n\n````\n```python\n# not a heading\n```\n````\n\n"
+                "```\n```python\n## still code\n```\n\n## Usage\n\nRun it.\n"
+            )
+            path.write_text(text, encoding="utf-8")
+
+            outline = read_document(path, outline=True)
+            self.assertEqual(outline.metadata["headings"], 2)
+            self.assertNotIn("not a heading", outline.content)
+            self.assertNotIn("still code", outline.content)
+            usage = read_document(path, section="Usage")
+            self.assertEqual(usage.content, "## Usage\n\nRun it.\n")
+
+    def test_pdf_outline_uses_bookmarks(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "book.pdf"
+            doc = fitz.open()
+            for idx in range(3):
+                page = doc.new_page()
+                page.insert_text((72, 72), f"Chapter {idx + 1}")
+                page.insert_text((72, 100), f"body {idx + 1}")
+            doc.set_toc([[1, "Chapter 1", 1], [1, "Chapter 2", 2], [2, "Chapter 3", 3]])
+            doc.save(str(path))
+            doc.close()
+
+            outline = read_document(path, outline=True)
+            self.assertEqual(outline.metadata["headings"], 3)
+            section = read_document(path, section="chapter 2")
+            self.assertTrue(section.content.startswith("Chapter 2\nbody 2"))
+            self.assertIn("body 3", section.content)
+            self.assertNotIn("body 1", section.content)
+
     def test_read_pdf_text(self) -> None:
         try:
             import fitz  # type: ignore
@@ -60,6 +173,201 @@ class DocumentIOTests(unittest.TestCase):
             self.assertIsNotNone(result.error)
             self.assertIn("no extractable text", result.error or "")
 
+    def test_read_pdf_window_matches_full_text(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "pages.pdf"
+            doc = fitz.open()
+            for idx in range(6):
+                page = doc.new_page()
+                if idx != 2:
+                    page.insert_text((72, 72), f"Page body {idx + 1} " + "x" * idx)
+            doc.save(str(path))
+            doc.close()
+            full = read_document(path, max_chars=0).content
+            cache = DocumentCache(tmp_path / "cache")
+
+            for offset in range(0, len(full) + 3, 11):
+                windowed = read_document(path, offset=offset, length=17, cache=cache)
+                self.assertEqual(windowed.content, full[offset : offset + 17])
+
+            first = read_document(path, max_chars=20)
+            self.assertEqual(first.metadata["pages"], 6)
+            self.assertEqual(first.metadata["indexed_pages"], 1)
+            self.assertIsNone(first.metadata["total_chars"])
+            self.assertEqual(first.metadata["next_offset"], 20)
+            self.assertTrue(first.content.endswith("...[truncated]..."))
+
+            indexed = read_document(path, max_chars=20, cache=cache)
+            self.assertEqual(indexed.metadata["total_chars"], len(full))
+
+    def test_read_pdf_explicit_pages(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pages.pdf"
+            doc = fitz.open()
+            for idx in range(5):
+                page = doc.new_page()
+                page.insert_text((72, 72), f"Page body {idx + 1}")
+            doc.save(str(path))
+            doc.close()
+
+            result = read_document(path, pages="2-3,5")
+            self.assertIsNone(result.error)
+            self.assertIn("<!-- page:2 -->", result.content)
+            self.assertIn("Page body 3", result.content)
+            self.assertIn("Page body 5", result.content)
+            self.assertNotIn("Page body 1", result.content)
+            self.assertEqual(result.metadata["page_range"], "2-3,5")
+
+            out_of_range = read_document(path, pages="40-55")
+            self.assertIn("outside the document", out_of_range.error or "")
+            not_pdf = read_document(Path(tmp) / "x.txt", pages="1")
+            self.assertIsNotNone(not_pdf.error)
+
+    def test_page_ranges_keep_first_seen_order_without_duplicates(self) -> None:
+        self.assertEqual(document_io._parse_page_ranges("4, 1-3 ,2,3-9", 5), [4, 1, 2, 3, 5])
+        every_page = document_io._parse_page_ranges("1-20000,7", 20000)
+        self.assertEqual(every_page, list(range(1, 20001)))
+
+    def test_read_pdf_parallel_extraction_matches_serial(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "long.pdf"
+            doc = fitz.open()
+            for idx in range(9):
+                page = doc.new_page()
+                if idx != 4:
+                    page.insert_text((72, 72), f"Page body {idx + 1}")
+            doc.save(str(path))
+            doc.close()
+
+            serial = read_document(
+                path,
+                max_chars=0,
+                settings=document_io.DocumentSettings(pdf_workers=1),
+            )
+            parallel_settings = document_io.DocumentSettings(
+                pdf_workers=2, pdf_parallel_min_pages=4
+            )
+            with (
+                mock.patch(
+                    "dogent.features.document_io._extract_pdf_pages_parallel",
+                    wraps=document_io._extract_pdf_pages_parallel,
+                ) as parallel,
+                mock.patch.object(
+                    pdf_pool, "ProcessPoolExecutor", wraps=pdf_pool.ProcessPoolExecutor
+                ) as pool,
+            ):
+                self.addCleanup(pdf_pool.close_pdf_process_pool)
+                result = read_document(path, max_chars=0, settings=parallel_settings)
+                again = read_document(path, max_chars=0, settings=parallel_settings)
+            self.assertEqual(parallel.call_count, 2)
+            # Both reads share one pool of spawned workers.
+            pool.assert_called_once()
+            self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+            self.assertEqual(again.content, serial.content)
+            self.assertEqual(result.content, serial.content)
+            self.assertIn("<!-- page:9 -->", result.content)
+
+            below_threshold = document_io.DocumentSettings(
+                pdf_workers=2, pdf_parallel_min_pages=50
+            )
+            with mock.patch(
+                "dogent.features.document_io._extract_pdf_pages_parallel"
+            ) as parallel:
+                read_document(path, max_chars=0, settings=below_threshold)
+            parallel.assert_not_called()
+
+            # A conversion whose worker pool was shut down by a cancel stops
+            # instead of finishing the remaining pages serially.
+            cancelled: Future[list[str]] = Future()
+            cancelled.cancel()
+            workers = mock.Mock(**{"submit.return_value": cancelled})
+            with mock.patch.object(document_io, "pdf_process_pool", return_value=workers):
+                with self.assertRaises(document_io.ConversionCancelled):
+                    list(document_io._iter_pdf_markdown(path, parallel_settings))
+
+    def test_read_xlsx_pages_through_cache_without_reparsing(self) -> None:
+        try:
+            import openpyxl  # type: ignore
+        except Exception:
+            self.skipTest("openpyxl not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "rows.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.append(["Name", "Value"])
+            for idx in range(10):
+                ws.append([f"Row {idx}", idx])
+            wb.save(path)
+            cache = DocumentCache(tmp_path / "cache")
+
+            uncached = read_document(path, max_chars=40)
+            with mock.patch(
+                "dogent.features.document_io._read_xlsx", wraps=document_io._read_xlsx
+            ) as read_xlsx:
+                first = read_document(path, max_chars=40, cache=cache)
+                second = read_document(
+                    path, offset=first.metadata["next_offset"], length=40, cache=cache
+                )
+            self.assertEqual(read_xlsx.call_count, 1)
+            self.assertEqual(first.content, uncached.content)
+            self.assertEqual(first.metadata, uncached.metadata)
+            self.assertEqual(second.metadata["offset"], 40)
+            self.assertEqual(second.metadata["sheets"], ["Sheet"])
+
+    def test_read_document_cache_skips_errors(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "empty.pdf"
+            doc = fitz.open()
+            doc.new_page()
+            doc.save(str(path))
+            doc.close()
+            cache = DocumentCache(tmp_path / "cache")
+
+            result = read_document(path, max_chars=0, cache=cache)
+            self.assertIsNotNone(result.error)
+            self.assertEqual(cache.size_bytes(), 0)
+
+    def test_load_document_settings(self) -> None:
+        settings = document_io.load_document_settings(
+            {"documents": {"cache_max_mb": 8}}
+        )
+        self.assertEqual(settings.cache_max_mb, 8)
+        fallback = document_io.load_document_settings(
+            {"documents": {"cache_max_mb": "bad"}}
+        )
+        self.assertEqual(fallback.cache_max_mb, document_io.DocumentSettings().cache_max_mb)
+        workers = document_io.load_document_settings(
+            {"documents": {"pdf_workers": 3, "pdf_parallel_min_pages": 0}}
+        )
+        self.assertEqual(workers.resolved_pdf_workers(), 3)
+        self.assertEqual(
+            workers.pdf_parallel_min_pages, document_io.DEFAULT_PDF_PARALLEL_MIN_PAGES
+        )
+
     def test_read_xlsx_default_and_named_sheet(self) -> None:
         try:
             import openpyxl  # type: ignore
@@ -115,6 +423,197 @@ class DocumentIOTests(unittest.TestCase):
             self.assertIn("## Main", result.content)
             self.assertIn("Row", result.content)
 
+    def test_read_xlsx_streams_only_capped_rows(self) -> None:
+        try:
+            import openpyxl  # type: ignore
+        except Exception:
+            self.skipTest("openpyxl not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "big.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Data"
+            ws.append(["Id", "Name", "Extra"])
+            for idx in range(500):
+                ws.append([idx, f"name-{idx}", "x"])
+            wb.save(path)
+
+            with mock.patch(
+                "dogent.features.document_io._xlsx_cell_value",
+                wraps=document_io._xlsx_cell_value,
+            ) as cell_value:
+                xml_result = document_io._read_xlsx_xml(
+                    path, sheet="Data", max_chars=0, offset=0, length=None
+                )
+            self.assertEqual(cell_value.call_count, document_io.DEFAULT_XLSX_MAX_ROWS * 3)
+            self.assertEqual(xml_result.metadata["rows"], 501)
+            self.assertEqual(xml_result.metadata["cols"], 3)
+            self.assertTrue(xml_result.metadata["truncated"])
+
+            openpyxl_result = read_document(path, sheet="Data", max_chars=0)
+            self.assertEqual(openpyxl_result.content, xml_result.content)
+            self.assertEqual(openpyxl_result.metadata, xml_result.metadata)
+
+    def test_read_xlsx_without_dimension_counts_all_rows(self) -> None:
+        try:
+            import openpyxl  # type: ignore
+        except Exception:
+            self.skipTest("openpyxl not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "source.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Data"
+            ws.append(["Id", "Name"])
+            for idx in range(80):
+                ws.append([idx, f"name-{idx}"])
+            ws.cell(row=81, column=4, value="wide")
+            wb.save(source)
+
+            path = Path(tmp) / "nodim.xlsx"
+            with zipfile.ZipFile(source) as src, zipfile.ZipFile(path, "w") as dst:
+                for item in src.infolist():
+                    data = src.read(item.filename)
+                    if item.filename == "xl/worksheets/sheet1.xml":
+                        data = re.sub(rb"<dimension[^>]*/>", b"", data)
+                    dst.writestr(item, data)
+
+            xml_result = document_io._read_xlsx_xml(
+                path, sheet="Data", max_chars=0, offset=0, length=None
+            )
+            openpyxl_result = read_document(path, sheet="Data", max_chars=0)
+            for result in (xml_result, openpyxl_result):
+                self.assertEqual(result.metadata["rows"], 81)
+                self.assertEqual(result.metadata["cols"], 4)
+                self.assertIn("name-0", result.content)
+                self.assertNotIn("name-60", result.content)
+
+    def test_read_xlsx_row_window_repeats_header(self) -> None:
+        try:
+            import openpyxl  # type: ignore
+        except Exception:
+            self.skipTest("openpyxl not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Data"
+            ws.append(["Id", "Name", "Qty"])
+            for idx in range(120):
+                ws.append([idx, f"name-{idx}", idx * 2])
+            wb.save(path)
+
+            result = read_document(
+                path, sheet="Data", row_offset=100, row_limit=5, columns="A,C"
+            )
+            self.assertIsNone(result.error)
+            lines = result.content.splitlines()
+            self.assertEqual(lines[0], "| Id | Qty |")
+            self.assertEqual(lines[2], "| 100 | 200 |")
+            self.assertIn("| 104 | 208 |", result.content)
+            self.assertNotIn("| 105 |", result.content)
+            self.assertEqual(result.metadata["rows"], 121)
+            self.assertEqual(result.metadata["columns"], ["A", "C"])
+            self.assertEqual(result.metadata["next_row_offset"], 105)
+
+            xml_result = document_io._read_xlsx_rows_xml(
+                path,
+                sheet="Data",
+                first_row=102,
+                last_row=106,
+                columns=[1, 3],
+                max_chars=0,
+                offset=0,
+                length=None,
+            )
+            self.assertEqual(xml_result.content, result.content)
+
+            last = read_document(path, row_offset=118, row_limit=5)
+            self.assertEqual(last.metadata["returned_rows"], 2)
+            self.assertIsNone(last.metadata["next_row_offset"])
+            self.assertTrue(last.content.startswith("| Id | Name | Qty |"))
+
+            bad_columns = read_document(path, columns="1-3")
+            self.assertIn("Invalid column range", bad_columns.error or "")
+            not_xlsx = read_document(Path(tmp) / "x.txt", row_offset=0)
+            self.assertIsNotNone(not_xlsx.error)
+
+    def test_column_spec_keeps_first_seen_order_without_duplicates(self) -> None:
+        self.assertEqual(document_io._parse_column_spec("C, a-D ,b"), [3, 1, 2, 4])
+        every_column = document_io._parse_column_spec("A-XFD,B")
+        self.assertEqual(every_column, list(range(1, 16385)))
+
+    def test_xlsx_shared_strings_resolve_only_requested(self) -> None:
+        main_ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+        rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+        row_count = document_io.DEFAULT_XLSX_MAX_ROWS * 4
+        strings = [f"first-{idx}" for idx in range(row_count)] + [
+            f"second-{idx}" for idx in range(row_count)
+        ]
+
+        def sheet_xml(base: int) -> str:
+            rows = "".join(
+                f'<row r="{idx + 1}"><c r="A{idx + 1}" t="s"><v>{base + idx}</v></c>'
+                f'<c r="B{idx + 1}"><v>{idx}</v></c></row>'
+                for idx in range(row_count)
+            )
+            return f'<worksheet xmlns="{main_ns}"><sheetData>{rows}</sheetData></worksheet>'
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "strings.xlsx"
+            with zipfile.ZipFile(path, "w") as zf:
+                zf.writestr(
+                    "xl/workbook.xml",
+                    f'<workbook xmlns="{main_ns}" xmlns:r="{rel_ns}"><sheets>'
+                    '<sheet name="First" sheetId="1" r:id="rId1"/>'
+                    '<sheet name="Second" sheetId="2" r:id="rId2"/>'
+                    "</sheets></workbook>",
+                )
+                zf.writestr(
+                    "xl/_rels/workbook.xml.rels",
+                    "<Relationships>"
+                    '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/>'
+                    '<Relationship Id="rId2" Target="worksheets/sheet2.xml"/>'
+                    "</Relationships>",
+                )
+                zf.writestr("xl/worksheets/sheet1.xml", sheet_xml(0))
+                zf.writestr("xl/worksheets/sheet2.xml", sheet_xml(row_count))
+                zf.writestr(
+                    "xl/sharedStrings.xml",
+                    f'<sst xmlns="{main_ns}">'
+                    + "".join(f"<si><t>{text}</t></si>" for text in strings)
+                    + "</sst>",
+                )
+
+            with zipfile.ZipFile(path) as zf:
+                shared = document_io._XlsxSharedStrings(zf)
+                shared.resolve([0, 2, 10_000])
+                self.assertEqual(set(shared._values), {0, 2})
+                self.assertEqual(shared.get(2), "first-2")
+                self.assertEqual(shared.get(10_000), "")
+
+            with mock.patch.object(
+                document_io._XlsxSharedStrings,
+                "resolve",
+                autospec=True,
+                side_effect=document_io._XlsxSharedStrings.resolve,
+            ) as resolve:
+                result = document_io._read_xlsx_xml(
+                    path, sheet=None, max_chars=0, offset=0, length=None
+                )
+            resolve.assert_called_once()
+            shared = resolve.call_args.args[0]
+            self.assertEqual(len(shared._values), document_io.DEFAULT_XLSX_MAX_ROWS * 2)
+            self.assertIsNone(result.error)
+            self.assertIn("| first-1 | 1 |", result.content)
+            self.assertIn("| second-1 | 1 |", result.content)
+            self.assertNotIn(
+                f"first-{document_io.DEFAULT_XLSX_MAX_ROWS}", result.content
+            )
+
     def test_read_docx_with_pandoc(self) -> None:
         try:
             import pypandoc  # type: ignore
@@ -226,6 +725,21 @@ class DocumentIOTests(unittest.TestCase):
         html = document_io._markdown_to_html(md, title="Test")
         self.assertIn("class=\"k\"", html)
 
+    def test_markdown_to_html_reuses_renderer_and_highlight_results(self) -> None:
+        try:
+            import pygments  # type: ignore
+        except Exception:
+            self.skipTest("pygments not installed")
+        block = "```rust\nfn cached_{n}() {{}}\n```\n"
+        md = block.format(n=1) * 3 + block.format(n=2)
+        real_highlight = pygments.highlight
+        with mock.patch("pygments.highlight", side_effect=real_highlight) as highlight:
+            first = document_io._markdown_to_html(md, title="A")
+            second = document_io._markdown_to_html(md, title="B")
+        self.assertEqual(highlight.call_count, 2)
+        self.assertEqual(first.split("<body>")[1], second.split("<body>")[1])
+        self.assertIs(document_io._markdown_renderer(), document_io._markdown_renderer())
+
     def test_markdown_to_html_includes_base_href(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             base_path = Path(tmp)
@@ -260,6 +774,48 @@ class DocumentIOTests(unittest.TestCase):
             )
             self.assertIn("data:image/png;base64", html)
 
+    def test_markdown_to_html_file_mode_links_workspace_images(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "workspace"
+            (root / "img").mkdir(parents=True)
+            (root / "img" / "a b.png").write_bytes(b"png")
+            (Path(tmp) / "outside.png").write_bytes(b"png")
+            html = document_io._markdown_to_html(
+                "![a](img/a%20b.png) ![b](../outside.png)",
+                title="Images",
+                base_path=root,
+                workspace_root=root,
+                image_mode=document_io.IMAGE_MODE_FILE,
+            )
+            self.assertIn(f'src="{(root / "img" / "a b.png").resolve().as_uri()}"', html)
+            self.assertIn('src="../outside.png"', html)
+            self.assertNotIn("data:", html)
+
+    def test_data_uri_cache_dedupes_and_tracks_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            first = root / "a.png"
+            second = root / "b.png"
+            first.write_bytes(b"same")
+            second.write_bytes(b"same")
+            cache = document_io._DataUriCache(max_bytes=1024)
+
+            uri = cache.get(first)
+            self.assertIs(cache.get(second), uri)
+            self.assertEqual(cache._bytes, len(uri))
+            with mock.patch.object(Path, "read_bytes", side_effect=AssertionError):
+                self.assertIs(cache.get(first), uri)
+
+            second.write_bytes(b"different")
+            os.utime(second, ns=(1, 1))
+            self.assertNotEqual(cache.get(second), uri)
+            self.assertEqual(len(cache._uris), 2)
+
+            small = document_io._DataUriCache(max_bytes=len(uri))
+            small.get(first)
+            small.get(second)
+            self.assertEqual(len(small._files), 1)
+
     def test_normalize_markdown_for_docx_converts_img_tags(self) -> None:
         md_text = (
             "Before\n"
@@ -315,6 +871,61 @@ class DocumentIOTests(unittest.TestCase):
                         document_io._configure_playwright_browsers()
 
 
+    def test_split_markdown_for_pdf_cuts_at_headings_and_page_breaks(self) -> None:
+        text = (
+            "# Title\n\nSee [site][ref].\n\n"
+            "## One\n\n```\n## not a heading\n```\n\n"
+            '<div class="page-break"></div>\n'
+            "More of chapter one.\n\n"
+            "## Two\n\nBody two.\n\n"
+            "[ref]: https://example.com\n"
+        )
+        chunks = document_io._split_markdown_for_pdf(text, 20)
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(chunks[1].startswith("## One"))
+        self.assertIn("## not a heading", chunks[1])
+        self.assertNotIn("page-break", "".join(chunks))
+        self.assertTrue(chunks[2].startswith("More of chapter one."))
+        self.assertTrue(chunks[3].startswith("## Two"))
+        self.assertTrue(all("[ref]: https://example.com" in chunk for chunk in chunks))
+        self.assertEqual(document_io._split_markdown_for_pdf(text, 10_000), [text])
+
+    def test_pdf_chunking_is_opt_in_and_keeps_cross_chunk_links_whole(self) -> None:
+        self.assertEqual(document_io.DocumentSettings().pdf_chunk_chars, 0)
+        body = "".join(f"## Part {n}\n\n{'text ' * 40}\n\n" for n in range(3))
+        linked = (
+            "# Report\n\n[See the appendix](#appendix)\n\n" + body
+            + '## Appendix\n\n<a id="appendix"></a>\n\nEnd.\n'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            md_path = root / "report.md"
+
+            def render(text: str, chunk_chars: int) -> list[str]:
+                md_path.write_text(text, encoding="utf-8")
+                target = document_io._markdown_to_print_html(
+                    md_path,
+                    root / "report.html",
+                    title="Report",
+                    css_text="",
+                    workspace_root=None,
+                    settings=document_io.DocumentSettings(
+                        pdf_chunk_chars=chunk_chars, image_dpi=0
+                    ),
+                    chunked=True,
+                )
+                return target.read_text(encoding="utf-8").split(
+                    document_io._PDF_CHUNK_SEPARATOR
+                )
+
+            self.assertEqual(len(render(body, 0)), 1)
+            self.assertEqual(len(render(body, 150)), 3)
+            parts = render(linked, 150)
+            self.assertEqual(len(parts), 1)
+            self.assertIn('href="#appendix"', parts[0])
+            self.assertIn('id="appendix"', parts[0])
+
+
 class DocumentIOAsyncTests(unittest.IsolatedAsyncioTestCase):
     async def test_playwright_install_runs_in_thread(self) -> None:
         with mock.patch(
@@ -347,6 +958,159 @@ class DocumentIOAsyncTests(unittest.IsolatedAsyncioTestCase):
             _, kwargs = html_to_pdf.await_args
             self.assertTrue(kwargs["source_url"].startswith("file://"))
 
+    async def test_cached_html_is_rerendered_when_prepared_images_are_gone(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        async def fake_html_to_pdf(html, *, output_path, **kwargs):
+            # Stand-in for Chromium: embed every file:// image that can be loaded.
+            doc = fitz.open()
+            page = doc.new_page()
+            for src in re.findall(r'src="(file://[^"]+)"', html):
+                image = Path(unquote(urlparse(src).path))
+                if image.is_file():
+                    page.insert_image(fitz.Rect(72, 72, 272, 122), filename=str(image))
+            doc.save(str(output_path))
+            doc.close()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            pix = fitz.Pixmap(fitz.csRGB, 1600, 400, os.urandom(1600 * 400 * 3), 0)
+            (root / "photo.png").write_bytes(pix.tobytes("png"))
+            md_path = root / "note.md"
+            md_path.write_text("![photo](photo.png)\n", encoding="utf-8")
+            output_path = root / "note.pdf"
+            settings = document_io.DocumentSettings(image_dpi=100)
+            image_cache = root / ".dogent" / "cache" / "images"
+
+            with (
+                mock.patch.object(document_io, "_html_to_pdf", side_effect=fake_html_to_pdf),
+                mock.patch.object(
+                    document_io, "_resolve_pdf_style", return_value=("body {}", [])
+                ),
+            ):
+                for _ in range(2):
+                    await document_io._markdown_to_pdf(
+                        md_path,
+                        output_path=output_path,
+                        title="Note",
+                        workspace_root=root,
+                        settings=settings,
+                    )
+                    with fitz.open(output_path) as doc:
+                        self.assertEqual(len(doc[0].get_images()), 1)
+                    self.assertTrue(list(image_cache.iterdir()))
+                    shutil.rmtree(image_cache)
+
+    async def test_long_markdown_renders_in_chunks_with_continuous_page_numbers(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        async def fake_html_to_pdf(html, *, output_path, footer_template=None, **kwargs):
+            doc = fitz.open()
+            if "pageNumber" in (footer_template or ""):
+                pages = html.count("<div")
+                for number in range(1, pages + 1):
+                    doc.new_page().insert_text((280, 820), f"{number} / {pages}")
+            else:
+                self.assertEqual(footer_template, "<span></span>")
+                heading = re.search(r"<h2>(.*?)</h2>", html).group(1)
+                for _ in range(2):
+                    doc.new_page().insert_text((72, 72), heading)
+            doc.save(str(output_path))
+            doc.close()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            md_path = root / "report.md"
+            md_path.write_text(
+                "# Report\n\n"
+                + "".join(f"## Part {n}\n\n{'text ' * 40}\n\n" for n in range(3)),
+                encoding="utf-8",
+            )
+            output_path = root / "report.pdf"
+            settings = document_io.DocumentSettings(pdf_chunk_chars=150, image_dpi=0)
+            with (
+                mock.patch.object(document_io, "_html_to_pdf", side_effect=fake_html_to_pdf),
+                mock.patch.object(
+                    document_io, "_resolve_pdf_style", return_value=("body {}", [])
+                ),
+            ):
+                await document_io._markdown_to_pdf(
+                    md_path, output_path=output_path, title="Report", settings=settings
+                )
+            with fitz.open(output_path) as doc:
+                texts = [page.get_text() for page in doc]
+            self.assertEqual(len(texts), 6)
+            self.assertIn("Part 0", texts[0])
+            self.assertIn("Part 2", texts[5])
+            self.assertIn("3 / 6", texts[2])
+            self.assertEqual(sorted(p.name for p in root.iterdir()), ["report.md", "report.pdf"])
+
+    async def test_export_skips_outputs_that_are_up_to_date(self) -> None:
+        renders = 0
+
+        async def fake_pdf(md_path: Path, *, output_path: Path, **kwargs) -> list[str]:
+            nonlocal renders
+            renders += 1
+            output_path.write_bytes(b"%PDF" * renders)
+            return []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            md_path = root / "note.md"
+            md_path.write_text('![a](img/a.png)\n<img src="img/b.png">', encoding="utf-8")
+            (root / "img").mkdir()
+            (root / "img" / "a.png").write_bytes(b"a")
+            (root / "img" / "b.png").write_bytes(b"b")
+            output_path = root / "out" / "note.pdf"
+            output_path.parent.mkdir()
+
+            async def export(**kwargs) -> document_io.DocumentExportResult:
+                return await document_io.export_markdown_async(
+                    md_path,
+                    output_path=output_path,
+                    format="pdf",
+                    title=kwargs.pop("title", "Note"),
+                    workspace_root=root,
+                    **kwargs,
+                )
+
+            with (
+                mock.patch.object(document_io, "_markdown_to_pdf", side_effect=fake_pdf),
+                mock.patch.object(
+                    document_io, "_resolve_pdf_style", return_value=("body {}", [])
+                ),
+            ):
+                self.assertEqual(await export(), document_io.DocumentExportResult([]))
+                self.assertEqual(
+                    await export(), document_io.DocumentExportResult([], skipped=True)
+                )
+                self.assertEqual(renders, 1)
+
+                (root / "img" / "b.png").write_bytes(b"changed")
+                await export()
+                await export(title="Other")
+                await export(title="Other", force=True)
+                self.assertEqual(renders, 4)
+
+                output_path.write_bytes(b"edited by hand")
+                await export(title="Other")
+                self.assertEqual(renders, 5)
+
+            manifests = list((root / ".dogent" / "cache" / "exports").glob("*.json"))
+            self.assertEqual(len(manifests), 1)
+            manifest = json.loads(manifests[0].read_text(encoding="utf-8"))
+            self.assertEqual(manifest["output"], str(output_path.resolve()))
+            self.assertEqual(
+                [Path(image["path"]).name for image in manifest["inputs"]["images"]],
+                ["a.png", "b.png"],
+            )
+
     async def test_markdown_to_docx_uses_resource_path(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "workspace"
@@ -442,6 +1206,65 @@ class DocumentConversionTests(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(result.output_format, "md")
             self.assertTrue(result.notes)
 
+    async def test_pdf_conversion_streams_same_text_as_full_read(self) -> None:
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            self.skipTest("PyMuPDF not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pdf_path = tmp_path / "source.pdf"
+            doc = fitz.open()
+            for number in range(5):
+                page = doc.new_page()
+                if number != 2:
+                    page.insert_text((72, 72), f"Page {number + 1}")
+            doc.save(str(pdf_path))
+            doc.close()
+
+            output_md = tmp_path / "output.md"
+            with mock.patch.object(
+                document_io, "read_document", side_effect=AssertionError("not streamed")
+            ):
+                await document_io.convert_document_async(pdf_path, output_path=output_md)
+            expected = read_document(pdf_path, max_chars=0).content
+            self.assertEqual(output_md.read_text(encoding="utf-8"), expected)
+            parallel = "".join(
+                document_io._iter_pdf_markdown(
+                    pdf_path,
+                    document_io.DocumentSettings(pdf_workers=2, pdf_parallel_min_pages=1),
+                )
+            )
+            self.assertEqual(parallel, expected)
+
+    async def test_xlsx_conversion_writes_every_row(self) -> None:
+        try:
+            import openpyxl  # type: ignore
+        except Exception:
+            self.skipTest("openpyxl not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            xlsx_path = tmp_path / "big.xlsx"
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Data"
+            ws.append(["Id", "Name"])
+            for row in range(1, 2501):
+                ws.append([row, f"name-{row}"])
+            wb.create_sheet("Empty")
+            wb.save(xlsx_path)
+
+            output_md = tmp_path / "big.md"
+            with mock.patch.object(document_io, "_XLSX_STREAM_BATCH_ROWS", 1000):
+                await document_io.convert_document_async(xlsx_path, output_path=output_md)
+            lines = output_md.read_text(encoding="utf-8").split("\n")
+            self.assertEqual(lines[:6], ["# big", "", "## Data", "", "| Id | Name |", "| --- | --- |"])
+            self.assertEqual(lines[6], "| 1 | name-1 |")
+            self.assertEqual(lines[6 + 2499], "| 2500 | name-2500 |")
+            self.assertEqual(lines[6 + 2500 :], ["", "## Empty", "", "(empty sheet)"])
+
     async def test_convert_xlsx_to_markdown(self) -> None:
         try:
             import openpyxl  # type: ignore
@@ -0,0 +1,109 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import document_io
+from dogent.features.document_tools import _split_budget, create_dogent_doc_tools
+
+
+class DocumentToolsTests(unittest.IsolatedAsyncioTestCase):
+    def test_split_budget_gives_unused_share_to_longer_files(self) -> None:
+        self.assertEqual(_split_budget([10, 500, 500], 300), [10, 145, 145])
+        self.assertEqual(_split_budget([10, 20], 300), [10, 20])
+        self.assertEqual(_split_budget([], 300), [])
+
+    async def test_read_documents_shares_budget_and_reports_per_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "short.md").write_text("tiny note", encoding="utf-8")
+            (root / "a.txt").write_text("a" * 500, encoding="utf-8")
+            (root / "b.txt").write_text("0123456789" * 50, encoding="utf-8")
+
+            tools = create_dogent_doc_tools(root)
+            read_many = next(tool for tool in tools if tool.name == "read_documents")
+            result = await read_many.handler(
+                {
+                    "files": [
+                        {"path": "short.md"},
+                        {"path": "a.txt"},
+                        {"path": "b.txt", "offset": 5},
+                        {"path": "missing.md"},
+                    ],
+                    "max_chars": 209,
+                }
+            )
+
+        self.assertNotIn("is_error", result)
+        text = result["content"][0]["text"]
+        self.assertTrue(text.startswith("Read 3 of 4 files (209 of 209 chars)."))
+        self.assertIn("===== [1/4] short.md =====", text)
+        self.assertIn("tiny note", text)
+        self.assertIn("a" * 100 + "\n", text)
+        self.assertIn("Continue with offset=105.", text)
+        self.assertIn("5678901234", text)
+        self.assertIn("===== [4/4] missing.md =====\nError: File does not exist.", text)
+
+    async def test_read_documents_errors_when_every_file_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tools = create_dogent_doc_tools(Path(tmp))
+            read_many = next(tool for tool in tools if tool.name == "read_documents")
+            result = await read_many.handler({"files": [{"path": "../outside.md"}]})
+
+        self.assertTrue(result["is_error"])
+        self.assertIn("Path must stay within the workspace.", result["content"][0]["text"])
+
+    async def test_export_documents_runs_jobs_concurrently(self) -> None:
+        active = 0
+        peak = 0
+
+        async def fake_pdf(md_path: Path, *, output_path: Path, **kwargs) -> list[str]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            output_path.write_bytes(b"%PDF")
+            return ["style fallback"] if md_path.name == "b.md" else []
+
+        def fake_docx(md_path: Path, *, output_path: Path, **kwargs) -> None:
+            raise RuntimeError("pandoc crashed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("a.md", "b.md"):
+                (root / name).write_text("# Title", encoding="utf-8")
+            tools = create_dogent_doc_tools(root)
+            export_many = next(tool for tool in tools if tool.name == "export_documents")
+            with (
+                mock.patch.object(document_io, "_markdown_to_pdf", side_effect=fake_pdf),
+                mock.patch.object(document_io, "_markdown_to_docx", side_effect=fake_docx),
+            ):
+                result = await export_many.handler(
+                    {
+                        "jobs": [
+                            {"md_path": "a.md", "output_path": "out/a.pdf", "format": "pdf"},
+                            {"md_path": "b.md", "output_path": "out/b.pdf", "format": "pdf"},
+                            {"md_path": "a.md", "output_path": "out/a.docx", "format": "docx"},
+                            {"md_path": "b.md", "output_path": "out/a.pdf", "format": "pdf"},
+                        ]
+                    }
+                )
+            self.assertTrue((root / "out" / "b.pdf").exists())
+
+        self.assertNotIn("is_error", result)
+        self.assertEqual(peak, 2)
+        lines = result["content"][0]["text"].splitlines()
+        self.assertTrue(lines[0].startswith("Exported 2 of 4 files in "))
+        self.assertRegex(lines[1], r"^\[1/4\] a\.md -> out/a\.pdf \(\d+\.\d+s\)$")
+        self.assertEqual(lines[3], "    Warning: style fallback")
+        self.assertIn("[3/4] a.md: Export failed", lines[4])
+        self.assertTrue(lines[4].endswith("pandoc crashed"))
+        self.assertEqual(
+            lines[5], "[4/4] b.md: Error: output_path is used by another job"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
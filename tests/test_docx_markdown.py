@@ -0,0 +1,199 @@
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import document_io
+from dogent.features.docx_markdown import DocxUnsupported, docx_to_markdown
+from dogent.features.document_io import read_document
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+STYLES = f"""<w:styles xmlns:w="{W_NS}">
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>
+<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/></w:style>
+</w:styles>"""
+
+NUMBERING = f"""<w:numbering xmlns:w="{W_NS}">
+<w:abstractNum w:abstractNumId="0">
+<w:lvl w:ilvl="0"><w:numFmt w:val="bullet"/></w:lvl>
+<w:lvl w:ilvl="1"><w:numFmt w:val="bullet"/></w:lvl>
+</w:abstractNum>
+<w:abstractNum w:abstractNumId="1"><w:lvl w:ilvl="0"><w:numFmt w:val="decimal"/></w:lvl></w:abstractNum>
+<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>
+<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>
+</w:numbering>"""
+
+RELS = f"""<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId5" Target="https://example.com/docs" TargetMode="External"/>
+<Relationship Id="rId6" Target="media/image1.png"/>
+</Relationships>"""
+
+DRAWING = (
+    '<w:drawing><wp:inline xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/'
+    'wordprocessingDrawing"><wp:docPr id="1" name="Picture" descr="Chart"/>'
+    '<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    "<a:graphicData><a:blip r:embed=\"rId6\"/></a:graphicData></a:graphic>"
+    "</wp:inline></w:drawing>"
+)
+
+
+def _p(runs: str, *, style: str | None = None, num: tuple[int, int] | None = None) -> str:
+    ppr = ""
+    if style:
+        ppr += f'<w:pStyle w:val="{style}"/>'
+    if num:
+        ppr += f'<w:numPr><w:ilvl w:val="{num[1]}"/><w:numId w:val="{num[0]}"/></w:numPr>'
+    return f"<w:p><w:pPr>{ppr}</w:pPr>{runs}</w:p>"
+
+
+def _r(text: str, rpr: str = "") -> str:
+    return f'<w:r><w:rPr>{rpr}</w:rPr><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _write_docx(
+    path: Path, body: str, *, rels: str = RELS, parts: dict[str, bytes] | None = None
+) -> None:
+    document = (
+        f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>{body}'
+        "<w:sectPr/></w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", document)
+        zf.writestr("word/styles.xml", STYLES)
+        zf.writestr("word/numbering.xml", NUMBERING)
+        zf.writestr("word/_rels/document.xml.rels", rels)
+        zf.writestr("word/media/image1.png", b"\x89PNG fake")
+        for name, data in (parts or {}).items():
+            zf.writestr(name, data)
+
+
+class DocxMarkdownTests(unittest.TestCase):
+    def test_converts_common_blocks(self) -> None:
+        body = "".join(
+            [
+                _p(_r("Overview"), style="Heading1"),
+                _p(_r("Plain ") + _r("bold", "<w:b/>") + _r(" and ") + _r("italic", "<w:i/>")),
+                _p(_r("2024. Not a list *really*")),
+                _p(_r("First"), num=(1, 0)),
+                _p(_r("Nested"), num=(1, 1)),
+                _p(_r("Step one"), num=(2, 0)),
+                _p(
+                    '<w:hyperlink r:id="rId5">' + _r("docs") + "</w:hyperlink>"
+                    + '<w:ins w:author="Ann" w:date="2024-01-02T00:00:00Z">'
+                    + _r(" added")
+                    + "</w:ins>"
+                    + '<w:del w:author="Bob" w:date="2024-01-03T00:00:00Z">'
+                    + '<w:r><w:delText> removed</w:delText></w:r></w:del>'
+                ),
+                "<w:tbl>"
+                "<w:tr><w:tc>" + _p(_r("Name")) + "</w:tc><w:tc>" + _p(_r("Value")) + "</w:tc></w:tr>"
+                "<w:tr><w:tc>" + _p(_r("a|b")) + "</w:tc><w:tc>" + _p(_r("1")) + "</w:tc></w:tr>"
+                "</w:tbl>",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "doc.docx"
+            _write_docx(path, body)
+            text = docx_to_markdown(path)
+
+        self.assertEqual(
+            text,
+            "# Overview\n\n"
+            "Plain **bold** and *italic*\n\n"
+            "2024\\. Not a list \\*really\\*\n\n"
+            "- First\n"
+            "    - Nested\n"
+            "1. Step one\n\n"
+            "[docs](https://example.com/docs)"
+            '[ added]{.insertion author="Ann" date="2024-01-02T00:00:00Z"}'
+            '[ removed]{.deletion author="Bob" date="2024-01-03T00:00:00Z"}\n\n'
+            "| Name | Value |\n"
+            "| --- | --- |\n"
+            "| a\\|b | 1 |\n",
+        )
+
+    def test_extracts_images_into_media_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "image.docx"
+            _write_docx(path, _p(f"<w:r>{DRAWING}</w:r>"))
+
+            self.assertEqual(docx_to_markdown(path), "![Chart](media/image1.png)\n")
+            media_dir = tmp_path / "assets"
+            text = docx_to_markdown(path, media_dir=media_dir)
+            image = media_dir / "media" / "image1.png"
+            self.assertEqual(text, f"![Chart]({image.as_posix()})\n")
+            self.assertEqual(image.read_bytes(), b"\x89PNG fake")
+
+    def test_same_named_media_parts_do_not_overwrite_each_other(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            path = tmp_path / "image.docx"
+            rels = RELS.replace(
+                "</Relationships>",
+                '<Relationship Id="rId7" Target="embeddings/image1.png"/></Relationships>',
+            )
+            other = DRAWING.replace("rId6", "rId7")
+            _write_docx(
+                path,
+                _p(f"<w:r>{DRAWING}</w:r>") + _p(f"<w:r>{other}</w:r>"),
+                rels=rels,
+                parts={"word/embeddings/image1.png": b"\x89PNG other"},
+            )
+
+            media_dir = tmp_path / "assets"
+            text = docx_to_markdown(path, media_dir=media_dir)
+            first = media_dir / "media" / "image1.png"
+            second = media_dir / "media" / "image1-2.png"
+            self.assertEqual(
+                text, f"![Chart]({first.as_posix()})\n\n![Chart]({second.as_posix()})\n"
+            )
+            self.assertEqual(first.read_bytes(), b"\x89PNG fake")
+            self.assertEqual(second.read_bytes(), b"\x89PNG other")
+
+    def test_unsupported_constructs_fall_back_to_pandoc(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "notes.docx"
+            _write_docx(
+                path,
+                _p(_r("Body") + '<w:r><w:footnoteReference w:id="1"/></w:r>'),
+            )
+            with self.assertRaises(DocxUnsupported):
+                docx_to_markdown(path)
+
+            with mock.patch(
+                "dogent.features.document_io._ensure_pandoc_available",
+                side_effect=RuntimeError("pandoc missing"),
+            ) as ensure:
+                result = read_document(path)
+            ensure.assert_called_once()
+            self.assertIn("pandoc missing", result.error or "")
+
+    def test_read_document_uses_native_reader_without_pandoc(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "plain.docx"
+            _write_docx(path, _p(_r("Title"), style="Heading2") + _p(_r("Hello docx")))
+            with mock.patch(
+                "dogent.features.document_io._ensure_pandoc_available"
+            ) as ensure:
+                result = read_document(path)
+                document_io._docx_to_markdown(
+                    path,
+                    output_path=Path(tmp) / "out.md",
+                    extract_media_dir=Path(tmp) / "images",
+                )
+            ensure.assert_not_called()
+            self.assertIsNone(result.error)
+            self.assertEqual(result.content, "## Title\n\nHello docx\n")
+            self.assertEqual(
+                (Path(tmp) / "out.md").read_text(encoding="utf-8"), result.content
+            )
+            self.assertTrue((Path(tmp) / "images").is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import document_io, export_images
+from dogent.features.document_cache import ArtifactCache
+from dogent.features.export_images import prepare_export_image
+
+try:
+    import fitz
+except Exception:  # noqa: BLE001
+    fitz = None
+
+
+def _png(path: Path, width: int, height: int, *, noisy: bool, dpi: int = 96) -> None:
+    samples = os.urandom(width * height * 3) if noisy else bytes(width * height * 3)
+    pix = fitz.Pixmap(fitz.csRGB, width, height, samples, 0)
+    pix.set_dpi(dpi, dpi)
+    path.write_bytes(pix.tobytes("png"))
+
+
+@unittest.skipIf(fitz is None, "PyMuPDF not installed")
+class ExportImagesTests(unittest.TestCase):
+    def test_large_photo_is_downscaled_to_jpeg_and_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            photo = root / "photo.png"
+            _png(photo, 1600, 400, noisy=True)
+            cache_dir = root / "cache"
+            cache = ArtifactCache(cache_dir)
+
+            prepared = prepare_export_image(photo, cache=cache, dpi=100, quality=80)
+            self.assertEqual(prepared.parent, cache_dir)
+            self.assertEqual(prepared.suffix, ".jpg")
+            pix = fitz.Pixmap(str(prepared))
+            self.assertEqual((pix.width, pix.height), (685, 171))
+            self.assertLess(prepared.stat().st_size, photo.stat().st_size)
+
+            with mock.patch.object(export_images, "_derive_image", side_effect=AssertionError):
+                again = prepare_export_image(photo, cache=cache, dpi=100, quality=80)
+            self.assertEqual(again, prepared)
+
+    def test_reencoded_image_that_fits_keeps_its_physical_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            photo = root / "photo.png"
+            _png(photo, 400, 300, noisy=True, dpi=72)
+
+            prepared = prepare_export_image(photo, cache=ArtifactCache(root / "cache"), dpi=150, quality=85)
+            self.assertEqual(prepared.suffix, ".jpg")
+            pix = fitz.Pixmap(str(prepared))
+            self.assertEqual((pix.width, pix.height), (400, 300))
+            self.assertEqual((pix.xres, pix.yres), (72, 72))
+
+    def test_downscaled_image_is_tagged_with_target_dpi(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            photo = root / "photo.png"
+            _png(photo, 1600, 400, noisy=True, dpi=72)
+
+            prepared = prepare_export_image(photo, cache=ArtifactCache(root / "cache"), dpi=150, quality=85)
+            pix = fitz.Pixmap(str(prepared))
+            self.assertEqual(pix.width, round(6.85 * 150))
+            self.assertEqual((pix.xres, pix.yres), (150, 150))
+
+    def test_small_or_disabled_images_keep_original(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            diagram = root / "diagram.png"
+            _png(diagram, 300, 200, noisy=False)
+            cache_dir = root / "cache"
+            cache = ArtifactCache(cache_dir)
+
+            self.assertEqual(
+                prepare_export_image(diagram, cache=cache, dpi=150, quality=85),
+                diagram,
+            )
+            self.assertTrue(list(cache_dir.glob("*.skip")))
+            self.assertEqual(
+                prepare_export_image(diagram, cache=cache, dpi=0, quality=85),
+                diagram,
+            )
+
+    def test_image_cache_evicts_least_recently_used_images_past_the_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            photos = []
+            for index in range(3):
+                photo = root / f"photo{index}.png"
+                _png(photo, 1600, 400, noisy=True)
+                photos.append(photo)
+            probe = prepare_export_image(
+                photos[0], cache=ArtifactCache(root / "probe"), dpi=100, quality=80
+            )
+            # Room for two derived photos but not three.
+            cache = ArtifactCache(root / "cache", max_bytes=probe.stat().st_size * 5 // 2)
+
+            prepared = []
+            for stamp, photo in enumerate(photos, start=1):
+                prepared.append(prepare_export_image(photo, cache=cache, dpi=100, quality=80))
+                os.utime(prepared[-1], (stamp, stamp))
+            self.assertFalse(prepared[0].exists())
+            self.assertTrue(prepared[1].exists() and prepared[2].exists())
+            self.assertEqual(
+                sorted(root.joinpath("cache").iterdir()), sorted(prepared[1:])
+            )
+
+    def test_docx_markdown_targets_point_at_prepared_images(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "docs").mkdir()
+            (root / "img").mkdir()
+            (root / "docs" / "a.png").write_bytes(b"a")
+            (root / "img" / "b c.png").write_bytes(b"b")
+            prepared = root / "cache dir" / "x.jpg"
+
+            def prepare(path: Path) -> Path:
+                return prepared if path.name == "b c.png" else path
+
+            text = document_io._prepare_markdown_images(
+                "![a](a.png) ![b](<img/b c.png>){width=50%} ![c](https://x/y.png)",
+                root / "docs",
+                root,
+                prepare,
+            )
+            self.assertEqual(
+                text,
+                f"![a](a.png) ![b](<{prepared.as_posix()}>){{width=50%}} "
+                "![c](https://x/y.png)",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
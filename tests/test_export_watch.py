@@ -0,0 +1,155 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rich.console import Console
+
+from dogent.cli import DogentCLI
+from dogent.features import export_watch
+from dogent.features.document_io import ExportJob, ExportJobResult
+from dogent.features.export_watch import ExportWatcher
+
+
+def _touch(path: Path, text: str, stamp: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+
+
+class ExportWatcherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        home = self.root / "home"
+        home.mkdir()
+        patcher = mock.patch.object(Path, "home", return_value=home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        (self.root / "img.png").write_bytes(b"png")
+        (self.root / "a.md").write_text("# A\n\n![x](img.png)\n", encoding="utf-8")
+        (self.root / "b.md").write_text("# B\n", encoding="utf-8")
+        self.pdf_a = ExportJob(self.root / "a.md", self.root / "a.pdf", "pdf")
+        self.docx_b = ExportJob(self.root / "b.md", self.root / "b.docx", "docx")
+        self.exported: list[list[str]] = []
+        self.forced: list[bool] = []
+
+        async def fake_batch(jobs, **kwargs):
+            self.exported.append([job.output_path.name for job in jobs])
+            self.forced.append(kwargs.get("force", False))
+            return [ExportJobResult(job, 0.0, []) for job in jobs]
+
+        patcher = mock.patch.object(export_watch, "export_markdown_batch_async", fake_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.watcher = ExportWatcher(
+            [self.pdf_a, self.docx_b], workspace_root=self.root, interval=0.01, debounce=0.05
+        )
+
+    async def _run_until(self, count: int) -> None:
+        task = asyncio.create_task(self.watcher.run())
+        try:
+            for _ in range(200):
+                if len(self.exported) >= count:
+                    return
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+    async def test_exports_once_then_only_jobs_affected_by_a_change(self) -> None:
+        await self._run_until(1)
+        self.assertEqual(self.exported, [["a.pdf", "b.docx"]])
+
+        os.utime(self.root / "img.png", ns=(1, 1))
+        await self._run_until(2)
+        self.assertEqual(self.exported[1], ["a.pdf"])
+
+        (self.root / ".dogent").mkdir()
+        _touch(self.root / ".dogent" / "pdf_style.css", "body {}", 2)
+        await self._run_until(3)
+        self.assertEqual(self.exported[2], ["a.pdf"])
+
+    async def test_burst_of_saves_is_debounced_into_one_export(self) -> None:
+        await self._run_until(1)
+        task = asyncio.create_task(self.watcher.run())
+        try:
+            for stamp in range(1, 4):
+                _touch(self.root / "b.md", f"# B{stamp}\n", stamp)
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.2)
+        finally:
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assertEqual(self.exported[1:], [["b.docx"]])
+
+    async def test_new_image_reference_is_tracked_after_export(self) -> None:
+        self.watcher.poll()
+        (self.root / "new.png").write_bytes(b"new")
+        _touch(self.root / "b.md", "# B\n\n![n](new.png)\n", 5)
+        self.assertEqual(self.watcher.poll(), [self.docx_b])
+        await self.watcher.export([self.docx_b])
+
+        os.utime(self.root / "new.png", ns=(6, 6))
+        self.assertEqual(self.watcher.poll(), [self.docx_b])
+        self.assertEqual(self.watcher.remove(self.root / "b.md"), [self.docx_b])
+        self.assertEqual(self.watcher.jobs, [self.pdf_a])
+        watched = {path.name for path in self.watcher._stats}
+        self.assertIn("img.png", watched)
+        self.assertFalse(watched & {"b.md", "new.png"})
+
+    async def test_force_applies_to_the_first_export_only(self) -> None:
+        self.watcher.force = True
+        await self._run_until(1)
+        os.utime(self.root / "b.md", ns=(7, 7))
+        await self._run_until(2)
+        self.assertEqual(self.forced, [True, False])
+
+
+class WatchCommandTests(unittest.IsolatedAsyncioTestCase):
+    async def test_watch_adds_and_stops_exports(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_home, tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "report.md").write_text("# Report", encoding="utf-8")
+            console = Console(record=True, force_terminal=False, color_system=None)
+            with mock.patch.dict(os.environ, {"HOME": tmp_home}):
+                cli = DogentCLI(root=root, console=console, interactive_prompts=False)
+                with mock.patch.object(ExportWatcher, "run", return_value=None) as run:
+                    await cli._cmd_watch("/watch report.md pdf docx")
+                    await cli._cmd_watch("/watch missing.md")
+                    watcher = cli._export_watcher
+                    self.assertEqual(
+                        [job.output_path.name for job in watcher.jobs],
+                        ["report.pdf", "report.docx"],
+                    )
+                    await cli._cmd_watch("/watch stop")
+                run.assert_called_once()
+            self.assertIsNone(cli._export_watcher)
+            output = console.export_text()
+            self.assertIn("report.md -> report.docx", output)
+            self.assertIn("Not a Markdown file: missing.md", output)
+            self.assertIn("Stopped watching", output)
+
+    async def test_watch_task_failure_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_home, tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "report.md").write_text("# Report", encoding="utf-8")
+            console = Console(record=True, force_terminal=False, color_system=None)
+            with mock.patch.dict(os.environ, {"HOME": tmp_home}):
+                cli = DogentCLI(root=root, console=console, interactive_prompts=False)
+                with mock.patch.object(ExportWatcher, "run", side_effect=RuntimeError("boom")):
+                    await cli._cmd_watch("/watch report.md")
+                    task = cli._export_watch_task
+                    with self.assertRaises(RuntimeError):
+                        await task
+                    await asyncio.sleep(0)
+            self.assertIsNone(cli._export_watcher)
+            self.assertIn("Watch stopped after an error: boom", console.export_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
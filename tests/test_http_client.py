@@ -0,0 +1,163 @@
+import asyncio
+import gzip
+import unittest
+import zlib
+from unittest import mock
+from urllib.parse import urlsplit
+
+from dogent.features import http_client
+from dogent.features.http_client import AsyncHttpClient
+
+
+class _Server:
+    """Tiny HTTP/1.1 server; routes map a path to (status, headers, body)."""
+
+    def __init__(self, routes: dict) -> None:
+        self.routes = routes
+        self.connections = 0
+        self.requests: list[dict[str, str]] = []
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                path = lines[0].split(" ")[1]
+                headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+                self.requests.append({"path": path, **headers})
+                route = self.routes[path]
+                if route == "hang":
+                    await asyncio.sleep(10)
+                status, extra, body = route
+                writer.write(f"HTTP/1.1 {status} X\r\n".encode())
+                for name, value in extra.items():
+                    writer.write(f"{name}: {value}\r\n".encode())
+                if "Transfer-Encoding" in extra:
+                    writer.write(b"\r\n")
+                    for start in range(0, len(body), 4):
+                        piece = body[start : start + 4]
+                        writer.write(f"{len(piece):x}\r\n".encode() + piece + b"\r\n")
+                    writer.write(b"0\r\n\r\n")
+                else:
+                    writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+                if extra.get("Connection") == "close" or "X-Drop" in extra:
+                    return
+        finally:
+            writer.close()
+
+
+class AsyncHttpClientTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        patcher = mock.patch.object(http_client, "getproxies", return_value={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        page = b"<html><title>T</title>hello</html>"
+        self.server = _Server(
+            {
+                "/plain": (200, {"Content-Type": "text/html"}, page),
+                "/gzip": (200, {"Content-Encoding": "gzip"}, gzip.compress(page)),
+                "/deflate": (200, {"Content-Encoding": "deflate"}, zlib.compress(page)),
+                "/chunked": (200, {"Transfer-Encoding": "chunked"}, page),
+                "/moved": (302, {"Location": "/plain"}, b""),
+                "/close": (200, {"Connection": "close"}, b"bye"),
+                "/drop": (200, {"X-Drop": "1"}, b"dropped"),
+                "/hang": "hang",
+                "/caf%C3%A9?q=%C3%A9t%C3%A9": (200, {}, b"accented"),
+            }
+        )
+        self.base = await self.server.start()
+        self.client = AsyncHttpClient()
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.stop()
+
+    async def _get(self, path: str, timeout_s: float = 5):
+        return await self.client.get(
+            self.base + path, headers={"User-Agent": "dogent/test"}, timeout_s=timeout_s
+        )
+
+    async def test_sequential_requests_reuse_one_connection(self) -> None:
+        bodies = [(await self._get(path)).body for path in ("/plain", "/chunked", "/plain")]
+        self.assertEqual(len(set(bodies)), 1)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.client.connections_opened, 1)
+        request = self.server.requests[0]
+        self.assertIn("gzip", request["Accept-Encoding"])
+        self.assertEqual(request["User-Agent"], "dogent/test")
+
+    async def test_compressed_bodies_are_decoded(self) -> None:
+        for path in ("/gzip", "/deflate"):
+            response = await self._get(path)
+            self.assertEqual(response.body, b"<html><title>T</title>hello</html>")
+            self.assertNotIn("Content-Encoding", response.headers)
+
+    async def test_follows_redirects_and_reports_final_url(self) -> None:
+        response = await self._get("/moved")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.url, self.base + "/plain")
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_connection_close_and_stale_connections_reconnect(self) -> None:
+        await self._get("/close")
+        await self._get("/plain")
+        self.assertEqual(self.server.connections, 2)
+
+        # The server silently drops a keep-alive connection; reusing it fails
+        # before any response bytes arrive, so the request retries on a new one.
+        await self._get("/drop")
+        pooled = next(iter(self.client._idle.values()))[0]
+        await asyncio.sleep(0.05)
+        with mock.patch.object(pooled, "reusable", return_value=True):
+            response = await self._get("/plain")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(self.server.connections, 3)
+
+    async def test_timeout_bounds_the_request(self) -> None:
+        with self.assertRaises(asyncio.TimeoutError):
+            await self._get("/hang", timeout_s=0.2)
+        self.assertEqual(self.client._idle, {})
+
+    async def test_non_ascii_path_and_query_are_percent_encoded(self) -> None:
+        response = await self._get("/café?q=été")
+        self.assertEqual(response.body, b"accented")
+        self.assertEqual(self.server.requests[0]["path"], "/caf%C3%A9?q=%C3%A9t%C3%A9")
+
+    async def test_idn_host_is_idna_encoded_for_connection_and_host_header(self) -> None:
+        request = http_client._build_request(urlsplit("https://例え.jp:8443/a%20b"), {})
+        self.assertTrue(request.startswith(b"GET /a%20b HTTP/1.1\r\nHost: xn--r8jz45g.jp:8443\r\n"))
+
+        with mock.patch.object(
+            http_client.asyncio, "open_connection", side_effect=ConnectionRefusedError
+        ) as open_connection:
+            with self.assertRaises(ConnectionRefusedError):
+                await self.client.get("https://例え.jp/", headers={}, timeout_s=1)
+        args, kwargs = open_connection.call_args
+        self.assertEqual(args[:2], ("xn--r8jz45g.jp", 443))
+        self.assertEqual(kwargs["server_hostname"], "xn--r8jz45g.jp")
+
+    async def test_shared_client_is_per_event_loop(self) -> None:
+        with mock.patch.object(http_client, "_CLIENT", None):
+            first = http_client.http_client()
+            self.assertIs(http_client.http_client(), first)
+            with mock.patch.object(first, "loop", object()):
+                self.assertIsNot(http_client.http_client(), first)
+            await http_client.close_http_client()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from dogent import launcher
+from dogent.features import document_io
+
+
+class LauncherJobTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        for name in ("a.docx", "b.docx", "notes.md"):
+            (self.root / name).write_bytes(b"x")
+
+    def test_single_convert_keeps_output_path(self) -> None:
+        source = str(self.root / "a.docx")
+        self.assertEqual(
+            launcher._convert_jobs([source], str(self.root / "a.pdf"), None),
+            [(Path(source), self.root / "a.pdf")],
+        )
+
+    def test_glob_convert_writes_into_directory(self) -> None:
+        jobs = launcher._convert_jobs([str(self.root / "*.docx")], str(self.root / "out"), "md")
+        self.assertEqual(
+            [(src.name, str(dst.relative_to(self.root))) for src, dst in jobs],
+            [("a.docx", "out/a.md"), ("b.docx", "out/b.md")],
+        )
+        with self.assertRaisesRegex(ValueError, "--to is required"):
+            launcher._convert_jobs([str(self.root / "*.docx")], str(self.root / "out"), None)
+        with self.assertRaisesRegex(ValueError, "No files match"):
+            launcher._convert_jobs([str(self.root / "*.xlsx")], str(self.root), "md")
+
+    def test_export_defaults_to_source_name_and_rejects_clashes(self) -> None:
+        md = self.root / "notes.md"
+        self.assertEqual(
+            launcher._export_jobs([str(md)], None, "pdf"), [(md, self.root / "notes.pdf")]
+        )
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "notes.md").write_text("# Notes", encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "would both write"):
+            launcher._export_jobs(
+                [str(md), str(self.root / "sub" / "notes.md")], str(self.root / "out"), "pdf"
+            )
+
+    def test_documents_config_merges_global_defaults_and_workspace(self) -> None:
+        home = self.root / "home"
+        (home / ".dogent").mkdir(parents=True)
+        (home / ".dogent" / "dogent.json").write_text(
+            json.dumps(
+                {
+                    "workspace_defaults": {
+                        "documents": {"pdf_workers": 2, "image_dpi": 96, "extra": {"a": 1}}
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+        (self.root / ".dogent").mkdir()
+        (self.root / ".dogent" / "dogent.json").write_text(
+            json.dumps({"documents": {"image_dpi": 300, "extra": {"b": 2}}}), encoding="utf-8"
+        )
+        with mock.patch.object(Path, "home", return_value=home):
+            config = launcher._load_config(self.root)
+        self.assertEqual(
+            config,
+            {"documents": {"pdf_workers": 2, "image_dpi": 300, "extra": {"a": 1, "b": 2}}},
+        )
+
+
+class LauncherRunTests(unittest.TestCase):
+    def test_convert_reports_each_result_and_failure(self) -> None:
+        def fake_docx_to_markdown(input_path, *, output_path, extract_media_dir, settings):
+            if input_path.name == "bad.docx":
+                raise RuntimeError("corrupt document")
+            output_path.write_text(f"# {input_path.stem}", encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "good.docx").write_bytes(b"good")
+            (root / "bad.docx").write_bytes(b"bad")
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with (
+                mock.patch.object(document_io, "_docx_to_markdown", fake_docx_to_markdown),
+                mock.patch.object(Path, "cwd", return_value=root),
+                redirect_stdout(stdout),
+                redirect_stderr(stderr),
+            ):
+                code = launcher.run_subcommand(
+                    ["convert", str(root / "*.docx"), str(root / "out"), "--to", "md"]
+                )
+            self.assertEqual(code, 1)
+            self.assertEqual((root / "out" / "good.md").read_text(encoding="utf-8"), "# good")
+            self.assertFalse((root / "out" / "bad.md").exists())
+        self.assertIn("good.docx -> ", stdout.getvalue())
+        self.assertIn("bad.docx: corrupt document", stderr.getvalue())
+
+    def test_batch_subcommand_does_not_import_interactive_cli(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = (
+                "import sys\n"
+                "from dogent import launcher\n"
+                "code = launcher.run_subcommand(['convert', 'missing.md', 'missing.docx'])\n"
+                "print(code, sorted(m for m in ('dogent.cli', 'claude_agent_sdk') if m in sys.modules))\n"
+            )
+            env = dict(os.environ, HOME=tmp)
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=tmp,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "1 []")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from dogent.features import document_io
+from dogent.features.pandoc_backend import (
+    PandocServer,
+    PandocServerError,
+    PandocServerUnavailable,
+)
+
+# Stands in for `pandoc server`: echoes the request back, base64 for docx output.
+_FAKE_PANDOC = """\
+#!{python}
+import base64, json, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+port = int(next(arg for arg in sys.argv if arg.startswith("--port=")).split("=")[1])
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if request["from"] == "broken":
+            body = b"Unknown input format broken"
+        elif request["to"] == "docx":
+            data = json.dumps(request).encode()
+            body = json.dumps({{"output": base64.b64encode(data).decode(), "base64": True}}).encode()
+        else:
+            body = json.dumps({{"output": request["text"].upper(), "base64": False}}).encode()
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+@unittest.skipIf(os.name == "nt", "fake pandoc uses a shebang script")
+class PandocServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.executable = Path(self.tmp.name) / "pandoc"
+        self.executable.write_text(
+            _FAKE_PANDOC.format(python=sys.executable), encoding="utf-8"
+        )
+        self.executable.chmod(self.executable.stat().st_mode | stat.S_IEXEC)
+
+    def test_converts_text_and_binary_and_restarts_after_crash(self) -> None:
+        server = PandocServer(str(self.executable))
+        self.addCleanup(server.close)
+
+        self.assertEqual(server.convert("hi", from_format="markdown", to="html"), "HI")
+        output = server.convert(
+            b"\x00docx",
+            from_format="docx",
+            to="docx",
+            options={"track-changes": "all"},
+            files={"/img/a.png": b"png"},
+        )
+        echoed = json.loads(output)
+        self.assertEqual(echoed["text"], "AGRvY3g=")
+        self.assertEqual(echoed["track-changes"], "all")
+        self.assertEqual(echoed["files"], {"/img/a.png": "cG5n"})
+
+        server._process.kill()
+        server._process.wait()
+        self.assertEqual(server.convert("again", from_format="markdown", to="html"), "AGAIN")
+
+        with self.assertRaisesRegex(PandocServerError, "Unknown input format"):
+            server.convert("x", from_format="broken", to="html")
+
+    def test_missing_executable_is_unavailable(self) -> None:
+        server = PandocServer(str(Path(self.tmp.name) / "missing"))
+        with self.assertRaises(PandocServerUnavailable):
+            server.convert("x", from_format="markdown", to="html")
+
+
+class PandocBackendSelectionTests(unittest.TestCase):
+    def test_markdown_to_docx_sends_images_to_server(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "docs").mkdir()
+            (root / "images").mkdir()
+            (root / "images" / "1.png").write_bytes(b"png")
+            md_path = root / "docs" / "note.md"
+            md_path.write_text("![x](images/1.png) ![y](https://e/y.png)", encoding="utf-8")
+            output_path = root / "note.docx"
+            server = mock.Mock()
+            server.convert.return_value = b"DOCX"
+            fake_pandoc = SimpleNamespace(convert_file=mock.Mock())
+            settings = document_io.DocumentSettings(pandoc_backend="server", image_dpi=0)
+            with (
+                mock.patch.dict(sys.modules, {"pypandoc": fake_pandoc}),
+                mock.patch.object(document_io, "_ensure_pandoc_available"),
+                mock.patch.object(document_io, "pandoc_server", return_value=server),
+            ):
+                document_io._markdown_to_docx(
+                    md_path, output_path=output_path, workspace_root=root, settings=settings
+                )
+            self.assertEqual(output_path.read_bytes(), b"DOCX")
+            fake_pandoc.convert_file.assert_not_called()
+            args, kwargs = server.convert.call_args
+            image = (root / "images" / "1.png").resolve().as_posix()
+            self.assertEqual(args[0], f"![x]({image}) ![y](https://e/y.png)")
+            self.assertEqual(kwargs["files"], {image: b"png"})
+            self.assertEqual(kwargs["to"], "docx")
+
+    def test_unavailable_server_falls_back_to_subprocess(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            md_path = Path(tmp) / "note.md"
+            md_path.write_text("text", encoding="utf-8")
+            server = mock.Mock()
+            server.convert.side_effect = PandocServerUnavailable("no server")
+            fake_pandoc = SimpleNamespace(convert_file=mock.Mock())
+            settings = document_io.load_document_settings(
+                {"documents": {"pandoc_backend": "server"}}
+            )
+            with (
+                mock.patch.dict(sys.modules, {"pypandoc": fake_pandoc}),
+                mock.patch.object(document_io, "_ensure_pandoc_available"),
+                mock.patch.object(document_io, "pandoc_server", return_value=server),
+                mock.patch.object(document_io, "mark_pandoc_server_unavailable") as mark,
+            ):
+                document_io._markdown_to_docx(
+                    md_path, output_path=Path(tmp) / "note.docx", settings=settings
+                )
+            mark.assert_called_once()
+            fake_pandoc.convert_file.assert_called_once()
+
+    def test_unknown_backend_setting_uses_subprocess(self) -> None:
+        settings = document_io.load_document_settings(
+            {"documents": {"pandoc_backend": "grpc"}}
+        )
+        self.assertEqual(settings.pandoc_backend, "subprocess")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dogent.features import document_io
+from dogent.features.pdf_optimize import PdfOptimizeResult, optimize_pdf
+
+try:
+    import fitz
+except Exception:  # noqa: BLE001
+    fitz = None
+
+
+def _bloated_pdf(path: Path, pages: int = 3) -> None:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 200), False)
+    pix.clear_with(200)
+    image = pix.tobytes("png")
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number + 1} " * 20)
+        # Inserted separately on every page, so each page carries its own copy.
+        page.insert_image(fitz.Rect(72, 100, 272, 300), stream=image)
+    doc.save(str(path), garbage=0, deflate=False)
+    doc.close()
+
+
+@unittest.skipIf(fitz is None, "PyMuPDF not installed")
+class PdfOptimizeTests(unittest.TestCase):
+    def test_rewrites_smaller_pdf_in_place(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.pdf"
+            _bloated_pdf(path)
+            before = path.stat().st_size
+
+            result = optimize_pdf(path)
+
+            self.assertIsNotNone(result)
+            self.assertEqual(result.before_bytes, before)
+            self.assertEqual(result.after_bytes, path.stat().st_size)
+            self.assertLess(result.after_bytes, before)
+            self.assertIn("PDF optimized:", result.describe())
+            with fitz.open(path) as doc:
+                self.assertEqual(doc.page_count, 3)
+                self.assertIn("Page 3", doc[2].get_text())
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["report.pdf"])
+
+    def test_unreadable_file_is_left_alone(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "broken.pdf"
+            path.write_bytes(b"not a pdf")
+            self.assertIsNone(optimize_pdf(path))
+            self.assertEqual(path.read_bytes(), b"not a pdf")
+
+    def test_describe_reports_sizes(self) -> None:
+        self.assertEqual(
+            PdfOptimizeResult(4 * 1024 * 1024, 1024 * 1024).describe(),
+            "PDF optimized: 4.0 MB -> 1.0 MB (75% smaller).",
+        )
+        self.assertEqual(
+            PdfOptimizeResult(2048, 4096).describe(),
+            "PDF optimization skipped: already compact (2 KB).",
+        )
+
+
+@unittest.skipIf(fitz is None, "PyMuPDF not installed")
+class PdfExportOptimizeTests(unittest.IsolatedAsyncioTestCase):
+    async def test_markdown_to_pdf_reports_optimized_size(self) -> None:
+        async def fake_html_to_pdf(html, *, output_path, **kwargs):
+            _bloated_pdf(output_path)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            md_path = Path(tmp) / "note.md"
+            md_path.write_text("# Note", encoding="utf-8")
+            output_path = Path(tmp) / "note.pdf"
+            with (
+                mock.patch.object(document_io, "_html_to_pdf", side_effect=fake_html_to_pdf),
+                mock.patch.object(
+                    document_io, "_resolve_pdf_style", return_value=("body {}", [])
+                ),
+            ):
+                enabled = await document_io._markdown_to_pdf(
+                    md_path,
+                    output_path=output_path,
+                    title="Note",
+                    settings=document_io.load_document_settings(
+                        {"documents": {"pdf_optimize": True}}
+                    ),
+                )
+                disabled = await document_io._markdown_to_pdf(
+                    md_path, output_path=output_path, title="Note"
+                )
+        self.assertEqual(len(enabled), 1)
+        self.assertTrue(enabled[0].startswith("PDF optimized:"))
+        self.assertEqual(disabled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,10 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from dogent import __version__
+from dogent.features import web_tools
 from dogent.features.web_tools import (
     HttpResponse,
     create_dogent_web_tools,
@@ -196,6 +198,44 @@ class WebToolsTests(unittest.IsolatedAsyncioTestCase):
             self.assertTrue(images_dir.exists())
             self.assertEqual(len(list(images_dir.iterdir())), 1)
 
+    async def test_web_fetch_uses_pooled_async_client_by_default(self) -> None:
+        calls = []
+
+        class FakeClient:
+            async def get(self, url, *, headers, timeout_s, connect_timeout_s):
+                calls.append((url, timeout_s, connect_timeout_s))
+                return HttpResponse(
+                    url=url, status=200, headers={"Content-Type": "text/plain"}, body=b"ok"
+                )
+
+        tools = create_dogent_web_tools(
+            root=Path("."),
+            web_profile_name="default",
+            web_profile_cfg={"provider": "google_cse", "timeout_s": 3, "connect_timeout_s": 2},
+        )
+        web_fetch = next(tool for tool in tools if tool.name == "web_fetch")
+        with mock.patch.object(web_tools, "http_client", return_value=FakeClient()):
+            for _ in range(2):
+                result = await web_fetch.handler({"url": "https://example.com/a"})
+        self.assertIn("ok", result["content"][0]["text"])
+        self.assertEqual(calls, [("https://example.com/a", 3.0, 2.0)] * 2)
+
+    async def test_web_fetch_accepts_async_http_get(self) -> None:
+        async def fake_get(url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
+            return HttpResponse(
+                url=url, status=200, headers={"Content-Type": "text/plain"}, body=b"async body"
+            )
+
+        tools = create_dogent_web_tools(
+            root=Path("."),
+            web_profile_name="default",
+            web_profile_cfg={"provider": "google_cse"},
+            http_get=fake_get,
+        )
+        web_fetch = next(tool for tool in tools if tool.name == "web_fetch")
+        result = await web_fetch.handler({"url": "https://example.com/a"})
+        self.assertIn("async body", result["content"][0]["text"])
+
 
 if __name__ == "__main__":
     unittest.main()